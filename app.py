@@ -4,11 +4,13 @@ Tmax Monitoring Dashboard Backend
 Flask 웹 서버를 통한 Tmax 설정 모니터링 API
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 from flask_cors import CORS
 import os
 import json
 from tpconfig_parser import TpConfigParser
+from tpconfig.core import use_mmap_for
+from tpconfig.payload import build_payload
 from datetime import datetime
 
 app = Flask(__name__)
@@ -17,21 +19,36 @@ CORS(app)
 # 설정 파일 경로
 CONFIG_FILE = 'tp_config_20260126'
 
+# 이 크기(MB) 이상이면 mmap 리더로 파싱 (FastAPI 백엔드와 같은 설정, 0이면 사용 안 함)
+CONFIG_MMAP_THRESHOLD_MB = int(os.getenv('CONFIG_MMAP_THRESHOLD_MB', '0'))
+
 # 파서 인스턴스 (캐시)
 parser = None
 config_data = None
 last_update = None
 
+# /api/config/full 응답 본문 (로드할 때 한 번 직렬화/압축해 두고 요청 시 그대로 전송)
+full_config_payload = None
+
 
 def get_parser():
     """파서 인스턴스 가져오기 (캐시 포함)"""
-    global parser, config_data, last_update
+    global parser, config_data, last_update, full_config_payload
     
     if parser is None or config_data is None:
         print(f"Loading config file: {CONFIG_FILE}")
-        parser = TpConfigParser(CONFIG_FILE)
+        parser = TpConfigParser(
+            CONFIG_FILE,
+            use_mmap=use_mmap_for(CONFIG_FILE, CONFIG_MMAP_THRESHOLD_MB)
+        )
         config_data = parser.parse()
         last_update = datetime.now()
+        # jsonify와 같은 키 정렬로 직렬화
+        full_config_payload = build_payload({
+            'success': True,
+            'data': config_data,
+            'last_update': last_update.isoformat()
+        }, sort_keys=True)
         print(f"Config loaded successfully at {last_update}")
     
     return parser
@@ -64,15 +81,16 @@ def get_config():
 
 @app.route('/api/config/full')
 def get_full_config():
-    """전체 설정 데이터 API (대용량)"""
+    """전체 설정 데이터 API (대용량, 미리 직렬화/압축해 둔 본문 중 Accept-Encoding에 맞는 것을 전송)"""
     try:
-        p = get_parser()
+        get_parser()
+        encoding, body = full_config_payload.select(request.headers.get('Accept-Encoding'))
         
-        return jsonify({
-            'success': True,
-            'data': config_data,
-            'last_update': last_update.isoformat() if last_update else None
-        })
+        response = Response(body, mimetype='application/json')
+        response.headers['Vary'] = 'Accept-Encoding'
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        return response
     except Exception as e:
         return jsonify({
             'success': False,
@@ -0,0 +1,161 @@
+"""
+config 데이터 일괄 적재
+행을 ORM 객체 대신 튜플로 모아서 테이블별로 한 번에 넣는다.
+PostgreSQL(psycopg2/psycopg)이면 COPY FROM STDIN, 그 외에는 insert() executemany 배치
+"""
+
+import hashlib
+import io
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+from models import Domain, Node, SvrGroup, Server, Service, Gateway
+from reload_jobs import NO_PROGRESS, ReloadProgress
+
+# 한 번에 보내는 행 수 (COPY 버퍼 / executemany 배치 크기)
+CONFIG_LOAD_BATCH_SIZE = int(os.getenv("CONFIG_LOAD_BATCH_SIZE", "5000"))
+
+# 적재 방식: auto (PostgreSQL 드라이버면 copy, 아니면 insert), copy, insert
+CONFIG_LOAD_METHOD = os.getenv("CONFIG_LOAD_METHOD", "auto")
+
+# 값은 문자열, 정수(용량 컬럼) 또는 None
+Row = Tuple[Any, ...]
+
+# 적재 순서(FK 참조 순서)와 테이블별 컬럼 순서 - 행 튜플은 이 컬럼 순서를 따름
+LOAD_COLUMNS = {
+    Domain: (
+        "domain_id", "name", "shmkey", "tportno", "racport", "maxuser", "maxnode",
+        "maxsvg", "maxsvr", "maxsvc", "maxgw", "maxsession", "security", "loglvl",
+        "attributes", "maxuser_num", "maxnode_num", "maxsvg_num", "maxsvr_num",
+        "maxsvc_num", "maxgw_num", "maxsession_num"
+    ),
+    Node: (
+        "name", "hostname", "tmax_port", "max_svr", "max_user", "tmax_home",
+        "max_svr_num", "max_user_num"
+    ),
+    SvrGroup: ("name", "node_name", "backup", "cousin", "restart", "autobackup"),
+    Server: (
+        "name", "svg_name", "node_name", "min_proc", "max_proc", "restart",
+        "maxqcount", "asqcount", "clopt", "db_info", "min_proc_num", "max_proc_num",
+        "maxqcount_num", "asqcount_num"
+    ),
+    Service: ("name", "server_name", "timeout", "autotran", "export"),
+    Gateway: (
+        "name", "node_name", "port", "remote_addr", "remote_port", "direction",
+        "gw_type", "backup_addr", "backup_port", "backup_rgwaddr", "backup_rgwportno",
+        "cpc", "restart", "clopt"
+    ),
+}
+
+
+# 행 내용 해시 컬럼 (증분 리로드에서 바뀐 행만 찾는 데 사용)
+ROW_HASH_COLUMN = "row_hash"
+
+
+def row_hash(row: Row) -> str:
+    """행 튜플의 내용 해시 (NULL과 빈 문자열을 구분)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in row:
+        digest.update(b"\x00" if value is None else b"\x01" + str(value).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def load_method(db: Session) -> str:
+    """실제 사용할 적재 방식 (copy 또는 insert)"""
+    if CONFIG_LOAD_METHOD != "auto":
+        return CONFIG_LOAD_METHOD
+    return "copy" if db.get_bind().dialect.driver in ("psycopg2", "psycopg") else "insert"
+
+
+def _copy_value(value: Any) -> str:
+    """COPY text 포맷 값 (NULL은 \\N, 구분자/줄바꿈/역슬래시는 이스케이프)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, int):
+        return str(value)
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(db: Session, table_name: str, columns: Sequence[str], rows: List[Row], batch_size: int):
+    """COPY FROM STDIN으로 적재 (세션과 같은 트랜잭션, psycopg2/psycopg 모두 지원)"""
+    sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+    cursor = db.connection().connection.cursor()
+    try:
+        for start in range(0, len(rows), batch_size):
+            buffer = io.StringIO()
+            for row in rows[start:start + batch_size]:
+                buffer.write("\t".join([_copy_value(value) for value in row]))
+                buffer.write("\n")
+            if hasattr(cursor, "copy_expert"):
+                # psycopg2
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+            else:
+                # psycopg (3)
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def insert_rows(db: Session, table: Table, columns: Sequence[str], rows: List[Row], batch_size: int):
+    """insert() executemany 배치로 적재"""
+    statement = insert(table)
+    for start in range(0, len(rows), batch_size):
+        db.execute(statement, [dict(zip(columns, row)) for row in rows[start:start + batch_size]])
+
+
+def write_rows(db: Session, method: str, table: Table, columns: Sequence[str], rows: List[Row], batch_size: int):
+    """method(copy/insert)에 맞는 방식으로 행 적재"""
+    if method == "copy":
+        copy_rows(db, table.fullname, columns, rows, batch_size)
+    else:
+        insert_rows(db, table, columns, rows, batch_size)
+
+
+def bulk_load(
+    db: Session,
+    rows: Dict[Any, List[Row]],
+    tables: Optional[Dict[Any, Table]] = None,
+    batch_size: int = 0,
+    progress: ReloadProgress = NO_PROGRESS
+) -> Dict[str, Any]:
+    """
+    모델별 행 튜플을 LOAD_COLUMNS 순서대로 적재 (commit은 호출자가)
+    각 행에 row_hash를 붙여서 적재하고, tables를 주면 모델 대신 해당 Table(예: 스테이징 테이블)에 적재
+    테이블별 행 수와 소요 시간을 반환
+    """
+    batch_size = batch_size or CONFIG_LOAD_BATCH_SIZE
+    method = load_method(db)
+    
+    table_stats = {}
+    for model, columns in LOAD_COLUMNS.items():
+        table = tables[model] if tables else model.__table__
+        table_rows = rows.get(model, [])
+        start = time.perf_counter()
+        if table_rows:
+            write_rows(
+                db,
+                method,
+                table,
+                columns + (ROW_HASH_COLUMN,),
+                [row + (row_hash(row),) for row in table_rows],
+                batch_size
+            )
+            progress.add_rows_written(len(table_rows))
+        table_stats[model.__tablename__] = {
+            "rows": len(table_rows),
+            "seconds": round(time.perf_counter() - start, 3)
+        }
+    
+    return {"method": method, "batch_size": batch_size, "tables": table_stats}
@@ -0,0 +1,105 @@
+"""
+config 적재 세대 관리와 레플리카 간 시작 로드 조정
+적재할 때마다 config 파일 내용 해시를 config_generations 테이블에 기록하고,
+여러 레플리카가 동시에 시작하면 PostgreSQL advisory lock을 잡은 한 곳만 적재한다.
+나머지는 lock을 기다리다가 같은 내용 해시의 세대가 기록되면 적재를 건너뛴다.
+"""
+
+import hashlib
+import os
+import socket
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models import ConfigGeneration
+from parse_cache import SNAPSHOT_VERSION, CacheKey
+from bulk_load import LOAD_COLUMNS
+
+# 시작 로드를 한 레플리카만 하도록 하는 advisory lock 키 (shadow_tables.RELOAD_LOCK_KEY와 구분)
+STARTUP_LOCK_KEY = 7470002
+
+# lock을 기다리는 동안 다른 레플리카의 적재 완료를 확인하는 주기(초)
+CONFIG_LEADER_POLL_SECONDS = float(os.getenv("CONFIG_LEADER_POLL_SECONDS", "1"))
+
+
+def config_content_hash(cache_keys: List[CacheKey]) -> str:
+    """
+    적재할 내용의 해시 (파일명 + 파일 내용 sha256 + 파서 출력 버전 + 적재 컬럼 구성)
+    파일 내용 해시는 파싱 캐시 키에 이미 계산된 값을 사용 (파일을 다시 읽지 않음)
+    파서나 적재 컬럼이 바뀐 배포에서는 파일이 같아도 해시가 달라져서 다시 적재됨
+    """
+    digest = hashlib.sha256()
+    digest.update(f"snapshot:{SNAPSHOT_VERSION}\n".encode("utf-8"))
+    for model, columns in LOAD_COLUMNS.items():
+        digest.update(f"{model.__tablename__}:{','.join(columns)}\n".encode("utf-8"))
+    for key in cache_keys:
+        digest.update(f"{os.path.basename(key[0])}:{key[3]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def latest_generation(db: Session) -> Optional[ConfigGeneration]:
+    """가장 최근 세대 (없으면 None)"""
+    return db.query(ConfigGeneration).order_by(ConfigGeneration.id.desc()).first()
+
+
+def record_generation(db: Session, content_hash: str, files: int, mode: str) -> ConfigGeneration:
+    """새 세대 기록 (적재와 같은 트랜잭션, commit은 호출자가)"""
+    generation = ConfigGeneration(
+        content_hash=content_hash,
+        files=files,
+        mode=mode,
+        loaded_by=socket.gethostname()
+    )
+    db.add(generation)
+    db.flush()
+    return generation
+
+
+@contextmanager
+def startup_leader_lock(db: Session, content_hash: str):
+    """
+    시작 로드 조정 (PostgreSQL만, 그 외 DB는 바로 진입)
+    advisory lock을 잡거나, 기다리는 동안 다른 레플리카가 content_hash 세대를 기록하면 진입
+    진입 후에는 latest_generation으로 적재가 필요한지 다시 확인해야 함
+    lock은 적재 세션과 별도 연결에서 세션 단위로 잡고 블록을 나갈 때 해제
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        yield
+        return
+    
+    connection = db.get_bind().connect()
+    locked = False
+    try:
+        waiting = False
+        while True:
+            locked = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": STARTUP_LOCK_KEY}
+            ).scalar()
+            # 세션 단위 lock은 트랜잭션이 끝나도 유지됨 (적재 동안 idle in transaction 방지)
+            connection.commit()
+            if locked:
+                break
+            
+            # 다른 레플리카가 적재 중: 같은 내용이 적재되면 기다리지 않고 진행
+            loaded_hash = connection.execute(
+                text("SELECT content_hash FROM config_generations ORDER BY id DESC LIMIT 1")
+            ).scalar()
+            connection.commit()
+            if loaded_hash == content_hash:
+                break
+            
+            if not waiting:
+                print("⏳ Another replica is loading config, waiting...")
+                waiting = True
+            time.sleep(CONFIG_LEADER_POLL_SECONDS)
+        
+        yield
+    finally:
+        if locked:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": STARTUP_LOCK_KEY})
+            connection.commit()
+        connection.close()
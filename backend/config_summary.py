@@ -0,0 +1,89 @@
+"""
+/api/config 요약 정보 (세대별로 한 번만 계산)
+리로드할 때 적재 트랜잭션 안에서 요약을 계산해 config_generations.summary에 저장하고,
+요청 시에는 현재 세대의 요약을 메모리에서 (없으면 세대 행 하나만 읽어서) 반환한다.
+"""
+
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from models import ConfigGeneration, Domain, Node, SvrGroup, Server, Service, Gateway
+
+# 요약에 넣는 서버 그룹 이름 수
+SUMMARY_SERVER_GROUPS = 20
+
+# (세대, 요약) - 현재 세대 하나만 보관
+_cached: Optional[Tuple[int, Dict[str, Any]]] = None
+_lock = threading.Lock()
+
+
+def build_summary(db: Session) -> Dict[str, Any]:
+    """현재 DB 내용으로 요약 계산 (테이블별 개수는 한 쿼리로 COUNT)"""
+    counts = db.execute(select(*[
+        select(func.count()).select_from(model).scalar_subquery()
+        for model in (Domain, Node, SvrGroup, Server, Service, Gateway)
+    ])).one()
+    total_domains, total_nodes, total_svrgroups, total_servers, total_services, total_gateways = counts
+    
+    # 첫 번째 도메인 정보 사용 (호환성 유지)
+    domain = db.query(Domain).order_by(Domain.id).first()
+    # 이름만 조회하면 이름 인덱스 순서로 나올 수 있으므로 적재 순서(id)로 정렬
+    node_names = [name for (name,) in db.query(Node.name).order_by(Node.id)]
+    svg_names = [
+        name for (name,) in db.query(SvrGroup.name).order_by(SvrGroup.id).limit(SUMMARY_SERVER_GROUPS)
+    ]
+    
+    return {
+        "domain_id": domain.domain_id if domain else "",
+        "domain_name": domain.name if domain else "N/A",
+        "domain_shmkey": domain.shmkey if domain else None,
+        "domain_tportno": domain.tportno if domain else None,
+        "domain_racport": domain.racport if domain else None,
+        "domain_maxuser": domain.maxuser if domain else None,
+        "domain_maxnode": domain.maxnode if domain else None,
+        "domain_maxsvg": domain.maxsvg if domain else None,
+        "domain_maxsvr": domain.maxsvr if domain else None,
+        "domain_maxsvc": domain.maxsvc if domain else None,
+        "domain_maxgw": domain.maxgw if domain else None,
+        "domain_maxsession": domain.maxsession if domain else None,
+        "domain_security": domain.security if domain else None,
+        "domain_loglvl": domain.loglvl if domain else None,
+        "total_domains": total_domains,
+        "total_nodes": total_nodes,
+        "total_server_groups": total_svrgroups,
+        "total_servers": total_servers,
+        "total_services": total_services,
+        "total_gateways": total_gateways,
+        "nodes": node_names,
+        "server_groups": svg_names
+    }
+
+
+def store_summary(db: Session, generation: ConfigGeneration):
+    """새 세대 행에 요약 저장 (적재와 같은 트랜잭션, 적재가 끝난 뒤 호출)"""
+    generation.summary = json.dumps(build_summary(db), ensure_ascii=False)
+
+
+def get_summary(db: Session, generation_id: int) -> Dict[str, Any]:
+    """
+    세대의 요약 반환 (메모리 -> 세대 행 순서로 찾고, 둘 다 없으면 직접 계산)
+    요약이 없는 경우: 아직 로드 전(세대 0)이거나 요약 저장 전 버전이 기록한 세대
+    """
+    global _cached
+    cached = _cached
+    if cached is not None and cached[0] == generation_id:
+        return cached[1]
+    
+    generation = db.get(ConfigGeneration, generation_id) if generation_id else None
+    if generation is not None and generation.summary:
+        summary = json.loads(generation.summary)
+    else:
+        summary = build_summary(db)
+    
+    with _lock:
+        _cached = (generation_id, summary)
+    return summary
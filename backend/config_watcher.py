@@ -0,0 +1,195 @@
+"""
+config 파일 변경 감시
+CONFIG_DIR의 scorap*.m 파일이 바뀌면 연속된 쓰기를 debounce 한 뒤 증분 리로드를 실행한다.
+Linux에서는 watchfiles(inotify)를 쓰고, 없거나 CONFIG_WATCH_POLL=1이면 주기적으로 stat을 비교한다.
+바뀌지 않은 파일은 파싱 캐시를 그대로 쓰고 DB에는 바뀐 행만 반영되므로, 변경된 파일만 다시 처리된다.
+"""
+
+import fnmatch
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+try:
+    import watchfiles
+except ImportError:  # watchfiles 없으면 폴링으로 감시
+    watchfiles = None
+
+# 1이면 서버 시작 시 config 파일 감시 시작
+CONFIG_WATCH = os.getenv("CONFIG_WATCH", "0") == "1"
+
+# 마지막 변경 후 이 시간(ms) 동안 추가 변경이 없으면 리로드
+CONFIG_WATCH_DEBOUNCE_MS = int(os.getenv("CONFIG_WATCH_DEBOUNCE_MS", "500"))
+
+# 1이면 inotify 대신 폴링 (네트워크 파일시스템 등)
+CONFIG_WATCH_POLL = os.getenv("CONFIG_WATCH_POLL", "0") == "1"
+
+# 폴링 주기(초)
+CONFIG_WATCH_POLL_INTERVAL = float(os.getenv("CONFIG_WATCH_POLL_INTERVAL", "2"))
+
+# 파일 경로 -> (크기, mtime_ns)
+FileState = Dict[str, Tuple[int, int]]
+
+
+class ConfigWatcher:
+    """config 디렉토리 감시 스레드 (변경 시 reload()로 리로드 작업 실행)"""
+    
+    def __init__(self, directory: str, pattern: str, reload: Callable[[], Tuple[Any, bool]]):
+        # reload(): 증분 리로드 요청, (job, merged) 반환 (ReloadJobManager.submit과 같은 형태)
+        self.directory = directory
+        self.pattern = pattern
+        self.reload = reload
+        self.backend = "polling" if CONFIG_WATCH_POLL or watchfiles is None else "inotify"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._state = self._scan()
+        
+        # 메트릭
+        self._lock = threading.Lock()
+        self.changes_detected = 0
+        self.reloads_triggered = 0
+        self.reload_failures = 0
+        self.last_change_at: Optional[datetime] = None
+        self.last_changed_files: Set[str] = set()
+        self.last_job_id: Optional[str] = None
+        self.last_latency: Optional[float] = None
+        self.max_latency: Optional[float] = None
+        self._latency_total = 0.0
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        print(f"👀 Watching {os.path.join(self.directory, self.pattern)} ({self.backend})")
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+    
+    def _scan(self) -> FileState:
+        """감시 대상 파일의 (크기, mtime) 스냅샷 (심볼릭 링크는 대상 파일 기준)"""
+        state = {}
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return state
+        for name in names:
+            if not fnmatch.fnmatch(name, self.pattern):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            state[path] = (stat.st_size, stat.st_mtime_ns)
+        return state
+    
+    def _changed_files(self) -> Set[str]:
+        """이전 스냅샷과 비교해서 추가/변경/삭제된 파일"""
+        state = self._scan()
+        changed = {
+            path for path in state.keys() | self._state.keys()
+            if state.get(path) != self._state.get(path)
+        }
+        self._state = state
+        return changed
+    
+    def _run(self):
+        if self.backend == "inotify":
+            self._watch_inotify()
+        else:
+            self._watch_polling()
+    
+    def _watch_inotify(self):
+        def watch_filter(change, path: str) -> bool:
+            name = os.path.basename(path)
+            # k8s ConfigMap은 ..data 심볼릭 링크를 바꿔서 갱신하므로 함께 감시
+            return fnmatch.fnmatch(name, self.pattern) or name.startswith("..")
+        
+        for _changes in watchfiles.watch(
+            self.directory,
+            watch_filter=watch_filter,
+            # step 동안 추가 변경이 없으면 묶어서 반환 (계속 쓰는 중이면 최대 debounce까지 대기)
+            step=CONFIG_WATCH_DEBOUNCE_MS,
+            debounce=CONFIG_WATCH_DEBOUNCE_MS * 10,
+            stop_event=self._stop,
+            recursive=False,
+            raise_interrupt=False
+        ):
+            detected_at = time.time()
+            changed = self._changed_files()
+            if changed:
+                self._reload(changed, detected_at)
+    
+    def _watch_polling(self):
+        while not self._stop.wait(CONFIG_WATCH_POLL_INTERVAL):
+            changed = self._changed_files()
+            if not changed:
+                continue
+            detected_at = time.time()
+            
+            # debounce: 추가 변경이 멈출 때까지 대기
+            while not self._stop.wait(CONFIG_WATCH_DEBOUNCE_MS / 1000):
+                more = self._changed_files()
+                if not more:
+                    break
+                changed |= more
+            
+            if not self._stop.is_set():
+                self._reload(changed, detected_at)
+    
+    def _reload(self, changed: Set[str], detected_at: float):
+        """증분 리로드 실행 후 완료까지 대기, 변경 감지부터 반영까지 지연 시간 기록"""
+        names = sorted(os.path.basename(path) for path in changed)
+        print(f"👀 Config files changed: {', '.join(names)}")
+        with self._lock:
+            self.changes_detected += 1
+            self.last_change_at = datetime.fromtimestamp(detected_at)
+            self.last_changed_files = set(names)
+        
+        job, merged = self.reload()
+        self._wait(job)
+        if merged:
+            # 이미 실행 중이던 작업은 이번 변경 전에 파싱했을 수 있으므로 한 번 더 리로드
+            job, _ = self.reload()
+            self._wait(job)
+        
+        latency = time.time() - detected_at
+        with self._lock:
+            self.reloads_triggered += 1
+            self.last_job_id = job.job_id
+            if job.status != "succeeded":
+                self.reload_failures += 1
+                return
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency or 0.0, latency)
+            self._latency_total += latency
+        print(f"👀 Config reloaded in {latency:.2f}s after change")
+    
+    def _wait(self, job):
+        while job.running and not self._stop.wait(0.1):
+            pass
+    
+    def metrics(self) -> Dict[str, Any]:
+        """감시 상태와 리로드 지연 시간 (변경 감지 -> DB 반영 완료, 폴링은 첫 감지부터 / inotify는 debounce 이후부터)"""
+        with self._lock:
+            succeeded = self.reloads_triggered - self.reload_failures
+            return {
+                "enabled": True,
+                "backend": self.backend,
+                "directory": self.directory,
+                "pattern": self.pattern,
+                "debounce_ms": CONFIG_WATCH_DEBOUNCE_MS,
+                "watched_files": len(self._state),
+                "changes_detected": self.changes_detected,
+                "reloads_triggered": self.reloads_triggered,
+                "reload_failures": self.reload_failures,
+                "last_change_at": self.last_change_at.isoformat() if self.last_change_at else None,
+                "last_changed_files": sorted(self.last_changed_files),
+                "last_job_id": self.last_job_id,
+                "last_latency_seconds": round(self.last_latency, 3) if self.last_latency is not None else None,
+                "max_latency_seconds": round(self.max_latency, 3) if self.max_latency is not None else None,
+                "avg_latency_seconds": round(self._latency_total / succeeded, 3) if succeeded else None
+            }
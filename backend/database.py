@@ -2,7 +2,7 @@
 데이터베이스 연결 설정
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -32,6 +32,91 @@ def get_db():
         db.close()
 
 
+# 여러 레플리카가 동시에 테이블을 만들지 않도록 하는 advisory lock 키
+SCHEMA_LOCK_KEY = 7470003
+
+# 부분 문자열 검색(ilike '%term%')용 pg_trgm GIN 인덱스 대상 (테이블 -> 컬럼)
+TRIGRAM_INDEXES = {
+    "servers": ("name", "svg_name"),
+    "services": ("name", "server_name"),
+}
+
+
 def init_db():
-    """데이터베이스 초기화"""
-    Base.metadata.create_all(bind=engine)
+    """데이터베이스 초기화 (PostgreSQL이면 레플리카 간 advisory lock으로 한 번에 하나씩)"""
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        Base.metadata.create_all(bind=connection)
+        add_missing_columns(connection)
+        add_missing_indexes(connection)
+        if engine.dialect.name == "postgresql" and create_trigram_extension(connection):
+            create_trigram_indexes(connection)
+
+
+def add_missing_columns(connection):
+    """
+    기존 테이블에 모델에 새로 추가된 (nullable) 컬럼 추가
+    create_all은 이미 있는 테이블은 변경하지 않으므로 별도로 처리
+    """
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            connection.execute(text(
+                f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+            ))
+            print(f"✅ Added column {table.name}.{column.name}")
+
+
+def add_missing_indexes(connection):
+    """
+    기존 테이블에 모델에 새로 추가된 인덱스 생성
+    create_all은 이미 있는 테이블의 인덱스는 만들지 않으므로 별도로 처리
+    """
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            index.create(bind=connection)
+            print(f"✅ Added index {index.name}")
+
+
+def create_trigram_extension(connection) -> bool:
+    """
+    pg_trgm 확장 생성 (PostgreSQL만)
+    확장을 만들 권한이 없으면 경고만 출력하고 False (검색은 순차 스캔으로 동작)
+    """
+    try:
+        with connection.begin_nested():
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except Exception as e:
+        print(f"⚠️ pg_trgm extension unavailable, substring search stays unindexed: {e}")
+        return False
+    return True
+
+
+def create_trigram_indexes(connection, schema: str = ""):
+    """
+    TRIGRAM_INDEXES 컬럼에 pg_trgm GIN 인덱스 생성 (PostgreSQL만, 이미 있으면 건너뜀)
+    schema를 주면 해당 스키마의 같은 이름 테이블에 생성 (스테이징 테이블 교체용)
+    pg_trgm 확장이 없으면 아무것도 하지 않음
+    """
+    installed = connection.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).scalar()
+    if not installed:
+        return
+    
+    prefix = f'"{schema}".' if schema else ""
+    for table_name, columns in TRIGRAM_INDEXES.items():
+        for column in columns:
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table_name}_{column}_trgm "
+                f"ON {prefix}{table_name} USING gin ({column} gin_trgm_ops)"
+            ))
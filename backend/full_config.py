@@ -0,0 +1,107 @@
+"""
+/api/config/full 응답 본문 (세대별로 한 번만 직렬화/압축)
+세대가 바뀌면 전체 설정을 orjson으로 직렬화하고 gzip/brotli 변형까지 미리 만들어 두고,
+요청 시에는 Accept-Encoding에 맞는 바이트를 그대로 보낸다 (요청마다 조회/직렬화/압축 없음).
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from tpconfig.payload import PrebuiltPayload, build_payload
+from database import SessionLocal
+from models import Domain, Node, SvrGroup, Server, Service, Gateway
+from routers import system
+
+# (세대, 미리 만든 본문) - 현재 세대 하나만 보관
+_payload: Optional[Tuple[int, PrebuiltPayload]] = None
+_lock = threading.Lock()
+
+
+def build_full_config(db: Session) -> Dict[str, Any]:
+    """현재 DB 내용으로 전체 설정 응답 구성"""
+    nodes = db.query(Node).all()
+    svrgroups = db.query(SvrGroup).all()
+    servers = db.query(Server).all()
+    services = db.query(Service).all()
+    gateways = db.query(Gateway).all()
+    domain = db.query(Domain).first()
+    
+    return {
+        "success": True,
+        "data": {
+            "domain": {
+                "domain_id": domain.domain_id if domain else "",
+                "name": domain.name if domain else ""
+            },
+            "nodes": [{
+                "name": n.name,
+                "hostname": n.hostname,
+                "port": n.tmax_port
+            } for n in nodes],
+            "svrgroups": [{
+                "name": s.name,
+                "node": s.node_name
+            } for s in svrgroups],
+            "servers": [{
+                "name": s.name,
+                "svg": s.svg_name
+            } for s in servers],
+            "services": [{
+                "name": s.name,
+                "server": s.server_name
+            } for s in services],
+            "gateways": [{
+                "name": g.name,
+                "node": g.node_name,
+                "port": g.port,
+                "remote_addr": g.remote_addr,
+                "remote_port": g.remote_port,
+                "direction": g.direction,
+                "gw_type": g.gw_type,
+                "backup_addr": g.backup_addr,
+                "backup_port": g.backup_port,
+                "backup_rgwaddr": g.backup_rgwaddr,
+                "backup_rgwportno": g.backup_rgwportno,
+                "cpc": g.cpc,
+                "restart": g.restart,
+                "clopt": g.clopt
+            } for g in gateways]
+        },
+        "last_update": system.get_last_update().isoformat()
+    }
+
+
+def get_payload(db: Session, generation_id: int) -> PrebuiltPayload:
+    """
+    세대의 미리 만든 본문 반환 (없으면 만들어서 보관)
+    세대 0(아직 로드 전)이면 보관하지 않고 매번 새로 만듦
+    """
+    global _payload
+    payload = _payload
+    if payload is not None and payload[0] == generation_id:
+        return payload[1]
+    if not generation_id:
+        return build_payload(build_full_config(db))
+    
+    with _lock:
+        # 기다리는 동안 다른 스레드가 같은 세대를 만들었으면 그대로 사용
+        if _payload is not None and _payload[0] == generation_id:
+            return _payload[1]
+        built = build_payload(build_full_config(db))
+        _payload = (generation_id, built)
+    return built
+
+
+@system.on_generation_change
+def prebuild_payload(generation_id: int):
+    """세대가 바뀌면 첫 요청을 기다리지 않고 바로 본문을 만들어 둠 (실패하면 첫 요청 때 다시 시도)"""
+    db = SessionLocal()
+    try:
+        sizes = get_payload(db, generation_id).sizes()
+        print(f"📦 /api/config/full payload prebuilt for generation {generation_id}: {sizes}")
+    except Exception as e:
+        print(f"⚠️ Failed to prebuild /api/config/full payload: {e}")
+    finally:
+        db.close()
@@ -0,0 +1,111 @@
+"""
+레플리카 간 config 세대 알림 (PostgreSQL LISTEN/NOTIFY)
+리로드는 적재 트랜잭션 안에서 새 세대 번호를 NOTIFY 하고 (commit 시점에 전달됨),
+각 레플리카는 전용 연결로 LISTEN 하는 스레드에서 세대를 받아 로컬 세대를 갱신하고 캐시를 비운다.
+요청마다 DB를 조회하지 않고도 다른 파드의 리로드가 반영된다.
+"""
+
+import os
+import select
+import threading
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# 세대 알림 채널 이름
+CONFIG_NOTIFY_CHANNEL = os.getenv("CONFIG_NOTIFY_CHANNEL", "tpops_config")
+
+# LISTEN 연결이 끊기면 다시 연결하기까지 대기 시간(초)
+CONFIG_LISTEN_RETRY_SECONDS = float(os.getenv("CONFIG_LISTEN_RETRY_SECONDS", "5"))
+
+
+def supports_notify(engine: Engine) -> bool:
+    """LISTEN/NOTIFY를 쓸 수 있는 DB인지 (PostgreSQL만)"""
+    return engine.dialect.name == "postgresql"
+
+
+def notify_generation(db: Session, generation: int):
+    """새 세대 알림 (적재와 같은 트랜잭션, commit될 때만 전달됨)"""
+    if not supports_notify(db.get_bind()):
+        return
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": CONFIG_NOTIFY_CHANNEL, "payload": str(generation)}
+    )
+
+
+class GenerationListener:
+    """세대 알림 수신 스레드 (알림을 받으면 on_generation(세대) 호출)"""
+    
+    def __init__(self, engine: Engine, on_generation: Callable[[int], None]):
+        self.engine = engine
+        self.on_generation = on_generation
+        self.connected = False
+        self.notifications = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="config-generation-listener", daemon=True)
+        self._thread.start()
+        print(f"📡 Listening for config generations on '{CONFIG_NOTIFY_CHANNEL}'")
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+    
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                print(f"⚠️ Config generation listener disconnected: {e}")
+            self.connected = False
+            self._stop.wait(CONFIG_LISTEN_RETRY_SECONDS)
+    
+    def _listen(self):
+        # 풀에서 분리한 전용 연결 (LISTEN은 연결 단위라 풀에 돌려주면 안 됨)
+        pooled = self.engine.raw_connection()
+        pooled.detach()
+        connection = pooled.dbapi_connection
+        try:
+            connection.autocommit = True
+            cursor = connection.cursor()
+            cursor.execute(f'LISTEN "{CONFIG_NOTIFY_CHANNEL}"')
+            
+            # LISTEN 이후 최신 세대 확인 (시작 전이나 연결이 끊긴 동안 놓친 알림 보정)
+            cursor.execute("SELECT max(id) FROM config_generations")
+            latest = cursor.fetchone()[0]
+            cursor.close()
+            self.connected = True
+            if latest:
+                self.on_generation(latest)
+            
+            for payload in self._notifications(connection):
+                self.notifications += 1
+                try:
+                    generation = int(payload)
+                except ValueError:
+                    print(f"⚠️ Invalid config generation notification: {payload!r}")
+                    continue
+                self.on_generation(generation)
+        finally:
+            connection.close()
+    
+    def _notifications(self, connection) -> Iterator[str]:
+        """알림 payload (1초마다 중지 여부 확인)"""
+        if callable(getattr(connection, "notifies", None)):
+            # psycopg (3)
+            while not self._stop.is_set():
+                for notify in connection.notifies(timeout=1.0):
+                    yield notify.payload
+        else:
+            # psycopg2
+            while not self._stop.is_set():
+                if select.select([connection], [], [], 1.0)[0]:
+                    connection.poll()
+                    while connection.notifies:
+                        yield connection.notifies.pop(0).payload
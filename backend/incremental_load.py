@@ -0,0 +1,148 @@
+"""
+config 데이터 증분 적재
+새로 파싱한 행과 DB에 있는 행을 자연 키(name 등)와 행 내용 해시로 비교해서
+바뀐 행만 INSERT/UPDATE/DELETE 한다. 한 트랜잭션에서 처리하므로 commit 전까지
+조회 API는 이전 데이터를 본다.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session
+
+from bulk_load import (
+    CONFIG_LOAD_BATCH_SIZE, LOAD_COLUMNS, ROW_HASH_COLUMN, Row,
+    load_method, row_hash, write_rows
+)
+from models import Domain, Node, SvrGroup, Server, Service, Gateway
+from reload_jobs import NO_PROGRESS, ReloadProgress
+
+# 테이블별 자연 키 컬럼
+# Server는 같은 이름이 여러 서버 그룹/노드에 있을 수 있고 키가 겹칠 수도 있어서
+# 같은 키의 행들은 순서대로 짝지어 비교
+NATURAL_KEYS = {
+    Domain: ("domain_id",),
+    Node: ("name",),
+    SvrGroup: ("name",),
+    Server: ("name", "svg_name", "node_name"),
+    Service: ("name",),
+    Gateway: ("name",),
+}
+
+
+def diff_rows(
+    existing: List[Tuple[Any, ...]],
+    new_rows: List[Row],
+    key_indexes: Tuple[int, ...]
+) -> Tuple[List[Row], List[Tuple[int, Row]], List[int], int]:
+    """
+    기존 행 (id, 키..., row_hash) 목록과 새 행 튜플 목록 비교
+    (inserts, updates[(id, row)], deletes[id], unchanged 수) 반환
+    """
+    existing_by_key = defaultdict(list)
+    for record in existing:
+        existing_by_key[tuple(record[1:-1])].append((record[0], record[-1]))
+    
+    inserts = []
+    updates = []
+    unchanged = 0
+    for row in new_rows:
+        key = tuple(row[i] for i in key_indexes)
+        candidates = existing_by_key.get(key)
+        if not candidates:
+            inserts.append(row)
+            continue
+        row_id, existing_hash = candidates.pop(0)
+        if existing_hash == row_hash(row):
+            unchanged += 1
+        else:
+            updates.append((row_id, row))
+    
+    deletes = [row_id for candidates in existing_by_key.values() for row_id, _ in candidates]
+    return inserts, updates, deletes, unchanged
+
+
+def incremental_load(
+    db: Session,
+    rows: Dict[Any, List[Row]],
+    batch_size: int = 0,
+    progress: ReloadProgress = NO_PROGRESS
+) -> Dict[str, Any]:
+    """
+    모델별 행 튜플을 DB와 비교해서 바뀐 행만 반영 (commit은 호출자가)
+    테이블별 insert/update/delete/unchanged 수와 소요 시간, 전체 합계를 반환
+    """
+    batch_size = batch_size or CONFIG_LOAD_BATCH_SIZE
+    method = load_method(db)
+    
+    # 테이블별 변경 내용 계산
+    plans = {}
+    for model, columns in LOAD_COLUMNS.items():
+        start = time.perf_counter()
+        table = model.__table__
+        key_columns = NATURAL_KEYS[model]
+        existing = db.execute(
+            select(
+                table.c.id,
+                *[table.c[name] for name in key_columns],
+                table.c[ROW_HASH_COLUMN]
+            ).order_by(table.c.id)
+        ).all()
+        key_indexes = tuple(columns.index(name) for name in key_columns)
+        plans[model] = (diff_rows(existing, rows.get(model, []), key_indexes), time.perf_counter() - start)
+    
+    # 추가/수정은 참조되는 테이블부터 (FK 순서)
+    # 삭제는 그 뒤에 해야 이름이 바뀐 노드/서버 그룹의 자식 행이 새 부모로 옮겨진 다음 이전 부모가 지워짐
+    table_stats = {}
+    totals = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+    for model, columns in LOAD_COLUMNS.items():
+        (inserts, updates, deletes, unchanged), diff_seconds = plans[model]
+        table = model.__table__
+        hashed_columns = columns + (ROW_HASH_COLUMN,)
+        start = time.perf_counter()
+        
+        if updates:
+            # executemany 파라미터의 컬럼명 키로 SET 절이 만들어짐
+            statement = update(table).where(table.c.id == bindparam("_id"))
+            for offset in range(0, len(updates), batch_size):
+                db.execute(statement, [
+                    dict(zip(hashed_columns, row + (row_hash(row),)), _id=row_id)
+                    for row_id, row in updates[offset:offset + batch_size]
+                ])
+        
+        if inserts:
+            write_rows(
+                db,
+                method,
+                table,
+                hashed_columns,
+                [row + (row_hash(row),) for row in inserts],
+                batch_size
+            )
+        
+        progress.add_rows_written(len(inserts) + len(updates))
+        counts = {
+            "inserted": len(inserts),
+            "updated": len(updates),
+            "deleted": len(deletes),
+            "unchanged": unchanged
+        }
+        for name, count in counts.items():
+            totals[name] += count
+        table_stats[model.__tablename__] = {
+            "rows": len(rows.get(model, [])),
+            **counts,
+            "seconds": round(diff_seconds + time.perf_counter() - start, 3)
+        }
+    
+    # 삭제는 참조하는 테이블부터 (FK 역순)
+    for model in reversed(list(LOAD_COLUMNS)):
+        (_, _, deletes, _), _ = plans[model]
+        table = model.__table__
+        for start in range(0, len(deletes), batch_size):
+            db.execute(delete(table).where(table.c.id.in_(deletes[start:start + batch_size])))
+        progress.add_rows_written(len(deletes))
+    
+    return {"method": method, "batch_size": batch_size, "tables": table_stats, "changes": totals}
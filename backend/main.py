@@ -4,22 +4,41 @@ from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
 import re
 import io
 import random
-from typing import Dict, Any, Optional, List
+import sys
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill
 
-from parser import TpConfigParser
+# 프로젝트 루트의 공용 파싱 모듈(tpconfig)을 import 경로에 추가 (backend 모듈은 tpconfig를 바로 import)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from parser import parse_config_file, parse_config_file_sharded, use_shards_for
 from database import get_db, init_db, engine
 from models import Domain, Node, SvrGroup, Server, Service, Gateway, User, UserRole
 from auth import get_password_hash
+from parse_cache import CacheKey, parse_cache, file_cache_key
+from bulk_load import LOAD_COLUMNS, bulk_load
+from shadow_tables import acquire_reload_lock, supports_shadow_tables, create_shadow_tables, swap_shadow_tables
+from incremental_load import incremental_load
+from reload_jobs import NO_PROGRESS, ReloadProgress
+from config_watcher import CONFIG_WATCH, ConfigWatcher
+from config_generations import config_content_hash, latest_generation, record_generation, startup_leader_lock
+from generation_notify import GenerationListener, notify_generation, supports_notify
+from config_summary import store_summary
 
 # 라우터 import
-from routers import auth, config, servers, services, performance, export, gateways, users, system
+from routers import auth, config, servers, services, performance, export, gateways, users, system, capacity
 
 app = FastAPI(
     title="Tmax Monitoring Dashboard API",
@@ -56,6 +75,24 @@ def extract_db_info(clopt: str) -> str:
     return ""
 
 
+# 정수 컬럼(INTEGER) 범위
+_INT_MAX = 2 ** 31 - 1
+
+
+def to_int(value: Optional[str]) -> Optional[int]:
+    """
+    용량 값 문자열을 정수로 변환 (집계용 *_num 컬럼)
+    예: "10" -> 10, '"10"' -> 10, "" / "N/A" / 범위를 넘는 값 -> None
+    """
+    if not value:
+        return None
+    try:
+        number = int(value.strip().strip('"'))
+    except ValueError:
+        return None
+    return number if -_INT_MAX <= number <= _INT_MAX else None
+
+
 def map_db_to_display(db_info: str) -> str:
     """
     DB 정보를 화면 표시용으로 매핑
@@ -89,18 +126,124 @@ def get_config_files():
     return sorted(config_files)
 
 
-def load_all_configs_to_db(db: Session):
-    """모든 config 파일을 통합하여 DB에 저장"""
+def get_config_paths() -> List[str]:
+    """존재하는 config 파일 경로 목록 (파일명 순서)"""
+    config_paths = [
+        os.path.join(CONFIG_DIR, config_file)
+        for config_file in get_config_files()
+    ]
+    return [path for path in config_paths if os.path.exists(path)]
+
+
+# 파싱 결과 스냅샷 파일 (config 파일 옆에 저장, 빈 값이면 사용 안 함)
+CONFIG_SNAPSHOT_FILE = os.getenv(
+    "CONFIG_SNAPSHOT_FILE",
+    os.path.join(CONFIG_DIR, ".tpconfig.snapshot")
+)
+
+# 리로드 방식: full (전체 다시 적재) 또는 incremental (바뀐 행만 반영)
+# incremental은 남은 행의 id를 유지하고 새 행을 뒤에 붙이므로 id 순서 목록이 파일 순서와 달라질 수 있어 선택 사항
+CONFIG_RELOAD_MODE = os.getenv("CONFIG_RELOAD_MODE", "full")
+
+# 시작 방식: sync (설정 로드 후 요청 수신) 또는 background (바로 요청 수신, 로드는 백그라운드)
+CONFIG_STARTUP_MODE = os.getenv("CONFIG_STARTUP_MODE", "sync")
+
+# background 시작 모드에서 설정 로드 실패 시 재시도 간격(초)
+CONFIG_STARTUP_RETRY_SECONDS = int(os.getenv("CONFIG_STARTUP_RETRY_SECONDS", "10"))
+
+# config 파싱 프로세스 수 (0이면 CPU 수, 1이면 프로세스 풀 없이 순차 파싱)
+CONFIG_PARSE_WORKERS = int(os.getenv("CONFIG_PARSE_WORKERS", "0")) or (os.cpu_count() or 1)
+
+# 파싱 워커 프로세스 시작 방식
+# 리로드는 DB 커넥션 풀과 리스너/감시 스레드가 살아 있는 프로세스의 워커 스레드에서 실행되므로
+# fork로 상속된 lock에 걸려 멈추지 않도록 forkserver 사용
+PARSE_POOL_CONTEXT = multiprocessing.get_context("forkserver")
+
+
+def parse_config_files(
+    config_paths: List[str],
+    progress: ReloadProgress = NO_PROGRESS,
+    cache_keys: Optional[List[CacheKey]] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    config 파일들을 파싱 (변경되지 않은 파일은 파싱 캐시 사용)
+    cache_keys: 호출자가 이미 계산한 파일별 캐시 키 (없으면 여기서 계산)
+    콜드 스타트 시에는 내용 해시가 같은 파일을 스냅샷에서 복원
+    캐시에 없는 파일만 프로세스 풀에서 병렬 파싱 (아주 큰 파일은 샤드 단위로 병렬 파싱)
+    결과는 입력(파일명) 순서대로 반환하므로 기존 중복 처리 순서가 유지됨
+    """
+    if cache_keys is None:
+        cache_keys = [file_cache_key(path) for path in config_paths]
+    
+    # 메모리 캐시가 비어 있으면 (프로세스 시작 직후) 스냅샷에서 복원
+    restored = 0
+    if not parse_cache and CONFIG_SNAPSHOT_FILE:
+        restored = parse_cache.load_snapshot(CONFIG_SNAPSHOT_FILE, cache_keys)
+    
+    results = [parse_cache.get(key) for key in cache_keys]
+    missing = [i for i, config_data in enumerate(results) if config_data is None]
+    
+    missing_paths = [config_paths[i] for i in missing]
+    progress.add_files_processed(len(config_paths) - len(missing))
+    
+    # CONFIG_SHARD_THRESHOLD_MB 이상인 파일은 한 파일을 샤드로 나눠 풀 전체로 파싱
+    large_paths = set()
+    if CONFIG_PARSE_WORKERS > 1:
+        large_paths = {path for path in missing_paths if use_shards_for(path)}
+    
+    workers = CONFIG_PARSE_WORKERS if large_paths else min(CONFIG_PARSE_WORKERS, len(missing_paths))
+    parsed = []
+    if workers <= 1:
+        for path in missing_paths:
+            parsed.append(parse_config_file(path))
+            progress.add_files_processed()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=PARSE_POOL_CONTEXT) as executor:
+            small_paths = [path for path in missing_paths if path not in large_paths]
+            parsed_small = {}
+            for path, config_data in zip(small_paths, executor.map(parse_config_file, small_paths)):
+                parsed_small[path] = config_data
+                progress.add_files_processed()
+            for path in missing_paths:
+                if path in large_paths:
+                    parsed_small[path] = parse_config_file_sharded(path, executor, workers)
+                    progress.add_files_processed()
+                parsed.append(parsed_small[path])
+    
+    for i, config_data in zip(missing, parsed):
+        parse_cache.put(cache_keys[i], config_data)
+        results[i] = config_data
+    
+    # 새로 파싱한 파일이 있으면 다음 콜드 스타트용 스냅샷 갱신
+    if missing and CONFIG_SNAPSHOT_FILE:
+        parse_cache.save_snapshot(CONFIG_SNAPSHOT_FILE, cache_keys)
+    
+    cache_stats = {
+        "hits": len(config_paths) - len(missing),
+        "misses": len(missing),
+        "snapshot": restored
+    }
+    return results, cache_stats
+
+
+def load_all_configs_to_db(
+    db: Session,
+    mode: Optional[str] = None,
+    progress: ReloadProgress = NO_PROGRESS
+) -> Dict[str, Any]:
+    """
+    모든 config 파일을 통합하여 DB에 저장 (파일 수, 파싱 캐시 적중 통계, 테이블별 적재 시간 반환)
+    행은 ORM 객체 대신 튜플로 모아서 적재
+    - incremental: 기존 행과 비교해서 바뀐 행만 INSERT/UPDATE/DELETE
+    - full: 전체 행을 bulk_load로 다시 적재
+    파싱/적재 중에도 기존 데이터는 그대로 조회되고, commit 시점에 한 번에 교체됨
+    progress로 단계/처리 파일 수/반영 행 수를 보고 (백그라운드 리로드 작업 상태 조회용)
+    """
     global last_update
     
-    # 기존 데이터 삭제
-    db.query(Gateway).delete()
-    db.query(Service).delete()
-    db.query(Server).delete()
-    db.query(SvrGroup).delete()
-    db.query(Node).delete()
-    db.query(Domain).delete()
-    db.commit()  # 삭제를 즉시 반영
+    mode = mode or CONFIG_RELOAD_MODE
+    if mode not in ("incremental", "full"):
+        raise ValueError(f"Unknown reload mode: {mode}")
     
     # 중복 추적용 set
     added_domains = set()
@@ -109,17 +252,24 @@ def load_all_configs_to_db(db: Session):
     added_services = set()
     added_gateways = set()
     
-    config_files = get_config_files()
+    # 테이블별 행 튜플 (컬럼 순서는 bulk_load.LOAD_COLUMNS)
+    rows = {model: [] for model in LOAD_COLUMNS}
     
-    for config_file in config_files:
-        config_path = os.path.join(CONFIG_DIR, config_file)
-        if not os.path.exists(config_path):
-            continue
-        
-        # config 파일 파싱
-        parser = TpConfigParser(config_path)
-        config_data = parser.parse()
-        
+    # 파일별 캐시 키(내용 sha256 포함)를 한 번만 계산해서 세대 해시와 파싱 캐시에 함께 사용
+    config_paths = get_config_paths()
+    cache_keys = [file_cache_key(path) for path in config_paths]
+    content_hash = config_content_hash(cache_keys)
+    
+    # config 파일 파싱 (스냅샷/캐시 + 병렬), 파일명 순서대로 병합
+    parse_start = time.perf_counter()
+    progress.set_phase("parsing")
+    progress.set_files_total(len(config_paths))
+    parsed_configs, cache_stats = parse_config_files(config_paths, progress, cache_keys)
+    parse_seconds = time.perf_counter() - parse_start
+    
+    progress.set_phase("building_rows")
+    build_start = time.perf_counter()
+    for config_data in parsed_configs:
         # Domain 저장
         if config_data["domain"]:
             domain_data = config_data["domain"]
@@ -128,24 +278,37 @@ def load_all_configs_to_db(db: Session):
             # 메모리에서 중복 체크 (여러 config 파일 간 중복 방지)
             if domain_id not in added_domains:
                 added_domains.add(domain_id)
-                domain = Domain(
-                    domain_id=domain_id,
-                    name=domain_data.get("name", "N/A"),
-                    shmkey=domain_data.get("SHMKEY", ""),
-                    tportno=domain_data.get("TPORTNO", ""),
-                    racport=domain_data.get("RACPORT", ""),
-                    maxuser=domain_data.get("MAXUSER", ""),
-                    maxnode=domain_data.get("MAXNODE", ""),
-                    maxsvg=domain_data.get("MAXSVG", ""),
-                    maxsvr=domain_data.get("MAXSVR", ""),
-                    maxsvc=domain_data.get("MAXSVC", ""),
-                    maxgw=domain_data.get("MAXGW", ""),
-                    maxsession=domain_data.get("MAXSESSION", ""),
-                    security=domain_data.get("SECURITY", ""),
-                    loglvl=domain_data.get("LOGLVL", ""),
-                    attributes=str(domain_data)
-                )
-                db.add(domain)
+                maxuser = domain_data.get("MAXUSER", "")
+                maxnode = domain_data.get("MAXNODE", "")
+                maxsvg = domain_data.get("MAXSVG", "")
+                maxsvr = domain_data.get("MAXSVR", "")
+                maxsvc = domain_data.get("MAXSVC", "")
+                maxgw = domain_data.get("MAXGW", "")
+                maxsession = domain_data.get("MAXSESSION", "")
+                rows[Domain].append((
+                    domain_id,
+                    domain_data.get("name", "N/A"),
+                    domain_data.get("SHMKEY", ""),
+                    domain_data.get("TPORTNO", ""),
+                    domain_data.get("RACPORT", ""),
+                    maxuser,
+                    maxnode,
+                    maxsvg,
+                    maxsvr,
+                    maxsvc,
+                    maxgw,
+                    maxsession,
+                    domain_data.get("SECURITY", ""),
+                    domain_data.get("LOGLVL", ""),
+                    str(domain_data),
+                    to_int(maxuser),
+                    to_int(maxnode),
+                    to_int(maxsvg),
+                    to_int(maxsvr),
+                    to_int(maxsvc),
+                    to_int(maxgw),
+                    to_int(maxsession)
+                ))
         
         # Node 저장
         for node_name, node_data in config_data["node"].items():
@@ -154,15 +317,18 @@ def load_all_configs_to_db(db: Session):
                 continue
             added_nodes.add(node_name)
             
-            node = Node(
-                name=node_name,
-                hostname=node_data.get("HOSTNAME", ""),
-                tmax_port=node_data.get("TmaxPort", ""),
-                max_svr=node_data.get("MAXSVR", ""),
-                max_user=node_data.get("MAXUSER", ""),
-                tmax_home=node_data.get("TMAXHOME", "")
-            )
-            db.add(node)
+            max_svr = node_data.get("MAXSVR", "")
+            max_user = node_data.get("MAXUSER", "")
+            rows[Node].append((
+                node_name,
+                node_data.get("HOSTNAME", ""),
+                node_data.get("TmaxPort", ""),
+                max_svr,
+                max_user,
+                node_data.get("TMAXHOME", ""),
+                to_int(max_svr),
+                to_int(max_user)
+            ))
         
         # SvrGroup 저장
         for svg_name, svg_data in config_data["svrgroup"].items():
@@ -171,18 +337,17 @@ def load_all_configs_to_db(db: Session):
                 continue
             added_svrgroups.add(svg_name)
             
-            svrgroup = SvrGroup(
-                name=svg_name,
-                node_name=svg_data.get("NODENAME", "").strip('"'),
-                backup=svg_data.get("BACKUP", "N/A").strip('"'),
-                cousin=svg_data.get("COUSIN", "N/A").strip('"'),
-                restart=svg_data.get("RESTART", ""),
-                autobackup=svg_data.get("AUTOBACKUP", "")
-            )
-            db.add(svrgroup)
+            rows[SvrGroup].append((
+                svg_name,
+                svg_data.get("NODENAME", "").strip('"'),
+                svg_data.get("BACKUP", "N/A").strip('"'),
+                svg_data.get("COUSIN", "N/A").strip('"'),
+                svg_data.get("RESTART", ""),
+                svg_data.get("AUTOBACKUP", "")
+            ))
         
         # 첫 번째 노드 이름 가져오기 (기본값으로 사용)
-        first_node_name = list(config_data["node"].keys())[0] if config_data["node"] else ""
+        first_node_name = next(iter(config_data["node"]), "")
         
         # Server 저장
         for srv_name, srv_list in config_data["server"].items():
@@ -196,19 +361,26 @@ def load_all_configs_to_db(db: Session):
                 if not node_name:
                     node_name = first_node_name
                 
-                server = Server(
-                    name=srv_name,
-                    svg_name=srv_data.get("SVGNAME", "").strip('"'),
-                    node_name=node_name,
-                    min_proc=srv_data.get("MIN", ""),
-                    max_proc=srv_data.get("MAX", ""),
-                    restart=srv_data.get("RESTART", ""),
-                    maxqcount=srv_data.get("MAXQCOUNT", ""),
-                    asqcount=srv_data.get("ASQCOUNT", ""),
-                    clopt=clopt,
-                    db_info=db_info
-                )
-                db.add(server)
+                min_proc = srv_data.get("MIN", "")
+                max_proc = srv_data.get("MAX", "")
+                maxqcount = srv_data.get("MAXQCOUNT", "")
+                asqcount = srv_data.get("ASQCOUNT", "")
+                rows[Server].append((
+                    srv_name,
+                    srv_data.get("SVGNAME", "").strip('"'),
+                    node_name,
+                    min_proc,
+                    max_proc,
+                    srv_data.get("RESTART", ""),
+                    maxqcount,
+                    asqcount,
+                    clopt,
+                    db_info,
+                    to_int(min_proc),
+                    to_int(max_proc),
+                    to_int(maxqcount),
+                    to_int(asqcount)
+                ))
         
         # Service 저장
         for svc_name, svc_data in config_data["service"].items():
@@ -217,14 +389,13 @@ def load_all_configs_to_db(db: Session):
                 continue
             added_services.add(svc_name)
             
-            service = Service(
-                name=svc_name,
-                server_name=svc_data.get("SVRNAME", "").strip('"'),
-                timeout=svc_data.get("SVCTIME", ""),
-                autotran=svc_data.get("AUTOTRAN", ""),
-                export=svc_data.get("EXPORT", "")
-            )
-            db.add(service)
+            rows[Service].append((
+                svc_name,
+                svc_data.get("SVRNAME", "").strip('"'),
+                svc_data.get("SVCTIME", ""),
+                svc_data.get("AUTOTRAN", ""),
+                svc_data.get("EXPORT", "")
+            ))
         
         # Gateway 저장
         for gw_name, gw_data in config_data["gateway"].items():
@@ -233,31 +404,199 @@ def load_all_configs_to_db(db: Session):
                 continue
             added_gateways.add(gw_name)
             
-            gateway = Gateway(
-                name=gw_name,
-                node_name=gw_data.get("NODENAME", "").strip('"'),
-                port=gw_data.get("PORTNO", ""),
-                remote_addr=gw_data.get("RGWADDR", "").strip('"'),
-                remote_port=gw_data.get("RGWPORTNO", ""),
-                direction=gw_data.get("DIRECTION", ""),
-                gw_type=gw_data.get("GWTYPE", ""),
-                backup_addr=gw_data.get("BACKUPIP", "").strip('"') if gw_data.get("BACKUPIP") else None,
-                backup_port=gw_data.get("BACKUPPORT", "") if gw_data.get("BACKUPPORT") else None,
-                backup_rgwaddr=gw_data.get("BACKUP_RGWADDR", "").strip('"') if gw_data.get("BACKUP_RGWADDR") else None,
-                backup_rgwportno=gw_data.get("BACKUP_RGWPORTNO", "") if gw_data.get("BACKUP_RGWPORTNO") else None,
-                cpc=gw_data.get("CPC", ""),
-                restart=gw_data.get("RESTART", ""),
-                clopt=gw_data.get("CLOPT", "").strip('"') if gw_data.get("CLOPT") else None
-            )
-            db.add(gateway)
+            rows[Gateway].append((
+                gw_name,
+                gw_data.get("NODENAME", "").strip('"'),
+                gw_data.get("PORTNO", ""),
+                gw_data.get("RGWADDR", "").strip('"'),
+                gw_data.get("RGWPORTNO", ""),
+                gw_data.get("DIRECTION", ""),
+                gw_data.get("GWTYPE", ""),
+                gw_data.get("BACKUPIP", "").strip('"') if gw_data.get("BACKUPIP") else None,
+                gw_data.get("BACKUPPORT", "") if gw_data.get("BACKUPPORT") else None,
+                gw_data.get("BACKUP_RGWADDR", "").strip('"') if gw_data.get("BACKUP_RGWADDR") else None,
+                gw_data.get("BACKUP_RGWPORTNO", "") if gw_data.get("BACKUP_RGWPORTNO") else None,
+                gw_data.get("CPC", ""),
+                gw_data.get("RESTART", ""),
+                gw_data.get("CLOPT", "").strip('"') if gw_data.get("CLOPT") else None
+            ))
+    build_seconds = time.perf_counter() - build_start
+    
+    # 교체와 적재를 한 트랜잭션에서 처리 (commit 전까지 조회 API는 이전 데이터를 봄)
+    progress.set_phase("writing")
+    apply_start = time.perf_counter()
+    # 다른 리로드가 적재 중이면 commit할 때까지 기다린 뒤 그 결과를 기준으로 비교/적재
+    acquire_reload_lock(db)
+    if mode == "incremental":
+        # 바뀐 행만 반영
+        load_stats = incremental_load(db, rows, progress=progress)
+    elif supports_shadow_tables(db):
+        # PostgreSQL: 스테이징 스키마에 적재 후 테이블 통째로 교체
+        shadow_tables = create_shadow_tables(db)
+        load_stats = bulk_load(db, rows, shadow_tables, progress=progress)
+        swap_shadow_tables(db, shadow_tables)
+    else:
+        # 그 외 DB: 같은 트랜잭션에서 기존 데이터 삭제 후 적재
+        db.query(Gateway).delete()
+        db.query(Service).delete()
+        db.query(Server).delete()
+        db.query(SvrGroup).delete()
+        db.query(Node).delete()
+        db.query(Domain).delete()
+        load_stats = bulk_load(db, rows, progress=progress)
+    apply_seconds = time.perf_counter() - apply_start
+    
+    # 세대 기록 (데이터와 같은 트랜잭션), 내용이 같고 바뀐 행도 없으면 최근 세대 유지
+    generation = latest_generation(db)
+    unchanged = mode == "incremental" and not any(
+        load_stats["changes"][kind] for kind in ("inserted", "updated", "deleted")
+    )
+    if generation is None or generation.content_hash != content_hash or not unchanged:
+        generation = record_generation(db, content_hash, len(config_paths), mode)
+        # /api/config 요약도 세대별로 한 번만 계산해서 함께 저장
+        store_summary(db, generation)
+    generation_id = generation.id
     
+    # 다른 레플리카에 세대 알림 (commit 시점에 전달)
+    notify_generation(db, generation_id)
+    
+    progress.set_phase("committing")
+    commit_start = time.perf_counter()
     db.commit()
+    commit_seconds = time.perf_counter() - commit_start
     last_update = datetime.now()
     
+    load_stats["mode"] = mode
+    load_stats["generation"] = generation_id
+    load_stats["timings"] = {
+        "parse": round(parse_seconds, 3),
+        "build_rows": round(build_seconds, 3),
+        "apply": round(apply_seconds, 3),
+        "commit": round(commit_seconds, 3)
+    }
+    table_report = ", ".join(
+        f"{table} {stats['rows']} rows {stats['seconds']:.3f}s"
+        for table, stats in load_stats["tables"].items()
+    )
+    print(f"📥 Config load ({mode}, generation {generation_id}, {load_stats['method']}, batch {load_stats['batch_size']}): {table_report}")
+    if "changes" in load_stats:
+        print(f"📥 Config changes: {load_stats['changes']}")
+    
+    return {
+        "files": len(config_paths),
+        "parse_cache": cache_stats,
+        "load": load_stats
+    }
+
+
+def load_configs_on_startup(db: Session, progress: ReloadProgress = NO_PROGRESS) -> Dict[str, Any]:
+    """
+    시작 시 설정 로드 (레플리카 여러 개가 동시에 시작해도 한 곳에서만 적재)
+    PostgreSQL advisory lock을 잡은 레플리카만 적재하고, 나머지는 기다렸다가
+    최근 세대의 내용 해시가 현재 config 파일과 같으면 적재를 건너뜀
+    반환값의 generation이 현재 DB의 세대, skipped가 True면 적재하지 않음
+    """
+    content_hash = config_content_hash([file_cache_key(path) for path in get_config_paths()])
+    with startup_leader_lock(db, content_hash):
+        generation = latest_generation(db)
+        if generation is not None and generation.content_hash == content_hash:
+            print(f"⏭️ Config generation {generation.id} already loaded by {generation.loaded_by}, skipping startup load")
+            db.commit()
+            return {"skipped": True, "generation": generation.id}
+        
+        load_stats = load_all_configs_to_db(db, progress=progress)
+    
+    return {"skipped": False, "generation": load_stats["load"]["generation"], **load_stats}
+
+
+def create_default_users(db: Session):
+    """기본 사용자 생성 (사용자가 하나도 없을 때만)"""
+    if db.query(User).count() > 0:
+        return
+    
+    default_users = [
+        User(
+            username="admin",
+            email="admin@tmax.com",
+            hashed_password=get_password_hash("admin"),
+            full_name="System Administrator",
+            role=UserRole.ADMIN
+        ),
+        User(
+            username="service",
+            email="service@tmax.com",
+            hashed_password=get_password_hash("service"),
+            full_name="Service Team",
+            role=UserRole.INFRASTRUCTURE
+        ),
+        User(
+            username="monitoring",
+            email="monitoring@tmax.com",
+            hashed_password=get_password_hash("monitoring"),
+            full_name="Monitoring User",
+            role=UserRole.DEVELOPER
+        )
+    ]
+    for user in default_users:
+        db.add(user)
+    db.commit()
+    print("✅ Default users created")
+
+
+def start_generation_listener():
+    """다른 레플리카의 리로드 알림 수신 시작 (PostgreSQL일 때)"""
+    if supports_notify(engine):
+        system.generation_listener = GenerationListener(engine, system.apply_remote_generation)
+        system.generation_listener.start()
+
+
+def start_config_watcher():
+    """config 파일 변경 시 자동으로 증분 리로드 (CONFIG_WATCH=1일 때)"""
+    if CONFIG_WATCH:
+        system.config_watcher = ConfigWatcher(
+            CONFIG_DIR,
+            "scorap*.m",
+            lambda: system.reload_jobs.submit("incremental", "watcher")
+        )
+        system.config_watcher.start()
+
+
+def warm_up():
+    """
+    background 시작 모드의 초기화 (워커 스레드에서 실행)
+    기본 사용자 생성 후 리로드 작업으로 설정을 로드하고, 실패하면 CONFIG_STARTUP_RETRY_SECONDS 후 재시도
+    로드가 끝나면 /ready가 200을 반환
+    """
+    while True:
+        try:
+            db = next(get_db())
+            try:
+                create_default_users(db)
+            finally:
+                db.close()
+            
+            job, _ = system.reload_jobs.submit(None, "startup", system.run_startup_load)
+            system.startup_job = job
+            job.wait()
+            if job.status == "succeeded":
+                break
+        except Exception as e:
+            print(f"❌ Startup warm-up failed: {e}")
+        
+        print(f"⏳ Retrying config load in {CONFIG_STARTUP_RETRY_SECONDS}s")
+        time.sleep(CONFIG_STARTUP_RETRY_SECONDS)
     
+    print(f"✅ Config loaded, ready to serve (generation {system.config_generation})")
+    start_generation_listener()
+    start_config_watcher()
+
+
 @app.on_event("startup")
 async def startup_event():
-    """서버 시작 시 DB 초기화 및 설정 로드"""
+    """
+    서버 시작 시 DB 초기화 및 설정 로드
+    CONFIG_STARTUP_MODE=background이면 설정 로드를 백그라운드로 돌리고 바로 요청을 받음
+    """
     config_files = get_config_files()
     if not config_files:
         raise RuntimeError(f"Error: No config files found in '{CONFIG_DIR}' directory!")
@@ -265,53 +604,43 @@ async def startup_event():
     # DB 테이블 생성
     init_db()
     
-    # 모든 설정 파일을 통합하여 DB에 로드
-    db = next(get_db())
-    try:
-        load_all_configs_to_db(db)
+    if CONFIG_STARTUP_MODE == "background":
+        threading.Thread(target=warm_up, name="config-warm-up", daemon=True).start()
+    else:
+        # 모든 설정 파일을 통합하여 DB에 로드
+        db = next(get_db())
+        try:
+            startup_stats = load_configs_on_startup(db)
+            system.mark_config_loaded(startup_stats["generation"])
+            
+            # 기본 사용자 생성 (없으면)
+            create_default_users(db)
+        finally:
+            db.close()
         
-        # 기본 사용자 생성 (없으면)
-        if db.query(User).count() == 0:
-            default_users = [
-                User(
-                    username="admin",
-                    email="admin@tmax.com",
-                    hashed_password=get_password_hash("admin"),
-                    full_name="System Administrator",
-                    role=UserRole.ADMIN
-                ),
-                User(
-                    username="service",
-                    email="service@tmax.com",
-                    hashed_password=get_password_hash("service"),
-                    full_name="Service Team",
-                    role=UserRole.INFRASTRUCTURE
-                ),
-                User(
-                    username="monitoring",
-                    email="monitoring@tmax.com",
-                    hashed_password=get_password_hash("monitoring"),
-                    full_name="Monitoring User",
-                    role=UserRole.DEVELOPER
-                )
-            ]
-            for user in default_users:
-                db.add(user)
-            db.commit()
-            print("✅ Default users created")
-    finally:
-        db.close()
+        start_generation_listener()
+        start_config_watcher()
     
     print("==================================================")
     print("🚀 Tmax Monitoring Dashboard Starting...")
     print("==================================================")
     print(f"📁 Config files: {', '.join(get_config_files())}")
     print(f"💾 Database: PostgreSQL")
+    print(f"⏱️ Startup mode: {CONFIG_STARTUP_MODE}")
     print(f"🌐 Backend URL: http://localhost:8080")
     print(f"🔧 API URL: http://localhost:8080/api/config")
     print("==================================================")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """config 파일 감시, 세대 알림 수신 중지"""
+    if system.config_watcher is not None:
+        system.config_watcher.stop()
+    if system.generation_listener is not None:
+        system.generation_listener.stop()
+
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(config.router)
@@ -320,6 +649,7 @@ app.include_router(services.router)
 app.include_router(performance.router)
 app.include_router(export.router)
 app.include_router(gateways.router)
+app.include_router(capacity.router)
 app.include_router(users.router)
 app.include_router(system.router)
 
@@ -337,10 +667,34 @@ async def home():
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트 (Kubernetes 프로브용)"""
+    """헬스 체크 엔드포인트 (Kubernetes liveness 프로브용, 설정 로드 중에도 응답)"""
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    준비 상태 엔드포인트 (Kubernetes readiness 프로브용)
+    설정이 한 번 이상 로드됐으면 200, 아직 로드 중이면 503과 진행 상황
+    """
+    if system.config_generation > 0:
+        return {
+            "status": "ready",
+            "generation": system.config_generation,
+            "last_update": system.get_last_update().isoformat()
+        }
+    
+    job = system.startup_job
+    return JSONResponse(
+        status_code=503,
+        content={
+            "status": "warming_up",
+            "generation": 0,
+            "startup_job": job.to_dict() if job else None
+        }
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8080)
@@ -52,6 +52,15 @@ class Domain(Base):
     loglvl = Column(String, nullable=True)
     # 추가 속성들을 JSON으로 저장할 수도 있지만, 명확하게 컬럼으로 정의
     attributes = Column(Text)  # JSON 문자열로 저장
+    # 용량 집계용 정수 값 (원본 문자열을 숫자로 변환, 숫자가 아니면 NULL)
+    maxuser_num = Column(Integer)
+    maxnode_num = Column(Integer)
+    maxsvg_num = Column(Integer)
+    maxsvr_num = Column(Integer)
+    maxsvc_num = Column(Integer)
+    maxgw_num = Column(Integer)
+    maxsession_num = Column(Integer)
+    row_hash = Column(String)  # 증분 리로드용 행 내용 해시
 
 
 class Node(Base):
@@ -65,6 +74,10 @@ class Node(Base):
     max_svr = Column(String)
     max_user = Column(String)
     tmax_home = Column(String)
+    # 용량 집계용 정수 값 (원본 문자열을 숫자로 변환, 숫자가 아니면 NULL)
+    max_svr_num = Column(Integer)
+    max_user_num = Column(Integer)
+    row_hash = Column(String)  # 증분 리로드용 행 내용 해시
     
     # 관계
     server_groups = relationship("SvrGroup", back_populates="node")
@@ -76,11 +89,12 @@ class SvrGroup(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True)
-    node_name = Column(String, ForeignKey("nodes.name"))
+    node_name = Column(String, ForeignKey("nodes.name"), index=True)
     backup = Column(String)
     cousin = Column(String)
     restart = Column(String)
     autobackup = Column(String)
+    row_hash = Column(String)  # 증분 리로드용 행 내용 해시
     
     # 관계
     node = relationship("Node", back_populates="server_groups")
@@ -93,8 +107,8 @@ class Server(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
-    svg_name = Column(String, ForeignKey("svrgroups.name"))
-    node_name = Column(String)
+    svg_name = Column(String, ForeignKey("svrgroups.name"), index=True)
+    node_name = Column(String, index=True)
     min_proc = Column(String)
     max_proc = Column(String)
     restart = Column(String)
@@ -102,6 +116,12 @@ class Server(Base):
     asqcount = Column(String)   # INFRASTRUCTURE 이상만 볼 수 있음
     clopt = Column(Text)  # CLOPT 전체 값
     db_info = Column(String)  # DB 연결 정보 (예: DBU01:CORCON1), INFRASTRUCTURE 이상만 볼 수 있음
+    # 용량 집계용 정수 값 (원본 문자열을 숫자로 변환, 숫자가 아니면 NULL)
+    min_proc_num = Column(Integer)
+    max_proc_num = Column(Integer)
+    maxqcount_num = Column(Integer)
+    asqcount_num = Column(Integer)
+    row_hash = Column(String)  # 증분 리로드용 행 내용 해시
     
     # 관계
     svrgroup = relationship("SvrGroup", back_populates="servers")
@@ -113,10 +133,11 @@ class Service(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True)
-    server_name = Column(String)  # ForeignKey 제거
+    server_name = Column(String, index=True)  # ForeignKey 제거
     timeout = Column(String)
     autotran = Column(String)
     export = Column(String)
+    row_hash = Column(String)  # 증분 리로드용 행 내용 해시
 
 
 class Gateway(Base):
@@ -138,3 +159,17 @@ class Gateway(Base):
     cpc = Column(String, nullable=True)
     restart = Column(String, nullable=True)
     clopt = Column(String, nullable=True)
+    row_hash = Column(String)  # 증분 리로드용 행 내용 해시
+
+
+class ConfigGeneration(Base):
+    """config 적재 세대 (DB 내용을 바꾼 로드마다 한 행)"""
+    __tablename__ = "config_generations"
+    
+    id = Column(Integer, primary_key=True, index=True)  # 세대 번호
+    content_hash = Column(String, nullable=False, index=True)  # config 파일 + 적재 컬럼 구성 해시
+    files = Column(Integer)
+    mode = Column(String)
+    loaded_by = Column(String)  # 적재한 호스트(파드) 이름
+    loaded_at = Column(DateTime, default=datetime.utcnow)
+    summary = Column(Text)  # /api/config 요약 (JSON, 세대별로 적재 시 계산)
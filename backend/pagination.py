@@ -0,0 +1,81 @@
+"""
+목록 API 공통 처리: keyset 페이지네이션과 필드 선택
+- limit/after: id 순서로 after보다 큰 행을 limit개 반환하고 다음 페이지 커서(next_after)를 돌려줌
+  limit이 없으면 기존처럼 전체를 반환 (after만 있으면 id > after인 나머지 전체를 id 순서로)
+- fields=a,b: 응답 항목에 지정한 필드만 넣고 DB에서도 해당 컬럼만 읽음 (load_only)
+- total: 전체 조회에서는 항목 수, 페이지 조회에서는 include_total=true일 때만 COUNT 쿼리로 계산
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Query, load_only
+
+# 한 페이지 최대 행 수
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "5000"))
+
+
+def select_fields(fields: Optional[str], available: Sequence[str]) -> List[str]:
+    """fields 파라미터 -> 응답 필드 목록 (available 순서 유지, 없으면 전체)"""
+    if not fields:
+        return list(available)
+    
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(available)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))} (available: {', '.join(available)})"
+        )
+    return [field for field in available if field in requested]
+
+
+def column_options(model: Any, selected: Sequence[str], field_columns: Dict[str, str], extra: Sequence[str] = ()):
+    """선택한 필드의 컬럼만 읽는 load_only 옵션 (id와 extra 컬럼은 항상 포함)"""
+    names = ["id", *extra, *[field_columns[field] for field in selected if field_columns.get(field)]]
+    return load_only(*[getattr(model, name) for name in dict.fromkeys(names)])
+
+
+def keyset_page(query: Query, model: Any, limit: Optional[int], after: Optional[int]) -> Tuple[List[Any], Optional[int]]:
+    """
+    limit이 없으면 전체 행, 있으면 id > after인 행을 id 순서로 limit개
+    limit 없이 after만 주면 id > after인 행 전체를 id 순서로 (커서를 무시하고 처음부터 돌려주지 않음)
+    (행 목록, 다음 페이지 커서) 반환 - 마지막 페이지면 커서는 None
+    """
+    if limit is None:
+        if after is not None:
+            return query.filter(model.id > after).order_by(model.id).all(), None
+        return query.all(), None
+    if limit < 1 or limit > API_MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"limit은 1 ~ {API_MAX_PAGE_SIZE} 이어야 합니다.")
+    
+    if after is not None:
+        query = query.filter(model.id > after)
+    rows = query.order_by(model.id).limit(limit + 1).all()
+    next_after = rows[limit - 1].id if len(rows) > limit else None
+    return rows[:limit], next_after
+
+
+def count_rows(query: Query, model: Any) -> int:
+    """필터만 적용된 쿼리의 전체 행 수 (행을 읽지 않고 COUNT)"""
+    return query.with_entities(func.count(model.id)).order_by(None).scalar()
+
+
+def list_response(
+    key: str,
+    items: List[Dict[str, Any]],
+    limit: Optional[int],
+    next_after: Optional[int],
+    total: Optional[int]
+) -> Dict[str, Any]:
+    """목록 응답 (total은 계산했을 때만, 페이지 정보는 limit을 줬을 때만 포함)"""
+    response = {"success": True, key: items}
+    if total is not None:
+        response["total"] = total
+    if limit is not None:
+        response["limit"] = limit
+        response["next_after"] = next_after
+        response["has_more"] = next_after is not None
+    return response
@@ -0,0 +1,195 @@
+"""
+config 파싱 결과 캐시
+파일 경로, 크기, 수정 시각, 내용 해시가 모두 같으면 이전 파싱 결과를 재사용
+메모리에 보관하고, 캐시 디렉토리가 지정되면 디스크에도 저장
+콜드 스타트용으로 전체 파싱 결과를 바이너리 스냅샷 하나로 저장/복원
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import struct
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+# 디스크 캐시 디렉토리 (비어 있으면 메모리 캐시만 사용)
+CONFIG_CACHE_DIR = os.getenv("CONFIG_CACHE_DIR", "")
+
+# (경로, 크기, mtime_ns, sha256)
+CacheKey = Tuple[str, int, int, str]
+
+# 스냅샷 포맷: 매직 + 버전(uint16) + pickle(protocol 5)
+# 파서 출력 형태가 바뀌면 SNAPSHOT_VERSION을 올려서 이전 스냅샷을 무효화
+SNAPSHOT_MAGIC = b"TPSNAP"
+SNAPSHOT_VERSION = 3
+_SNAPSHOT_HEADER = struct.Struct(">6sH")
+
+# 경로별 마지막으로 계산한 내용 해시 (크기, mtime_ns, sha256)
+# 크기와 수정 시각이 그대로면 파일을 다시 읽지 않음 (리로드마다 전체 파일 해시 생략)
+_file_digests: Dict[str, Tuple[int, int, str]] = {}
+
+
+def file_cache_key(path: str) -> CacheKey:
+    """파일의 캐시 키 계산 (크기나 수정 시각이 바뀐 파일만 다시 해시)"""
+    abspath = os.path.abspath(path)
+    stat = os.stat(abspath)
+    known = _file_digests.get(abspath)
+    if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+        return (abspath, stat.st_size, stat.st_mtime_ns, known[2])
+    
+    digest = hashlib.sha256()
+    with open(abspath, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    sha = digest.hexdigest()
+    _file_digests[abspath] = (stat.st_size, stat.st_mtime_ns, sha)
+    return (abspath, stat.st_size, stat.st_mtime_ns, sha)
+
+
+class ParseCache:
+    """파일별 파싱 결과 캐시 (경로당 최신 결과 하나만 보관)"""
+    
+    def __init__(self, cache_dir: str = ""):
+        self.cache_dir = cache_dir
+        self._entries: Dict[str, Tuple[CacheKey, Dict[str, Any]]] = {}
+    
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """키가 일치하는 파싱 결과 반환 (없으면 None)"""
+        entry = self._entries.get(key[0])
+        if entry and entry[0] == key:
+            return entry[1]
+        
+        entry = self._load(key)
+        if entry and entry[0] == key:
+            self._entries[key[0]] = entry
+            return entry[1]
+        return None
+    
+    def put(self, key: CacheKey, config_data: Dict[str, Any]):
+        """파싱 결과 저장 (같은 경로의 이전 결과는 교체)"""
+        self._entries[key[0]] = (key, config_data)
+        self._store(key, config_data)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def load_snapshot(self, snapshot_path: str, keys: List[CacheKey]) -> int:
+        """
+        스냅샷에서 파싱 결과 복원 (파일명, 크기, 내용 해시가 같은 파일만)
+        복원한 파일 수 반환
+        """
+        snapshot = read_snapshot(snapshot_path)
+        restored = 0
+        for key in keys:
+            config_data = snapshot.get(_source_id(key))
+            if config_data is not None:
+                self._entries[key[0]] = (key, config_data)
+                restored += 1
+        return restored
+    
+    def save_snapshot(self, snapshot_path: str, keys: List[CacheKey]):
+        """주어진 파일들의 캐시된 파싱 결과를 스냅샷으로 저장"""
+        sources = {}
+        for key in keys:
+            entry = self._entries.get(key[0])
+            if entry and entry[0] == key:
+                sources[_source_id(key)] = entry[1]
+        write_snapshot(snapshot_path, sources)
+    
+    def _cache_path(self, path: str) -> str:
+        name = hashlib.sha256(path.encode('utf-8')).hexdigest()
+        # 디스크 캐시도 스냅샷 버전별로 분리 (파서 출력 형태 변경 시 무효화)
+        return os.path.join(self.cache_dir, f"{name}.v{SNAPSHOT_VERSION}.pickle")
+    
+    def _load(self, key: CacheKey) -> Optional[Tuple[CacheKey, Dict[str, Any]]]:
+        """디스크 캐시 읽기 (없거나 손상되면 None)"""
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._cache_path(key[0]), 'rb') as file:
+                return pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+    
+    def _store(self, key: CacheKey, config_data: Dict[str, Any]):
+        """디스크 캐시 쓰기 (임시 파일에 쓴 뒤 교체)"""
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = self._cache_path(key[0])
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                pickle.dump((key, config_data), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️ Parse cache write failed: {e}")
+
+
+def _source_id(key: CacheKey) -> Tuple[str, int, str]:
+    """스냅샷 내 파일 식별자 (파일명, 크기, sha256) - 복사/배포로 바뀌는 mtime은 제외"""
+    return (os.path.basename(key[0]), key[1], key[3])
+
+
+def write_snapshot(snapshot_path: str, sources: Dict[Tuple[str, int, str], Dict[str, Any]]):
+    """파싱 결과 스냅샷 저장 (실패해도 텍스트 파싱으로 동작하므로 경고만 출력)"""
+    try:
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+            pickle.dump(sources, file, protocol=5)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as e:
+        print(f"⚠️ Config snapshot write failed: {e}")
+
+
+def read_snapshot(snapshot_path: str) -> Dict[Tuple[str, int, str], Dict[str, Any]]:
+    """파싱 결과 스냅샷 읽기 (없거나 버전이 다르거나 손상되면 빈 dict)"""
+    try:
+        with open(snapshot_path, 'rb') as file:
+            header = file.read(_SNAPSHOT_HEADER.size)
+            if len(header) != _SNAPSHOT_HEADER.size:
+                return {}
+            magic, version = _SNAPSHOT_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                return {}
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return {}
+
+
+def build_snapshot(
+    config_paths: List[str],
+    snapshot_path: str,
+    parse_file: Callable[[str], Dict[str, Any]]
+) -> int:
+    """config 파일들을 파싱해서 스냅샷으로 저장 (이미지 빌드용, 저장한 파일 수 반환)"""
+    sources = {}
+    for path in config_paths:
+        sources[_source_id(file_cache_key(path))] = parse_file(path)
+    write_snapshot(snapshot_path, sources)
+    return len(sources)
+
+
+parse_cache = ParseCache(CONFIG_CACHE_DIR)
+
+
+def main():
+    """
+    이미지 빌드 시 파싱 결과 스냅샷 미리 생성 (앱 전체 대신 파서와 캐시 모듈만 import)
+    python parse_cache.py --snapshot /app/.tpconfig.snapshot /app/scorap*.m
+    """
+    # 파서는 tpconfig가 import 경로에 있어야 하므로 실행할 때만 import
+    from parser import parse_config_file
+    
+    arg_parser = argparse.ArgumentParser(description="tp_config parse snapshot builder")
+    arg_parser.add_argument("--snapshot", required=True, help="저장할 스냅샷 파일 경로")
+    arg_parser.add_argument("config_files", nargs="+", help="파싱할 config 파일들")
+    args = arg_parser.parse_args()
+    
+    files = build_snapshot(sorted(args.config_files), args.snapshot, parse_config_file)
+    print(f"📦 Config snapshot written: {args.snapshot} ({files} files)")
+
+
+if __name__ == '__main__':
+    main()
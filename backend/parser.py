@@ -3,132 +3,60 @@ TpConfig 파서 모듈
 Tmax tp_config 설정 파일을 파싱하는 Python 모듈
 """
 
-import re
-from typing import Dict, List, Any, Optional
+import os
+from concurrent.futures import Executor
+from typing import Dict, Any, Optional, Iterator, Mapping, Tuple
+
+# 프로젝트 루트의 공용 파싱 모듈(tpconfig) 사용 (import 경로는 main에서 설정)
+from tpconfig.core import iter_entries, parse_config, use_mmap_for
+from tpconfig.shards import parse_config_sharded
+
+# 이 크기(MB) 이상인 config 파일은 mmap 리더로 파싱 (0이면 사용 안 함)
+CONFIG_MMAP_THRESHOLD_MB = int(os.getenv("CONFIG_MMAP_THRESHOLD_MB", "0"))
+
+# 이 크기(MB) 이상인 config 파일 하나는 샤드로 나눠 여러 프로세스에서 파싱 (0이면 사용 안 함)
+CONFIG_SHARD_THRESHOLD_MB = int(os.getenv("CONFIG_SHARD_THRESHOLD_MB", "0"))
+
+# 1이면 엔트리를 dict 대신 __slots__ 레코드(문자열 intern)로 생성
+CONFIG_COMPACT_RECORDS = os.getenv("CONFIG_COMPACT_RECORDS", "0") == "1"
 
 
 class TpConfigParser:
     """tp_config 파서 클래스"""
     
-    def __init__(self, config_file: str):
+    def __init__(self, config_file: str, use_mmap: bool = False, compact: bool = False):
         self.config_file = config_file
+        self.use_mmap = use_mmap
+        self.compact = compact
     
     def parse(self) -> Dict[str, Any]:
-        """설정 파일 파싱"""
-        config_data = {
-            "domain": {},
-            "node": {},
-            "svrgroup": {},
-            "server": {},
-            "service": {},
-            "gateway": {}
-        }
-        
-        current_section = ""
-        current_entry_name = ""
-        current_entry_lines = []
-        
-        with open(self.config_file, 'r', encoding='utf-8', errors='ignore') as file:
-            for line in file:
-                stripped = line.strip()
-                
-                # 섹션 헤더 감지
-                if stripped.startswith("*"):
-                    # 이전 엔트리 저장
-                    if current_entry_name and current_entry_lines:
-                        self._save_entry(
-                            config_data,
-                            current_section,
-                            current_entry_name,
-                            current_entry_lines
-                        )
-                    
-                    current_section = stripped[1:]  # Remove *
-                    current_entry_name = ""
-                    current_entry_lines = []
-                    continue
-                
-                # 빈 줄이나 주석 무시
-                if not stripped or stripped.startswith("#") or stripped.startswith("//"):
-                    continue
-                
-                # 새로운 엔트리인지 확인 (들여쓰기 없음)
-                if line and not line[0].isspace():
-                    # 이전 엔트리 저장
-                    if current_entry_name and current_entry_lines:
-                        self._save_entry(
-                            config_data,
-                            current_section,
-                            current_entry_name,
-                            current_entry_lines
-                        )
-                    
-                    # 새 엔트리 시작
-                    parts = stripped.split()
-                    if parts:
-                        current_entry_name = parts[0]
-                        current_entry_lines = [stripped]
-                else:
-                    # 현재 엔트리에 줄 추가
-                    if current_entry_name:
-                        current_entry_lines.append(stripped)
-        
-        # 마지막 엔트리 저장
-        if current_entry_name and current_entry_lines:
-            self._save_entry(
-                config_data,
-                current_section,
-                current_entry_name,
-                current_entry_lines
-            )
-        
+        """
+        설정 파일 파싱 (공용 코어 결과를 그대로 사용, 섹션 키는 소문자)
+        같은 패스에서 만든 관계 인덱스는 config_data["indexes"]에 넣는다.
+        """
+        config_data, index = parse_config(
+            self.config_file,
+            use_mmap=self.use_mmap,
+            compact=self.compact,
+            drop_empty=True
+        )
+        config_data["indexes"] = index.as_dict()
         return config_data
     
-    def _save_entry(
-        self,
-        config_data: Dict[str, Any],
-        section: str,
-        name: str,
-        lines: List[str]
-    ):
-        """엔트리 저장"""
-        if not section or not name:
-            return
-        
-        # 모든 줄을 하나로 합치기
-        full_text = " ".join(lines)
-        
-        # 속성 파싱
-        attrs = {"name": name}
-        
-        # KEY = VALUE 패턴 파싱
-        pattern = r'(\w+)\s*=\s*([^,]+?)(?:\s*,|\s*$)'
-        matches = re.findall(pattern, full_text)
-        
-        for key, value in matches:
-            key = key.strip()
-            value = value.strip().strip('"\'')
-            if value:
-                attrs[key] = value
-        
-        # 섹션별 저장
-        section_lower = section.lower()
-        
-        if section_lower == "domain":
-            if not config_data["domain"]:
-                config_data["domain"] = attrs
-        elif section_lower == "node":
-            config_data["node"][name] = attrs
-        elif section_lower == "svrgroup":
-            config_data["svrgroup"][name] = attrs
-        elif section_lower == "server":
-            if name not in config_data["server"]:
-                config_data["server"][name] = []
-            config_data["server"][name].append(attrs)
-        elif section_lower == "service":
-            config_data["service"][name] = attrs
-        elif section_lower == "gateway":
-            config_data["gateway"][name] = attrs
+    def iter_entries(self) -> Iterator[Tuple[str, str, Mapping[str, str]]]:
+        """
+        설정 파일을 엔트리 단위로 스트리밍 파싱
+        엔트리가 끝나는 즉시 (section, name, attrs) 튜플을 yield 한다.
+        section은 소문자 섹션명 (예: "server"), 전체 트리를 메모리에 만들지 않음
+        use_mmap이면 원본 바이트를 mmap으로 스캔 (결과는 텍스트 경로와 동일)
+        compact이면 attrs는 dict 대신 __slots__ 레코드 (get/[]/items 동일)
+        """
+        return iter_entries(
+            self.config_file,
+            use_mmap=self.use_mmap,
+            compact=self.compact,
+            drop_empty=True
+        )
     
     def get_summary(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """설정 요약 정보 반환"""
@@ -161,12 +89,10 @@ class TpConfigParser:
         if not node_data:
             return None
         
-        # 이 노드에 속한 서버 그룹 찾기
-        server_groups = []
-        for svg_name, svg_data in config_data["svrgroup"].items():
-            node_name_in_svg = svg_data.get("NODENAME", "").strip('"')
-            if node_name_in_svg == node_name:
-                server_groups.append(svg_name)
+        # 이 노드에 속한 서버 그룹 (파싱 시 만든 인덱스 사용)
+        server_groups = list(
+            config_data["indexes"]["svrgroups_by_node"].get(node_name, [])
+        )
         
         return {
             "node_name": node_name,
@@ -184,18 +110,15 @@ class TpConfigParser:
         if not svg_data:
             return None
         
-        # 이 서버 그룹에 속한 서버들 찾기
+        # 이 서버 그룹에 속한 서버들 (파싱 시 만든 인덱스 사용, 파일 순서)
         servers = []
-        for srv_name, srv_list in config_data["server"].items():
-            for srv_data in srv_list:
-                srv_svg_name = srv_data.get("SVGNAME", "").strip('"')
-                if srv_svg_name == svg_name:
-                    servers.append({
-                        "name": srv_name,
-                        "min": srv_data.get("MIN", ""),
-                        "max": srv_data.get("MAX", ""),
-                        "restart": srv_data.get("RESTART", "")
-                    })
+        for srv_data in config_data["indexes"]["servers_by_svrgroup"].get(svg_name, []):
+            servers.append({
+                "name": srv_data["name"],
+                "min": srv_data.get("MIN", ""),
+                "max": srv_data.get("MAX", ""),
+                "restart": srv_data.get("RESTART", "")
+            })
         
         backup = svg_data.get("BACKUP", "N/A")
         if not backup:
@@ -214,3 +137,33 @@ class TpConfigParser:
             "autobackup": svg_data.get("AUTOBACKUP", ""),
             "servers": servers
         }
+
+
+def parse_config_file(config_file: str) -> Dict[str, Any]:
+    """config 파일 하나 파싱 (프로세스 풀 작업 단위로 사용)"""
+    return TpConfigParser(
+        config_file,
+        use_mmap=use_mmap_for(config_file, CONFIG_MMAP_THRESHOLD_MB),
+        compact=CONFIG_COMPACT_RECORDS
+    ).parse()
+
+
+def use_shards_for(config_file: str) -> bool:
+    """CONFIG_SHARD_THRESHOLD_MB 이상인 파일인지 (샤드 병렬 파싱 대상)"""
+    return (
+        CONFIG_SHARD_THRESHOLD_MB > 0
+        and os.path.getsize(config_file) >= CONFIG_SHARD_THRESHOLD_MB * 1024 * 1024
+    )
+
+
+def parse_config_file_sharded(config_file: str, executor: Executor, shards: int) -> Dict[str, Any]:
+    """큰 config 파일 하나를 샤드로 나눠 executor에서 병렬 파싱 (결과는 parse_config_file과 동일)"""
+    config_data, index = parse_config_sharded(
+        config_file,
+        executor,
+        shards,
+        compact=CONFIG_COMPACT_RECORDS,
+        drop_empty=True
+    )
+    config_data["indexes"] = index.as_dict()
+    return config_data
@@ -0,0 +1,212 @@
+"""
+설정 리로드 백그라운드 작업
+리로드 요청은 작업 ID를 바로 돌려주고, 실제 파싱/DB 반영은 워커 스레드에서 실행한다.
+실행 중인 작업이 있으면 새 요청은 그 작업에 합쳐진다. 단, 실행 중인 작업이 full이 아닌데
+full 요청이 오면 합치지 않고 현재 작업이 끝난 뒤 실행할 후속 작업 하나에 모은다.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 상태 조회용으로 보관하는 완료된 작업 수
+MAX_FINISHED_JOBS = 20
+
+
+class ReloadProgress:
+    """리로드 진행 상황 보고 인터페이스 (기본 구현은 아무것도 하지 않음)"""
+    
+    def set_phase(self, phase: str):
+        pass
+    
+    def set_files_total(self, count: int):
+        pass
+    
+    def add_files_processed(self, count: int = 1):
+        pass
+    
+    def add_rows_written(self, count: int):
+        pass
+
+
+# 진행 상황을 보고하지 않을 때 사용
+NO_PROGRESS = ReloadProgress()
+
+
+class ReloadJob(ReloadProgress):
+    """리로드 작업 하나의 상태"""
+    
+    def __init__(self, mode: Optional[str], requested_by: str, queued_after: Optional[str] = None):
+        self.job_id = uuid.uuid4().hex
+        self.mode = mode
+        self.requested_by = [requested_by]
+        # 앞 작업이 끝나야 시작하는 후속 작업이면 앞 작업 ID
+        self.queued_after = queued_after
+        self.status = "running"  # running / succeeded / failed
+        self.phase = "queued"
+        self.files_total = 0
+        self.files_processed = 0
+        self.rows_written = 0
+        self.created_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self._started = time.perf_counter()
+        self._elapsed: Optional[float] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+    
+    def set_phase(self, phase: str):
+        with self._lock:
+            self.phase = phase
+    
+    def set_files_total(self, count: int):
+        with self._lock:
+            self.files_total = count
+    
+    def add_files_processed(self, count: int = 1):
+        with self._lock:
+            self.files_processed += count
+    
+    def add_rows_written(self, count: int):
+        with self._lock:
+            self.rows_written += count
+    
+    def add_requester(self, requested_by: str):
+        """실행 중인 작업 (또는 후속 작업)에 합쳐진 요청자 기록"""
+        with self._lock:
+            self.requested_by.append(requested_by)
+    
+    def finish(self, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        """작업 종료 처리 (error가 있으면 실패)"""
+        with self._lock:
+            self.status = "failed" if error else "succeeded"
+            self.phase = "failed" if error else "done"
+            self.result = result
+            self.error = error
+            self.finished_at = datetime.utcnow()
+            self._elapsed = time.perf_counter() - self._started
+        self._done.set()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """작업이 끝날 때까지 대기 (timeout 안에 끝나면 True)"""
+        return self._done.wait(timeout)
+    
+    @property
+    def running(self) -> bool:
+        return self.status == "running"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 조회 응답"""
+        with self._lock:
+            elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._started
+            return {
+                "job_id": self.job_id,
+                "status": self.status,
+                "phase": self.phase,
+                "mode": self.mode,
+                "queued_after": self.queued_after,
+                "requested_by": list(self.requested_by),
+                "files_total": self.files_total,
+                "files_processed": self.files_processed,
+                "rows_written": self.rows_written,
+                "elapsed_seconds": round(elapsed, 3),
+                "created_at": self.created_at.isoformat(),
+                "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+                "error": self.error,
+                "result": self.result
+            }
+
+
+def covers(job_mode: Optional[str], requested_mode: Optional[str]) -> bool:
+    """job_mode 작업이 requested_mode 요청을 대신할 수 있는지 (full 요청은 full 작업만 대신함)"""
+    return requested_mode != "full" or job_mode == "full"
+
+
+class ReloadJobManager:
+    """리로드 작업 실행/조회 (한 번에 하나만 실행, 후속 작업은 최대 하나)"""
+    
+    def __init__(self, runner: Callable[[ReloadJob], Dict[str, Any]]):
+        # runner(job): 워커 스레드에서 실제 리로드 실행, 결과 dict 반환
+        self.runner = runner
+        self.jobs: "OrderedDict[str, ReloadJob]" = OrderedDict()
+        self.current: Optional[ReloadJob] = None
+        # 현재 작업이 끝나면 시작할 후속 작업 (실행 중인 작업이 대신할 수 없는 요청을 모음)
+        self.pending: Optional[ReloadJob] = None
+        self._lock = threading.Lock()
+    
+    def submit(
+        self,
+        mode: Optional[str],
+        requested_by: str,
+        runner: Optional[Callable[[ReloadJob], Dict[str, Any]]] = None
+    ) -> Tuple[ReloadJob, bool]:
+        """
+        리로드 요청 (job, merged) 반환
+        실행 중인 작업이 요청을 대신할 수 있으면 그 작업을 돌려줌 (merged=True)
+        대신할 수 없으면 (incremental 실행 중 full 요청) 후속 작업을 만들거나 기존 후속 작업에 합침
+        (새로 만든 후속 작업은 merged=False, job.queued_after에 앞 작업 ID)
+        runner를 주면 기본 runner 대신 사용 (예: 시작 로드)
+        """
+        with self._lock:
+            if self.pending is not None:
+                # 후속 작업은 항상 full이라 어떤 요청이든 대신할 수 있음 (앞 작업이 끝나는 중이어도 곧 시작됨)
+                self.pending.add_requester(requested_by)
+                return self.pending, True
+            
+            if self.current is not None and self.current.running:
+                if covers(self.current.mode, mode):
+                    self.current.add_requester(requested_by)
+                    return self.current, True
+                job = ReloadJob(mode, requested_by, queued_after=self.current.job_id)
+                self.pending = job
+                self.jobs[job.job_id] = job
+                return job, False
+            
+            job = ReloadJob(mode, requested_by)
+            self.current = job
+            self.jobs[job.job_id] = job
+            self._trim()
+        
+        self._start(job, runner or self.runner)
+        return job, False
+    
+    def _start(self, job: ReloadJob, runner: Callable[[ReloadJob], Dict[str, Any]]):
+        thread = threading.Thread(target=self._run, args=(job, runner), name=f"reload-{job.job_id[:8]}", daemon=True)
+        thread.start()
+    
+    def get(self, job_id: str) -> Optional[ReloadJob]:
+        with self._lock:
+            return self.jobs.get(job_id)
+    
+    def list(self) -> List[ReloadJob]:
+        with self._lock:
+            return list(self.jobs.values())
+    
+    def _run(self, job: ReloadJob, runner: Callable[[ReloadJob], Dict[str, Any]]):
+        try:
+            result = runner(job)
+        except Exception as e:
+            print(f"❌ Config reload job {job.job_id} failed: {e}")
+            job.finish(error=str(e))
+        else:
+            job.finish(result=result)
+        
+        # 후속 작업이 있으면 이어서 실행 (후속 작업은 항상 기본 runner)
+        with self._lock:
+            next_job = self.pending
+            self.pending = None
+            if next_job is not None:
+                self.current = next_job
+                self._trim()
+        if next_job is not None:
+            self._start(next_job, self.runner)
+    
+    def _trim(self):
+        """오래된 완료 작업 정리 (실행 중인 작업은 유지)"""
+        finished = [job_id for job_id, job in self.jobs.items() if not job.running]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
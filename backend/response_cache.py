@@ -0,0 +1,165 @@
+"""
+읽기 API 응답 캐시 (config 세대별)
+config 데이터는 리로드 때만 바뀌므로 직렬화한 JSON 응답을 (경로, 쿼리 파라미터, 사용자 role, 세대) 키로
+메모리에 보관한다. LRU로 RESPONSE_CACHE_MAX_MB 안에서 유지하고, 세대가 바뀌면 전부 비운다.
+세대에서 만든 강한 ETag를 붙이고 If-None-Match가 같으면 본문 없이 304를 반환한다.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from routers import system
+
+# 응답 캐시 최대 크기 (MB, 0이면 캐시 사용 안 함 - ETag/304는 계속 동작)
+RESPONSE_CACHE_MAX_MB = float(os.getenv("RESPONSE_CACHE_MAX_MB", "64"))
+
+# (경로, 정렬된 쿼리 파라미터, role, 세대)
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], str, int]
+
+
+class ResponseCache:
+    """직렬화된 응답 본문 LRU 캐시 (바이트 수 제한)"""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.clears = 0
+    
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+    
+    def put(self, key: CacheKey, body: bytes):
+        """본문 저장 (캐시 크기보다 큰 본문은 저장하지 않음), 넘치면 오래 안 쓴 것부터 제거"""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = body
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+    
+    def clear(self, generation: Optional[int] = None):
+        """전체 비우기 (세대 변경 콜백으로도 사용)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.clears += 1
+    
+    def count_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.max_bytes > 0,
+                "generation": system.config_generation,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "not_modified": self.not_modified,
+                "evictions": self.evictions,
+                "clears": self.clears
+            }
+
+
+response_cache = ResponseCache(int(RESPONSE_CACHE_MAX_MB * 1024 * 1024))
+
+# 세대가 바뀌면 (로컬 리로드 또는 다른 레플리카 알림) 이전 세대 응답 제거
+system.on_generation_change(response_cache.clear)
+
+
+def make_etag(key: CacheKey) -> str:
+    """강한 ETag: 세대 + 요청(경로, 파라미터, role) 해시"""
+    path, params, role, generation = key
+    digest = hashlib.blake2b(repr((path, params, role)).encode("utf-8"), digest_size=8).hexdigest()
+    return f'"g{generation}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 있는지 (*, 약한 ETag W/ 표기 포함)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cached_response(endpoint: Callable) -> Callable:
+    """
+    읽기 엔드포인트 응답 캐시 데코레이터 (@router.get 아래에 사용)
+    current_user 파라미터가 있으면 role별로 따로 캐시 (없으면 public)
+    세대 0(아직 로드 전)이면 캐시/ETag 없이 그대로 실행
+    """
+    signature = inspect.signature(endpoint)
+    parameters = list(signature.parameters.values())
+    # 요청 경로/쿼리/헤더를 받기 위한 Request 파라미터 추가 (FastAPI가 주입)
+    parameters.append(inspect.Parameter("cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+    
+    @functools.wraps(endpoint)
+    async def wrapper(*args, cache_request: Request, **kwargs):
+        generation = system.config_generation
+        if not generation:
+            return await endpoint(*args, **kwargs)
+        
+        user = kwargs.get("current_user")
+        role = user.role.value if user is not None else "public"
+        key = (
+            cache_request.url.path,
+            tuple(sorted(cache_request.query_params.multi_items())),
+            role,
+            generation
+        )
+        etag = make_etag(key)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        
+        if etag_matches(cache_request.headers.get("if-none-match"), etag):
+            response_cache.count_not_modified()
+            return Response(status_code=304, headers=headers)
+        
+        body = response_cache.get(key) if response_cache.max_bytes > 0 else None
+        if body is None:
+            result = await endpoint(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            body = JSONResponse(content=jsonable_encoder(result)).body
+            if response_cache.max_bytes > 0:
+                response_cache.put(key, body)
+        
+        return Response(content=body, media_type="application/json", headers=headers)
+    
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    return wrapper
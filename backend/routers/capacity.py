@@ -0,0 +1,114 @@
+"""용량 집계 라우터 (노드/서버그룹별 프로세스 수 합계/최대값을 SQL GROUP BY로 계산)"""
+from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from typing import Any, Dict
+
+from database import get_db
+from models import Domain, Node, SvrGroup, Server, User, UserRole
+from auth import get_current_active_user
+
+router = APIRouter(prefix="/api", tags=["capacity"])
+
+# 서버 용량 집계 항목 (정수 컬럼 기준, 숫자가 아닌 값은 NULL이라 집계에서 제외)
+SERVER_AGGREGATES = ("servers", "min_proc_total", "max_proc_total", "max_proc_max")
+
+# INFRASTRUCTURE 이상만 볼 수 있는 집계 항목
+RESTRICTED_AGGREGATES = ("maxqcount_total", "maxqcount_max", "asqcount_total")
+
+
+def _server_aggregates():
+    """서버 집계 컬럼 (SERVER_AGGREGATES + RESTRICTED_AGGREGATES 순서)"""
+    return [
+        func.count(Server.id).label("servers"),
+        func.coalesce(func.sum(Server.min_proc_num), 0).label("min_proc_total"),
+        func.coalesce(func.sum(Server.max_proc_num), 0).label("max_proc_total"),
+        func.max(Server.max_proc_num).label("max_proc_max"),
+        func.coalesce(func.sum(Server.maxqcount_num), 0).label("maxqcount_total"),
+        func.max(Server.maxqcount_num).label("maxqcount_max"),
+        func.coalesce(func.sum(Server.asqcount_num), 0).label("asqcount_total"),
+    ]
+
+
+def _aggregate_values(row: Any, restricted: bool) -> Dict[str, Any]:
+    """집계 결과 행 -> dict (서버가 없는 그룹/노드는 0, 최대값은 None)"""
+    names = SERVER_AGGREGATES + (RESTRICTED_AGGREGATES if restricted else ())
+    values = {}
+    for name in names:
+        value = getattr(row, name)
+        values[name] = value if value is not None or name.endswith("_max") else 0
+    return values
+
+
+@router.get("/capacity")
+async def get_capacity(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    노드/서버그룹별 용량 집계 (서버 수, MIN/MAX 프로세스 합계, MAX 최대값)
+    서버의 노드는 서버그룹의 NODENAME 기준, INFRASTRUCTURE 이상은 MAXQCOUNT/ASQCOUNT 집계도 포함
+    """
+    restricted = current_user.role in [UserRole.INFRASTRUCTURE, UserRole.ADMIN]
+    
+    # 서버그룹별 집계 (서버가 없는 그룹도 포함)
+    svg_rows = (
+        db.query(SvrGroup.name, SvrGroup.node_name, *_server_aggregates())
+        .outerjoin(Server, Server.svg_name == SvrGroup.name)
+        .group_by(SvrGroup.id, SvrGroup.name, SvrGroup.node_name)
+        .order_by(SvrGroup.id)
+        .all()
+    )
+    
+    # 노드별 집계: 서버그룹 수와 서버 집계를 각각 GROUP BY 후 노드에 붙임
+    svg_counts = (
+        select(SvrGroup.node_name, func.count(SvrGroup.id).label("server_groups"))
+        .group_by(SvrGroup.node_name)
+        .subquery()
+    )
+    node_stats = (
+        select(SvrGroup.node_name, *_server_aggregates())
+        .select_from(SvrGroup)
+        .join(Server, Server.svg_name == SvrGroup.name)
+        .group_by(SvrGroup.node_name)
+        .subquery()
+    )
+    node_rows = (
+        db.query(
+            Node.name,
+            Node.max_svr_num,
+            Node.max_user_num,
+            svg_counts.c.server_groups,
+            *[node_stats.c[name] for name in SERVER_AGGREGATES + RESTRICTED_AGGREGATES]
+        )
+        .outerjoin(svg_counts, svg_counts.c.node_name == Node.name)
+        .outerjoin(node_stats, node_stats.c.node_name == Node.name)
+        .order_by(Node.id)
+        .all()
+    )
+    
+    # 전체 합계와 도메인 한도
+    total_row = db.query(*_server_aggregates()).select_from(Server).one()
+    domain = db.query(Domain.maxsvr_num, Domain.maxsvg_num, Domain.maxuser_num).first()
+    
+    return {
+        "success": True,
+        "nodes": [{
+            "node": row.name,
+            "max_svr": row.max_svr_num,
+            "max_user": row.max_user_num,
+            "server_groups": row.server_groups or 0,
+            **_aggregate_values(row, restricted)
+        } for row in node_rows],
+        "server_groups": [{
+            "svg_name": row.name,
+            "node": row.node_name,
+            **_aggregate_values(row, restricted)
+        } for row in svg_rows],
+        "totals": {
+            "domain_max_svr": domain.maxsvr_num if domain else None,
+            "domain_max_svg": domain.maxsvg_num if domain else None,
+            "domain_max_user": domain.maxuser_num if domain else None,
+            **_aggregate_values(total_row, restricted)
+        }
+    }
@@ -1,11 +1,16 @@
 """설정, 노드, 서버그룹 관련 라우터"""
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from sqlalchemy.orm import Session, selectinload
+from typing import Optional
 
 from database import get_db
-from models import Domain, Node, SvrGroup, Server, Service, Gateway, User
+from models import Node, SvrGroup, Server, User
 from auth import get_current_active_user
+from pagination import column_options, count_rows, keyset_page, list_response, select_fields
 from routers import system
+from response_cache import cached_response, etag_matches, response_cache
+import config_summary
+import full_config
 
 router = APIRouter(prefix="/api", tags=["config"])
 
@@ -15,41 +20,11 @@ async def get_config(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """설정 요약 정보 반환 (모든 로그인 사용자)"""
-    nodes = db.query(Node).all()
-    svrgroups = db.query(SvrGroup).all()
-    servers = db.query(Server).all()
-    services = db.query(Service).all()
-    gateways = db.query(Gateway).all()
-    domains = db.query(Domain).all()
-    
-    # 첫 번째 도메인 정보 사용 (호환성 유지)
-    domain = domains[0] if domains else None
-    
-    summary = {
-        "domain_id": domain.domain_id if domain else "",
-        "domain_name": domain.name if domain else "N/A",
-        "domain_shmkey": domain.shmkey if domain else None,
-        "domain_tportno": domain.tportno if domain else None,
-        "domain_racport": domain.racport if domain else None,
-        "domain_maxuser": domain.maxuser if domain else None,
-        "domain_maxnode": domain.maxnode if domain else None,
-        "domain_maxsvg": domain.maxsvg if domain else None,
-        "domain_maxsvr": domain.maxsvr if domain else None,
-        "domain_maxsvc": domain.maxsvc if domain else None,
-        "domain_maxgw": domain.maxgw if domain else None,
-        "domain_maxsession": domain.maxsession if domain else None,
-        "domain_security": domain.security if domain else None,
-        "domain_loglvl": domain.loglvl if domain else None,
-        "total_domains": len(domains),
-        "total_nodes": len(nodes),
-        "total_server_groups": len(svrgroups),
-        "total_servers": len(servers),
-        "total_services": len(services),
-        "total_gateways": len(gateways),
-        "nodes": [node.name for node in nodes],
-        "server_groups": [svg.name for svg in svrgroups[:20]]
-    }
+    """
+    설정 요약 정보 반환 (모든 로그인 사용자)
+    요약은 리로드 때 세대별로 계산해 둔 값을 사용하므로 요청 시 config 테이블을 읽지 않음
+    """
+    summary = config_summary.get_summary(db, system.config_generation)
     
     return {
         "success": True,
@@ -59,58 +34,27 @@ async def get_config(
 
 
 @router.get("/config/full")
-async def get_full_config(db: Session = Depends(get_db)):
-    """전체 설정 데이터 반환"""
-    nodes = db.query(Node).all()
-    svrgroups = db.query(SvrGroup).all()
-    servers = db.query(Server).all()
-    services = db.query(Service).all()
-    gateways = db.query(Gateway).all()
-    domain = db.query(Domain).first()
+async def get_full_config(request: Request, db: Session = Depends(get_db)):
+    """
+    전체 설정 데이터 반환
+    세대별로 미리 직렬화/압축해 둔 본문 중 Accept-Encoding에 맞는 것을 그대로 전송 (gzip, br)
+    """
+    generation = system.config_generation
+    payload = full_config.get_payload(db, generation)
+    encoding, body = payload.select(request.headers.get("accept-encoding"))
     
-    return {
-        "success": True,
-        "data": {
-            "domain": {
-                "domain_id": domain.domain_id if domain else "",
-                "name": domain.name if domain else ""
-            },
-            "nodes": [{
-                "name": n.name,
-                "hostname": n.hostname,
-                "port": n.tmax_port
-            } for n in nodes],
-            "svrgroups": [{
-                "name": s.name,
-                "node": s.node_name
-            } for s in svrgroups],
-            "servers": [{
-                "name": s.name,
-                "svg": s.svg_name
-            } for s in servers],
-            "services": [{
-                "name": s.name,
-                "server": s.server_name
-            } for s in services],
-            "gateways": [{
-                "name": g.name,
-                "node": g.node_name,
-                "port": g.port,
-                "remote_addr": g.remote_addr,
-                "remote_port": g.remote_port,
-                "direction": g.direction,
-                "gw_type": g.gw_type,
-                "backup_addr": g.backup_addr,
-                "backup_port": g.backup_port,
-                "backup_rgwaddr": g.backup_rgwaddr,
-                "backup_rgwportno": g.backup_rgwportno,
-                "cpc": g.cpc,
-                "restart": g.restart,
-                "clopt": g.clopt
-            } for g in gateways]
-        },
-        "last_update": system.get_last_update().isoformat()
-    }
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    if generation:
+        # 인코딩마다 본문이 다르므로 ETag도 인코딩별로 구분
+        etag = f'"g{generation}-{payload.digest}' + ("" if encoding == "identity" else f"-{encoding}") + '"'
+        headers.update({"ETag": etag, "Cache-Control": "no-cache"})
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            response_cache.count_not_modified()
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/node/{name}")
@@ -164,56 +108,107 @@ async def get_svrgroup(name: str, db: Session = Depends(get_db)):
     }
 
 
+# 목록 응답 필드 -> Node 컬럼 (server_groups는 서버그룹에서 가져옴)
+NODE_FIELDS = {
+    "node_name": "name",
+    "hostname": "hostname",
+    "port": "tmax_port",
+    "server_groups": None,
+    "max_servers": "max_svr",
+    "max_users": "max_user",
+    "tmax_home": "tmax_home"
+}
+
+# 목록 응답 필드 -> SvrGroup 컬럼 (servers는 서버에서 가져옴)
+SVRGROUP_FIELDS = {
+    "svg_name": "name",
+    "node": "node_name",
+    "backup": "backup",
+    "cousin": "cousin",
+    "restart": "restart",
+    "autobackup": "autobackup",
+    "servers": None
+}
+
+
 @router.get("/nodes")
-async def get_all_nodes(db: Session = Depends(get_db)):
-    """모든 노드 정보 반환"""
-    nodes = db.query(Node).all()
+@cached_response
+async def get_all_nodes(
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    모든 노드 정보 반환 (서버그룹은 selectinload로 한 번에 조회)
+    limit/after: id 순서 keyset 페이지네이션, fields: 응답 필드 선택 (예: node_name,hostname)
+    """
+    selected = select_fields(fields, list(NODE_FIELDS))
+    
+    query = db.query(Node)
+    total = count_rows(query, Node) if limit is not None and include_total else None
+    
+    query = query.options(column_options(Node, selected, NODE_FIELDS, ("name",)))
+    if "server_groups" in selected:
+        query = query.options(selectinload(Node.server_groups).load_only(SvrGroup.name, SvrGroup.node_name))
+    nodes, next_after = keyset_page(query, Node, limit, after)
     
     node_list = []
     for node in nodes:
-        server_groups = db.query(SvrGroup).filter(SvrGroup.node_name == node.name).all()
-        node_list.append({
-            "node_name": node.name,
-            "hostname": node.hostname,
-            "port": node.tmax_port,
-            "server_groups": [svg.name for svg in server_groups],
-            "max_servers": node.max_svr,
-            "max_users": node.max_user,
-            "tmax_home": node.tmax_home
-        })
+        node_data = {}
+        for field in selected:
+            if field == "server_groups":
+                node_data["server_groups"] = [svg.name for svg in node.server_groups]
+            else:
+                node_data[field] = getattr(node, NODE_FIELDS[field])
+        node_list.append(node_data)
     
-    return {
-        "success": True,
-        "nodes": node_list,
-        "total": len(node_list)
-    }
+    if limit is None:
+        total = len(node_list)
+    return list_response("nodes", node_list, limit, next_after, total)
 
 
 @router.get("/svrgroups")
-async def get_all_svrgroups(db: Session = Depends(get_db)):
-    """모든 서버 그룹 정보 반환"""
-    svrgroups = db.query(SvrGroup).all()
+@cached_response
+async def get_all_svrgroups(
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    모든 서버 그룹 정보 반환 (서버는 selectinload로 한 번에 조회)
+    limit/after: id 순서 keyset 페이지네이션, fields: 응답 필드 선택 (예: svg_name,node)
+    """
+    selected = select_fields(fields, list(SVRGROUP_FIELDS))
+    
+    query = db.query(SvrGroup)
+    total = count_rows(query, SvrGroup) if limit is not None and include_total else None
+    
+    query = query.options(column_options(SvrGroup, selected, SVRGROUP_FIELDS, ("name",)))
+    if "servers" in selected:
+        query = query.options(selectinload(SvrGroup.servers).load_only(
+            Server.svg_name, Server.name, Server.min_proc, Server.max_proc, Server.restart
+        ))
+    svrgroups, next_after = keyset_page(query, SvrGroup, limit, after)
     
     svg_list = []
     for svg in svrgroups:
-        servers = db.query(Server).filter(Server.svg_name == svg.name).all()
-        svg_list.append({
-            "svg_name": svg.name,
-            "node": svg.node_name,
-            "backup": svg.backup,
-            "cousin": svg.cousin,
-            "restart": svg.restart,
-            "autobackup": svg.autobackup,
-            "servers": [{
-                "name": s.name,
-                "min": s.min_proc,
-                "max": s.max_proc,
-                "restart": s.restart
-            } for s in servers]
-        })
+        svg_data = {}
+        for field in selected:
+            if field == "servers":
+                svg_data["servers"] = [{
+                    "name": s.name,
+                    "min": s.min_proc,
+                    "max": s.max_proc,
+                    "restart": s.restart
+                } for s in svg.servers]
+            else:
+                svg_data[field] = getattr(svg, SVRGROUP_FIELDS[field])
+        svg_list.append(svg_data)
     
-    return {
-        "success": True,
-        "server_groups": svg_list,
-        "total": len(svg_list)
-    }
+    if limit is None:
+        total = len(svg_list)
+    return list_response("server_groups", svg_list, limit, next_after, total)
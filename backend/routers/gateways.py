@@ -1,37 +1,59 @@
 """게이트웨이 관련 라우터"""
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from typing import Optional
 
 from database import get_db
 from models import Gateway
+from pagination import column_options, count_rows, keyset_page, list_response, select_fields
+from response_cache import cached_response
 
 router = APIRouter(prefix="/api", tags=["gateways"])
 
+# 목록 응답 필드 -> Gateway 컬럼
+GATEWAY_FIELDS = {
+    "name": "name",
+    "node": "node_name",
+    "port": "port",
+    "remote_addr": "remote_addr",
+    "remote_port": "remote_port",
+    "direction": "direction",
+    "gw_type": "gw_type",
+    "backup_addr": "backup_addr",
+    "backup_port": "backup_port",
+    "backup_rgwaddr": "backup_rgwaddr",
+    "backup_rgwportno": "backup_rgwportno",
+    "cpc": "cpc",
+    "restart": "restart",
+    "clopt": "clopt"
+}
+
 
 @router.get("/gateways")
-async def get_all_gateways(db: Session = Depends(get_db)):
-    """모든 게이트웨이 정보 반환"""
-    gateways = db.query(Gateway).all()
+@cached_response
+async def get_all_gateways(
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    모든 게이트웨이 정보 반환
+    limit/after: id 순서 keyset 페이지네이션, fields: 응답 필드 선택 (예: name,node,port)
+    """
+    selected = select_fields(fields, list(GATEWAY_FIELDS))
+    
+    query = db.query(Gateway)
+    total = count_rows(query, Gateway) if limit is not None and include_total else None
+    
+    query = query.options(column_options(Gateway, selected, GATEWAY_FIELDS))
+    gateways, next_after = keyset_page(query, Gateway, limit, after)
     
     gateway_list = [{
-        "name": g.name,
-        "node": g.node_name,
-        "port": g.port,
-        "remote_addr": g.remote_addr,
-        "remote_port": g.remote_port,
-        "direction": g.direction,
-        "gw_type": g.gw_type,
-        "backup_addr": g.backup_addr,
-        "backup_port": g.backup_port,
-        "backup_rgwaddr": g.backup_rgwaddr,
-        "backup_rgwportno": g.backup_rgwportno,
-        "cpc": g.cpc,
-        "restart": g.restart,
-        "clopt": g.clopt
+        field: getattr(g, GATEWAY_FIELDS[field]) for field in selected
     } for g in gateways]
     
-    return {
-        "success": True,
-        "gateways": gateway_list,
-        "total": len(gateway_list)
-    }
+    if limit is None:
+        total = len(gateway_list)
+    return list_response("gateways", gateway_list, limit, next_after, total)
@@ -1,22 +1,57 @@
 """서버 관련 라우터"""
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional
 
 from database import get_db
 from models import Server, Service, SvrGroup, Node, User, UserRole
 from auth import get_current_active_user
+from pagination import column_options, count_rows, keyset_page, list_response, select_fields
+from response_cache import cached_response
 
 router = APIRouter(prefix="/api", tags=["servers"])
 
 
+# 목록 응답 필드 -> Server 컬럼 (node는 서버그룹에서 가져옴)
+SERVER_FIELDS = {
+    "name": "name",
+    "svg": "svg_name",
+    "min": "min_proc",
+    "max": "max_proc",
+    "restart": "restart",
+    "node": None,
+    "maxqcount": "maxqcount",
+    "asqcount": "asqcount",
+    "db_info": "db_info"
+}
+
+# INFRASTRUCTURE 이상 권한만 볼 수 있는 필드
+RESTRICTED_SERVER_FIELDS = ("maxqcount", "asqcount", "db_info")
+
+
 @router.get("/servers")
+@cached_response
 async def get_all_servers(
     search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[str] = None,
+    include_total: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """모든 서버 정보 반환 (검색 지원)"""
+    """
+    모든 서버 정보 반환 (검색 지원, 서버그룹은 JOIN으로 함께 조회)
+    limit/after: id 순서 keyset 페이지네이션, fields: 응답 필드 선택 (예: name,svg,node)
+    """
+    # role별로 다른 정보 제공
+    user_role = current_user.role
+    available = [
+        field for field in SERVER_FIELDS
+        if field not in RESTRICTED_SERVER_FIELDS or user_role in [UserRole.INFRASTRUCTURE, UserRole.ADMIN]
+    ]
+    selected = select_fields(fields, available)
+    
     query = db.query(Server)
     
     # 검색어가 있으면 필터링
@@ -27,44 +62,27 @@ async def get_all_servers(
             (Server.svg_name.ilike(search_filter))
         )
     
-    servers = query.all()
+    total = count_rows(query, Server) if limit is not None and include_total else None
     
-    # role별로 다른 정보 제공
-    user_role = current_user.role
+    query = query.options(column_options(Server, selected, SERVER_FIELDS, ("svg_name",)))
+    if "node" in selected:
+        query = query.options(joinedload(Server.svrgroup).load_only(SvrGroup.node_name))
+    servers, next_after = keyset_page(query, Server, limit, after)
     
     server_list = []
     for server in servers:
-        # 기본 정보
-        server_data = {
-            "name": server.name,
-            "svg": server.svg_name,
-            "min": server.min_proc,
-            "max": server.max_proc,
-            "restart": server.restart
-        }
-        
-        # 노드명 추가 (svg -> node 조회)
-        svg = db.query(SvrGroup).filter(SvrGroup.name == server.svg_name).first()
-        if svg:
-            server_data["node"] = svg.node_name
-        else:
-            server_data["node"] = ""
-        
-        # infrastructure 이상 권한에 추가 정보
-        if user_role in [UserRole.INFRASTRUCTURE, UserRole.ADMIN]:
-            server_data.update({
-                "maxqcount": server.maxqcount,
-                "asqcount": server.asqcount,
-                "db_info": server.db_info
-            })
-        
+        server_data = {}
+        for field in selected:
+            if field == "node":
+                # 노드명 (svg -> node)
+                server_data["node"] = server.svrgroup.node_name if server.svrgroup else ""
+            else:
+                server_data[field] = getattr(server, SERVER_FIELDS[field])
         server_list.append(server_data)
     
-    return {
-        "success": True,
-        "servers": server_list,
-        "total": len(server_list)
-    }
+    if limit is None:
+        total = len(server_list)
+    return list_response("servers", server_list, limit, next_after, total)
 
 
 @router.get("/server/{name}")
@@ -74,7 +92,7 @@ async def get_server_info(
     current_user: User = Depends(get_current_active_user)
 ):
     """특정 서버 상세 정보"""
-    server = db.query(Server).filter(Server.name == name).first()
+    server = db.query(Server).options(joinedload(Server.svrgroup)).filter(Server.name == name).first()
     
     if not server:
         raise HTTPException(status_code=404, detail=f"Server '{name}' not found")
@@ -82,9 +100,8 @@ async def get_server_info(
     # 해당 서버의 서비스(TR) 목록
     services = db.query(Service).filter(Service.server_name == name).all()
     
-    # 노드명 찾기
-    svg = db.query(SvrGroup).filter(SvrGroup.name == server.svg_name).first()
-    node_name = svg.node_name if svg else ""
+    # 노드명 (svg -> node)
+    node_name = server.svrgroup.node_name if server.svrgroup else ""
     
     # 기본 서버 상세 정보
     server_data = {
@@ -9,17 +9,39 @@ from database import get_db
 from models import Service, Server, User
 from auth import get_current_active_user
 from elasticsearch_client import get_es_client
+from pagination import column_options, count_rows, keyset_page, list_response, select_fields
+from response_cache import cached_response
 
 router = APIRouter(prefix="/api", tags=["services"])
 
 
+# 목록 응답 필드 -> Service 컬럼
+SERVICE_FIELDS = {
+    "name": "name",
+    "server": "server_name",
+    "timeout": "timeout",
+    "autotran": "autotran",
+    "export": "export"
+}
+
+
 @router.get("/services")
+@cached_response
 async def get_all_services(
     search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after: Optional[int] = None,
+    fields: Optional[str] = None,
+    include_total: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """모든 서비스 정보 반환 (검색 지원)"""
+    """
+    모든 서비스 정보 반환 (검색 지원)
+    limit/after: id 순서 keyset 페이지네이션, fields: 응답 필드 선택 (예: name,server)
+    """
+    selected = select_fields(fields, list(SERVICE_FIELDS))
+    
     query = db.query(Service)
     
     # 검색어가 있으면 필터링
@@ -30,21 +52,18 @@ async def get_all_services(
             (Service.server_name.ilike(search_filter))
         )
     
-    services = query.all()
+    total = count_rows(query, Service) if limit is not None and include_total else None
+    
+    query = query.options(column_options(Service, selected, SERVICE_FIELDS))
+    services, next_after = keyset_page(query, Service, limit, after)
     
     service_list = [{
-        "name": s.name,
-        "server": s.server_name,
-        "timeout": s.timeout,
-        "autotran": s.autotran,
-        "export": s.export
+        field: getattr(s, SERVICE_FIELDS[field]) for field in selected
     } for s in services]
     
-    return {
-        "success": True,
-        "services": service_list,
-        "total": len(service_list)
-    }
+    if limit is None:
+        total = len(service_list)
+    return list_response("services", service_list, limit, next_after, total)
 
 
 @router.get("/services/performance")
@@ -172,13 +191,18 @@ async def get_service_info(
     current_user: User = Depends(get_current_active_user)
 ):
     """특정 서비스 상세 정보"""
-    service = db.query(Service).filter(Service.name == name).first()
-    
-    if not service:
+    # 서비스와 서비스가 속한 서버를 한 번에 조회 (서버가 없으면 None)
+    row = (
+        db.query(Service, Server)
+        .outerjoin(Server, Server.name == Service.server_name)
+        .filter(Service.name == name)
+        .first()
+    )
+    
+    if not row:
         raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
     
-    # 해당 서비스가 속한 서버 정보
-    server = db.query(Server).filter(Server.name == service.server_name).first()
+    service, server = row
     
     result = {
         "success": True,
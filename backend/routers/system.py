@@ -1,53 +1,200 @@
 """시스템 관련 라우터 (헬스체크, 리로드 등)"""
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import threading
 
-from database import get_db
+from database import SessionLocal
 from auth import get_current_active_user
 from models import User, UserRole
+from reload_jobs import ReloadJob, ReloadJobManager
+from config_watcher import ConfigWatcher
+from generation_notify import GenerationListener
 
 router = APIRouter(prefix="/api", tags=["system"])
 
 # 마지막 업데이트 시간
 last_update = datetime.utcnow()
 
+# 이 프로세스가 보고 있는 설정 세대 (config_generations.id, 0이면 아직 로드 전)
+config_generation = 0
 
-@router.get("/reload")
-async def reload_config(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-):
-    """설정 파일 재로드 (ADMIN 또는 INFRASTRUCTURE만)"""
-    global last_update
+# background 시작 모드의 초기 로드 작업
+startup_job: Optional[ReloadJob] = None
+
+# 세대가 바뀌면 호출할 콜백 (프로세스 내 캐시 무효화 등, 인자는 새 세대)
+generation_callbacks: List[Callable[[int], None]] = []
+
+_generation_lock = threading.Lock()
+
+
+def on_generation_change(callback: Callable[[int], None]) -> Callable[[int], None]:
+    """세대 변경 콜백 등록 (데코레이터로도 사용)"""
+    generation_callbacks.append(callback)
+    return callback
+
+
+def mark_config_loaded(generation: int) -> bool:
+    """
+    설정 로드 완료 기록 (마지막 업데이트 시간, 세대), 세대가 바뀌면 콜백 호출 후 True
+    세대는 올라가기만 함 - 늦게 도착한 알림이나 느린 로컬 리로드가 이전 세대를 넘기면 무시
+    (DB에는 이미 더 새 세대의 데이터가 있으므로 이전 세대로 돌아가면 캐시가 옛 ETag로 새 데이터를 내보냄)
+    """
+    global last_update, config_generation
+    with _generation_lock:
+        if generation < config_generation:
+            return False
+        last_update = datetime.utcnow()
+        changed = generation != config_generation
+        config_generation = generation
+    if changed:
+        for callback in generation_callbacks:
+            callback(generation)
+    return changed
+
+
+def apply_remote_generation(generation: int):
+    """다른 레플리카의 세대 알림 반영 (로컬보다 새 세대일 때만)"""
+    previous = config_generation
+    if generation > previous and mark_config_loaded(generation):
+        print(f"📡 Config generation {previous} -> {generation} (remote reload)")
+
+
+def _run_reload(job: ReloadJob) -> Dict[str, Any]:
+    """리로드 작업 본체 (워커 스레드에서 실행, 요청과 별도의 DB 세션 사용)"""
+    # main 모듈의 load_all_configs_to_db 함수 import
+    from main import load_all_configs_to_db
     
+    db = SessionLocal()
+    try:
+        load_stats = load_all_configs_to_db(db, job.mode, progress=job)
+    finally:
+        db.close()
+    
+    # 마지막 업데이트 시간, 세대 갱신
+    mark_config_loaded(load_stats["load"]["generation"])
+    
+    return {
+        "timestamp": last_update.isoformat(),
+        "generation": config_generation,
+        "files": load_stats["files"],
+        "parse_cache": load_stats["parse_cache"],
+        "mode": load_stats["load"]["mode"],
+        "changes": load_stats["load"].get("changes"),
+        "load": load_stats["load"]
+    }
+
+
+def run_startup_load(job: ReloadJob) -> Dict[str, Any]:
+    """시작 로드 작업 본체 (다른 레플리카가 같은 내용을 이미 적재했으면 건너뜀)"""
+    from main import load_configs_on_startup
+    
+    db = SessionLocal()
+    try:
+        startup_stats = load_configs_on_startup(db, progress=job)
+    finally:
+        db.close()
+    
+    mark_config_loaded(startup_stats["generation"])
+    
+    return {
+        "timestamp": last_update.isoformat(),
+        "generation": config_generation,
+        "skipped": startup_stats["skipped"],
+        "files": startup_stats.get("files"),
+        "load": startup_stats.get("load")
+    }
+
+
+# 리로드 작업 관리 (한 번에 하나만 실행, 동시 요청은 실행 중인 작업에 합쳐지고 incremental 중 full 요청은 후속 작업으로)
+reload_jobs = ReloadJobManager(_run_reload)
+
+# config 파일 감시 (CONFIG_WATCH=1일 때 서버 시작 시 생성)
+config_watcher: Optional[ConfigWatcher] = None
+
+# 다른 레플리카의 세대 알림 수신 (PostgreSQL일 때 서버 시작 시 생성)
+generation_listener: Optional[GenerationListener] = None
+
+
+def _check_reload_permission(current_user: User):
     if current_user.role not in [UserRole.ADMIN, UserRole.INFRASTRUCTURE]:
         raise HTTPException(
             status_code=403,
             detail="권한이 없습니다. ADMIN 또는 INFRASTRUCTURE 권한이 필요합니다."
         )
+
+
+@router.get("/reload", status_code=202)
+async def reload_config(
+    mode: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    설정 파일 재로드 시작 (ADMIN 또는 INFRASTRUCTURE만)
+    mode: incremental (바뀐 행만 반영) / full (전체 다시 적재), 없으면 CONFIG_RELOAD_MODE
+    리로드는 백그라운드 작업으로 실행되고 작업 ID를 바로 반환
+    실행 중인 작업이 있으면 합쳐지고, 실행 중인 작업이 full이 아닐 때 full 요청은 끝난 뒤 실행할 후속 작업이 됨
+    진행 상황은 /api/reload/{job_id} 로 조회
+    """
+    _check_reload_permission(current_user)
     
-    try:
-        # main 모듈의 load_all_configs_to_db 함수 import
-        from main import load_all_configs_to_db
-        
-        # DB 재로드
-        load_all_configs_to_db(db)
-        
-        # 마지막 업데이트 시간 갱신
-        last_update = datetime.utcnow()
-        
-        return {
-            "success": True,
-            "message": "Configuration reloaded successfully",
-            "timestamp": last_update.isoformat(),
-            "reloaded_by": current_user.username
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Config reload failed: {str(e)}"
-        )
+    if mode not in (None, "incremental", "full"):
+        raise HTTPException(status_code=400, detail="mode는 incremental 또는 full 이어야 합니다.")
+    if mode is None:
+        # 기본 방식으로 확정해 두어야 실행 중인 incremental 작업에 full 요청이 합쳐지지 않음
+        from main import CONFIG_RELOAD_MODE
+        mode = CONFIG_RELOAD_MODE
+    
+    job, merged = reload_jobs.submit(mode, current_user.username)
+    
+    if merged:
+        message = "Reload already running or queued, request merged"
+    elif job.queued_after:
+        # 실행 중인 incremental 작업은 full 요청을 대신할 수 없으므로 끝난 뒤 full로 다시 실행
+        message = f"Reload queued after running job {job.queued_after}"
+    else:
+        message = "Reload started"
+    
+    return {
+        "success": True,
+        "message": message,
+        "job_id": job.job_id,
+        "merged": merged,
+        "status_url": f"/api/reload/{job.job_id}",
+        "job": job.to_dict()
+    }
+
+
+@router.get("/reload/{job_id}")
+async def get_reload_status(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """리로드 작업 상태 (단계, 처리한 파일 수, 반영한 행 수, 경과 시간)"""
+    _check_reload_permission(current_user)
+    
+    job = reload_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Reload job not found")
+    
+    return job.to_dict()
+
+
+@router.get("/config-watcher")
+async def get_config_watcher_status(current_user: User = Depends(get_current_active_user)):
+    """config 파일 감시 상태와 리로드 지연 시간 (변경 감지 -> DB 반영 완료)"""
+    if config_watcher is None:
+        return {"enabled": False}
+    return config_watcher.metrics()
+
+
+@router.get("/response-cache")
+async def get_response_cache_stats(current_user: User = Depends(get_current_active_user)):
+    """읽기 API 응답 캐시 통계 (항목 수, 메모리, 적중/미스, 304 응답 수, LRU 제거 수)"""
+    # response_cache가 이 모듈을 import하므로 여기서 import
+    from response_cache import response_cache
+    
+    return response_cache.stats()
 
 
 @router.get("/health")
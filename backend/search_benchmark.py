@@ -0,0 +1,141 @@
+"""
+서버/서비스 검색(ilike '%term%') 지연 시간 벤치마크
+DATABASE_URL의 DB에 합성 서비스/서버 행을 단계별로 늘려 가며 /api/services, /api/servers와
+같은 검색 쿼리의 지연 시간을 측정한다. 모든 작업은 한 트랜잭션 안에서 하고 마지막에 롤백하므로
+기존 데이터는 바뀌지 않는다. PostgreSQL + pg_trgm 인덱스가 있으면 행 수가 늘어도 지연 시간이 거의 일정하다.
+
+사용법 (backend 디렉토리에서): python search_benchmark.py [--sizes 25000,50000,100000,200000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from database import SessionLocal, init_db
+from models import Node, SvrGroup, Server, Service
+from bulk_load import CONFIG_LOAD_BATCH_SIZE, load_method, write_rows
+
+# 서비스 대비 서버 비율 (config 파일과 비슷하게 서버 1개당 서비스 3개)
+SERVICES_PER_SERVER = 3
+
+# 합성 서버가 나눠 속하는 노드/서버 그룹 수
+BENCH_NODES = 4
+BENCH_SVRGROUPS = 40
+
+
+def search_services(db: Session, term: str) -> int:
+    """/api/services?search= 와 같은 쿼리"""
+    search_filter = f"%{term}%"
+    return len(db.query(Service).filter(
+        (Service.name.ilike(search_filter)) |
+        (Service.server_name.ilike(search_filter))
+    ).all())
+
+
+def search_servers(db: Session, term: str) -> int:
+    """/api/servers?search= 와 같은 쿼리"""
+    search_filter = f"%{term}%"
+    return len(db.query(Server).filter(
+        (Server.name.ilike(search_filter)) |
+        (Server.svg_name.ilike(search_filter))
+    ).all())
+
+
+def median_ms(func: Callable[[], int], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def seed_parents(db: Session):
+    """합성 서버가 참조할 노드/서버 그룹 추가 (servers.svg_name FK, 마지막 롤백으로 함께 제거됨)"""
+    method = load_method(db)
+    write_rows(db, method, Node.__table__, ("name", "hostname"), [
+        (f"benchnode{i}", f"benchhost{i}") for i in range(BENCH_NODES)
+    ], CONFIG_LOAD_BATCH_SIZE)
+    write_rows(db, method, SvrGroup.__table__, ("name", "node_name"), [
+        (f"benchsvg{i}", f"benchnode{i % BENCH_NODES}") for i in range(BENCH_SVRGROUPS)
+    ], CONFIG_LOAD_BATCH_SIZE)
+
+
+def grow_tables(db: Session, services_from: int, services_to: int):
+    """합성 서비스/서버 행 추가 (bench 접두어로 실제 config 행과 구분)"""
+    method = load_method(db)
+    servers_from = services_from // SERVICES_PER_SERVER
+    servers_to = services_to // SERVICES_PER_SERVER
+    write_rows(db, method, Server.__table__, ("name", "svg_name", "node_name", "min_proc", "max_proc"), [
+        (f"benchsvr{i:07d}", f"benchsvg{i % BENCH_SVRGROUPS}", f"benchnode{i % BENCH_NODES}", "1", "10")
+        for i in range(servers_from, servers_to)
+    ], CONFIG_LOAD_BATCH_SIZE)
+    write_rows(db, method, Service.__table__, ("name", "server_name", "timeout", "autotran", "export"), [
+        (f"BENCHSVC{i:08d}", f"benchsvr{i % max(1, servers_to):07d}", "30", "N", "Y")
+        for i in range(services_from, services_to)
+    ], CONFIG_LOAD_BATCH_SIZE)
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("ANALYZE servers"))
+        db.execute(text("ANALYZE services"))
+
+
+def bench_search(sizes: List[int], repeat: int):
+    """크기별 검색 지연 시간 (한 건 일치 / 여러 건 일치 / 일치 없음)"""
+    init_db()
+    db = SessionLocal()
+    try:
+        dialect = db.get_bind().dialect.name
+        print(f"database: {dialect}, repeat: {repeat} (median)")
+        print(f"{'services':>9} {'servers':>8} | {'svc 1 hit':>10} {'svc many':>10} {'svc miss':>10} | "
+              f"{'svr 1 hit':>10} {'svr miss':>10}")
+        
+        seed_parents(db)
+        added = 0
+        for size in sizes:
+            grow_tables(db, added, size)
+            added = size
+            total_services = db.query(func.count(Service.id)).scalar()
+            total_servers = db.query(func.count(Server.id)).scalar()
+            
+            # 한 건: 가운데 서비스 이름, 여러 건: 서버 이름 일부 (서비스 약 30개), 없음: 없는 문자열
+            one = f"SVC{size // 2:08d}"
+            many = f"benchsvr{(size // SERVICES_PER_SERVER) // 2:07d}"[:-1]
+            server_one = f"benchsvr{(size // SERVICES_PER_SERVER) // 2:07d}"
+            timings = [
+                median_ms(lambda: search_services(db, one), repeat),
+                median_ms(lambda: search_services(db, many), repeat),
+                median_ms(lambda: search_services(db, "zzqxj"), repeat),
+                median_ms(lambda: search_servers(db, server_one), repeat),
+                median_ms(lambda: search_servers(db, "zzqxj"), repeat),
+            ]
+            print(f"{total_services:>9} {total_servers:>8} | "
+                  f"{timings[0]:>8.2f}ms {timings[1]:>8.2f}ms {timings[2]:>8.2f}ms | "
+                  f"{timings[3]:>8.2f}ms {timings[4]:>8.2f}ms")
+        
+        if dialect == "postgresql":
+            # 마지막 크기에서 서비스 검색 실행 계획 (Bitmap Index Scan on ix_services_*_trgm 이어야 함)
+            plan = db.execute(text(
+                "EXPLAIN SELECT * FROM services WHERE name ILIKE :term OR server_name ILIKE :term"
+            ), {"term": "%zzqxj%"}).scalars().all()
+            print("\n".join(plan))
+    finally:
+        db.rollback()
+        db.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="server/service search latency benchmark")
+    arg_parser.add_argument("--sizes", default="25000,50000,100000,200000",
+                            help="단계별 합성 서비스 수 (쉼표 구분, 오름차순)")
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    args = arg_parser.parse_args()
+    
+    bench_search(sorted(int(size) for size in args.sizes.split(",")), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
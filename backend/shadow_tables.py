@@ -0,0 +1,88 @@
+"""
+config 테이블 무중단 교체 (PostgreSQL)
+새 데이터를 스테이징 스키마의 같은 이름 테이블들에 적재한 뒤, 한 트랜잭션에서
+기존 테이블을 지우고 스테이징 테이블을 원래 스키마로 옮긴다 (ALTER TABLE ... SET SCHEMA).
+인덱스/제약조건/시퀀스가 테이블과 함께 옮겨지므로 이름이 그대로 유지되고,
+commit 전까지 조회 API는 이전 데이터를, commit 후에는 새 데이터를 통째로 본다.
+"""
+
+import os
+from typing import Any, Dict
+
+from sqlalchemy import MetaData, Table, text
+from sqlalchemy.orm import Session
+
+from bulk_load import LOAD_COLUMNS
+from database import create_trigram_indexes
+
+# 적재용 스테이징 스키마 이름
+CONFIG_STAGING_SCHEMA = os.getenv("CONFIG_STAGING_SCHEMA", "tpops_staging")
+
+# 동시에 두 리로드(다른 레플리카, 감시 + 수동 리로드)가 config 테이블에 쓰지 않도록 하는 advisory lock 키
+RELOAD_LOCK_KEY = 7470001
+
+
+def supports_shadow_tables(db: Session) -> bool:
+    """스키마 단위 교체가 가능한 DB인지 (PostgreSQL만)"""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def acquire_reload_lock(db: Session):
+    """
+    현재 트랜잭션이 끝날 때까지 리로드 lock 보유 (PostgreSQL만, 다른 DB는 아무것도 하지 않음)
+    적재 방식과 관계없이 기존 행을 읽기 전에 잡아야 두 리로드가 같은 diff로 중복 적재하지 않음
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": RELOAD_LOCK_KEY})
+
+
+def create_shadow_tables(db: Session) -> Dict[Any, Table]:
+    """
+    스테이징 스키마를 새로 만들고 config 테이블과 같은 정의의 빈 테이블 생성
+    (모델 -> 스테이징 Table 반환, 현재 트랜잭션 안에서 acquire_reload_lock 이후에 실행)
+    """
+    connection = db.connection()
+    connection.execute(text(f'DROP SCHEMA IF EXISTS "{CONFIG_STAGING_SCHEMA}" CASCADE'))
+    connection.execute(text(f'CREATE SCHEMA "{CONFIG_STAGING_SCHEMA}"'))
+    
+    # FK도 스테이징 스키마의 테이블을 가리키도록 함께 복사
+    staging_metadata = MetaData()
+    shadow_tables = {}
+    for model in LOAD_COLUMNS:
+        table = model.__table__.to_metadata(staging_metadata, schema=CONFIG_STAGING_SCHEMA)
+        # 자동 생성 인덱스 이름에는 스키마명이 들어가므로, 옮긴 뒤에도
+        # 원래 인덱스 이름(예: ix_nodes_name)이 되도록 원본 이름으로 지정
+        live_index_names = {
+            tuple(column.name for column in index.columns): index.name
+            for index in model.__table__.indexes
+        }
+        for index in table.indexes:
+            columns = tuple(column.name for column in index.columns)
+            index.name = live_index_names.get(columns, index.name)
+        shadow_tables[model] = table
+    staging_metadata.create_all(bind=connection)
+    return shadow_tables
+
+
+def swap_shadow_tables(db: Session, shadow_tables: Dict[Any, Table]):
+    """
+    기존 config 테이블을 지우고 스테이징 테이블을 원래 스키마로 이동
+    (같은 트랜잭션에서 commit 되므로 조회 쪽에는 한 번에 바뀐 것으로 보임)
+    config 테이블에 의존하는 다른 객체가 있으면 DROP이 실패하고 이전 데이터가 그대로 유지됨
+    """
+    connection = db.connection()
+    live_schema = connection.execute(text("SELECT current_schema()")).scalar()
+    
+    # 모델에 없는 검색용 trigram 인덱스는 적재가 끝난 스테이징 테이블에 생성해서 함께 이동
+    create_trigram_indexes(connection, CONFIG_STAGING_SCHEMA)
+    
+    # config 테이블끼리의 FK는 한 문장으로 함께 지우면 되므로 CASCADE 없이 삭제
+    # 다른 객체(뷰, 다른 테이블의 FK 등)가 참조하고 있으면 조용히 함께 지우지 않고 에러로 교체 전체를 롤백
+    live_names = ", ".join(f'"{model.__tablename__}"' for model in reversed(list(shadow_tables)))
+    connection.execute(text(f"DROP TABLE IF EXISTS {live_names} RESTRICT"))
+    
+    for table in shadow_tables.values():
+        connection.execute(text(
+            f'ALTER TABLE "{CONFIG_STAGING_SCHEMA}"."{table.name}" SET SCHEMA "{live_schema}"'
+        ))
+    connection.execute(text(f'DROP SCHEMA "{CONFIG_STAGING_SCHEMA}"'))
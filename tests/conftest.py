@@ -0,0 +1,61 @@
+"""
+테스트 공용 설정
+backend 모듈은 import 시점에 환경 변수를 읽으므로 import 전에 테스트용 SQLite DB와 캐시 설정을 지정한다.
+SQLite는 기본적으로 FK를 검사하지 않으므로 PostgreSQL과 같게 foreign_keys를 켠다.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(ROOT_DIR, "backend")
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+_DB_DIR = tempfile.mkdtemp(prefix="tpops-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'tpops.db')}"
+os.environ["CONFIG_SNAPSHOT_FILE"] = ""
+os.environ["CONFIG_CACHE_DIR"] = ""
+os.environ["CONFIG_PARSE_WORKERS"] = "1"
+
+for path in (ROOT_DIR, BACKEND_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from sqlalchemy import event  # noqa: E402
+
+import database  # noqa: E402
+
+
+@event.listens_for(database.engine, "connect")
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@pytest.fixture
+def db():
+    """빈 테이블로 초기화한 DB 세션"""
+    database.Base.metadata.drop_all(bind=database.engine)
+    database.init_db()
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """main.CONFIG_DIR을 임시 디렉토리로 바꾸고, scorap 파일을 써 주는 함수를 반환"""
+    import main
+    
+    monkeypatch.setattr(main, "CONFIG_DIR", str(tmp_path))
+    
+    def write(name: str, text: str):
+        (tmp_path / name).write_text(text)
+    
+    return write
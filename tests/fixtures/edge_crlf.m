@@ -0,0 +1,22 @@
+# 주석 라인
+*DOMAIN
+tmax1   SHMKEY = 78350, # inline?
+        DOMAINID = 1, TITLE = "한글 도메인"
+   *NODE
+node1   HOSTNAME = "host1",
+        // 주석
+        TmaxPort = 8350, EMPTY = ,
+        MAXSVR =
+        200
+*SVRGROUP
+svg1    NODENAME = "node1", BACKUP = ''
+*SERVER
+svr1    SVGNAME = svg1, CLOPT = "-o a,
+           -e b", MIN = 1
+svr1    SVGNAME = svg1, MIN = 2
+*SERVICE
+SVC1    SVRNAME = svr1
+*UNKNOWN
+foo bar = 1
+*GATEWAY
+gw1 NODENAME = "node1", RGWADDR = "1.2.3.4"
\ No newline at end of file
@@ -0,0 +1,4 @@
+*NODE
+ node1 A = 1
+node2	B = 2  
+ 
@@ -0,0 +1,547 @@
+# synthetic tp_config
+*DOMAIN
+tmax1	SHMKEY = 78351, MINCLH = 1, MAXCLH = 3,
+		TPORTNO = 8350, BLOCKTIME = 30,
+		MAXUSER = 5000, DOMAINID = 1
+
+*NODE
+node0	TMAXDIR = "/home/tmax",
+		HOSTNAME = "host0", TmaxPort = 8350,
+		MAXSVR = 168, MAXUSER = 1000, TMAXHOME = "/home/tmax"
+node1	TMAXDIR = "/home/tmax",
+		HOSTNAME = "host1", TmaxPort = 8350,
+		MAXSVR = 391, MAXUSER = 1000, TMAXHOME = "/home/tmax"
+node2	TMAXDIR = "/home/tmax",
+		HOSTNAME = "host2", TmaxPort = 8350,
+		MAXSVR = 491, MAXUSER = 1000, TMAXHOME = "/home/tmax"
+node3	TMAXDIR = "/home/tmax",
+		HOSTNAME = "host3", TmaxPort = 8350,
+		MAXSVR = 132, MAXUSER = 1000, TMAXHOME = "/home/tmax"
+
+*SVRGROUP
+svg0	NODENAME = "node0", COUSIN = "svg1",
+		RESTART = Y, AUTOBACKUP = N
+svg1	NODENAME = "node1", COUSIN = "svg2",
+		RESTART = Y, AUTOBACKUP = N
+svg2	NODENAME = "node2", COUSIN = "svg3",
+		RESTART = Y, AUTOBACKUP = N
+svg3	NODENAME = "node3", COUSIN = "svg4",
+		RESTART = Y, AUTOBACKUP = N
+svg4	NODENAME = "node0", COUSIN = "svg5",
+		RESTART = Y, AUTOBACKUP = N
+svg5	NODENAME = "node1", COUSIN = "svg6",
+		RESTART = Y, AUTOBACKUP = N
+svg6	NODENAME = "node2", COUSIN = "svg7",
+		RESTART = Y, AUTOBACKUP = N
+svg7	NODENAME = "node3", COUSIN = "svg8",
+		RESTART = Y, AUTOBACKUP = N
+svg8	NODENAME = "node0", COUSIN = "svg9",
+		RESTART = Y, AUTOBACKUP = N
+svg9	NODENAME = "node1", COUSIN = "svg10",
+		RESTART = Y, AUTOBACKUP = N
+svg10	NODENAME = "node2", COUSIN = "svg11",
+		RESTART = Y, AUTOBACKUP = N
+svg11	NODENAME = "node3", COUSIN = "svg12",
+		RESTART = Y, AUTOBACKUP = N
+svg12	NODENAME = "node0", COUSIN = "svg13",
+		RESTART = Y, AUTOBACKUP = N
+svg13	NODENAME = "node1", COUSIN = "svg14",
+		RESTART = Y, AUTOBACKUP = N
+svg14	NODENAME = "node2", COUSIN = "svg15",
+		RESTART = Y, AUTOBACKUP = N
+svg15	NODENAME = "node3", COUSIN = "svg16",
+		RESTART = Y, AUTOBACKUP = N
+svg16	NODENAME = "node0", COUSIN = "svg17",
+		RESTART = Y, AUTOBACKUP = N
+svg17	NODENAME = "node1", COUSIN = "svg18",
+		RESTART = Y, AUTOBACKUP = N
+svg18	NODENAME = "node2", COUSIN = "svg19",
+		RESTART = Y, AUTOBACKUP = N
+svg19	NODENAME = "node3", COUSIN = "svg20",
+		RESTART = Y, AUTOBACKUP = N
+svg20	NODENAME = "node0", COUSIN = "svg21",
+		RESTART = Y, AUTOBACKUP = N
+svg21	NODENAME = "node1", COUSIN = "svg22",
+		RESTART = Y, AUTOBACKUP = N
+svg22	NODENAME = "node2", COUSIN = "svg23",
+		RESTART = Y, AUTOBACKUP = N
+svg23	NODENAME = "node3", COUSIN = "svg24",
+		RESTART = Y, AUTOBACKUP = N
+svg24	NODENAME = "node0", COUSIN = "svg25",
+		RESTART = Y, AUTOBACKUP = N
+svg25	NODENAME = "node1", COUSIN = "svg26",
+		RESTART = Y, AUTOBACKUP = N
+svg26	NODENAME = "node2", COUSIN = "svg27",
+		RESTART = Y, AUTOBACKUP = N
+svg27	NODENAME = "node3", COUSIN = "svg28",
+		RESTART = Y, AUTOBACKUP = N
+svg28	NODENAME = "node0", COUSIN = "svg29",
+		RESTART = Y, AUTOBACKUP = N
+svg29	NODENAME = "node1", COUSIN = "svg30",
+		RESTART = Y, AUTOBACKUP = N
+svg30	NODENAME = "node2", COUSIN = "svg31",
+		RESTART = Y, AUTOBACKUP = N
+svg31	NODENAME = "node3", COUSIN = "svg32",
+		RESTART = Y, AUTOBACKUP = N
+svg32	NODENAME = "node0", COUSIN = "svg33",
+		RESTART = Y, AUTOBACKUP = N
+svg33	NODENAME = "node1", COUSIN = "svg34",
+		RESTART = Y, AUTOBACKUP = N
+svg34	NODENAME = "node2", COUSIN = "svg35",
+		RESTART = Y, AUTOBACKUP = N
+svg35	NODENAME = "node3", COUSIN = "svg36",
+		RESTART = Y, AUTOBACKUP = N
+svg36	NODENAME = "node0", COUSIN = "svg37",
+		RESTART = Y, AUTOBACKUP = N
+svg37	NODENAME = "node1", COUSIN = "svg38",
+		RESTART = Y, AUTOBACKUP = N
+svg38	NODENAME = "node2", COUSIN = "svg39",
+		RESTART = Y, AUTOBACKUP = N
+svg39	NODENAME = "node3", COUSIN = "svg0",
+		RESTART = Y, AUTOBACKUP = N
+
+*SERVER
+svr0	SVGNAME = svg0, MIN = 3, MAX = 8,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU01:CORCON1"
+svr1	SVGNAME = svg1, MIN = 4, MAX = 19,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr2	SVGNAME = svg2, MIN = 4, MAX = 17,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr3	SVGNAME = svg3, MIN = 2, MAX = 8,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -- -k DBU04:CORCON1"
+svr4	SVGNAME = svg4, MIN = 4, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr5	SVGNAME = svg5, MIN = 4, MAX = 18,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr6	SVGNAME = svg6, MIN = 5, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU03:CORCON1"
+svr7	SVGNAME = svg7, MIN = 4, MAX = 13,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr8	SVGNAME = svg8, MIN = 2, MAX = 8,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr9	SVGNAME = svg9, MIN = 3, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -- -k DBU02:CORCON1"
+svr10	SVGNAME = svg10, MIN = 1, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr11	SVGNAME = svg11, MIN = 5, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr12	SVGNAME = svg12, MIN = 4, MAX = 11,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU01:CORCON1"
+svr13	SVGNAME = svg13, MIN = 4, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr14	SVGNAME = svg14, MIN = 5, MAX = 12,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr15	SVGNAME = svg15, MIN = 4, MAX = 20,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -- -k DBU04:CORCON1"
+svr16	SVGNAME = svg16, MIN = 5, MAX = 12,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr17	SVGNAME = svg17, MIN = 3, MAX = 12,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr18	SVGNAME = svg18, MIN = 2, MAX = 19,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU03:CORCON1"
+svr19	SVGNAME = svg19, MIN = 3, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr20	SVGNAME = svg20, MIN = 4, MAX = 8,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr21	SVGNAME = svg21, MIN = 2, MAX = 14,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -- -k DBU02:CORCON1"
+svr22	SVGNAME = svg22, MIN = 1, MAX = 15,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr23	SVGNAME = svg23, MIN = 5, MAX = 18,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr24	SVGNAME = svg24, MIN = 5, MAX = 11,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU01:CORCON1"
+svr25	SVGNAME = svg25, MIN = 3, MAX = 14,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr26	SVGNAME = svg26, MIN = 5, MAX = 20,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr27	SVGNAME = svg27, MIN = 5, MAX = 17,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -- -k DBU04:CORCON1"
+svr28	SVGNAME = svg28, MIN = 5, MAX = 6,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr29	SVGNAME = svg29, MIN = 4, MAX = 12,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr30	SVGNAME = svg30, MIN = 4, MAX = 18,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU03:CORCON1"
+svr31	SVGNAME = svg31, MIN = 2, MAX = 16,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr32	SVGNAME = svg32, MIN = 5, MAX = 16,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr33	SVGNAME = svg33, MIN = 1, MAX = 19,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -- -k DBU02:CORCON1"
+svr34	SVGNAME = svg34, MIN = 5, MAX = 8,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr35	SVGNAME = svg35, MIN = 2, MAX = 17,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr36	SVGNAME = svg36, MIN = 3, MAX = 20,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU01:CORCON1"
+svr37	SVGNAME = svg37, MIN = 1, MAX = 20,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr38	SVGNAME = svg38, MIN = 1, MAX = 14,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr39	SVGNAME = svg39, MIN = 5, MAX = 17,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -- -k DBU04:CORCON1"
+svr40	SVGNAME = svg0, MIN = 2, MAX = 10,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr41	SVGNAME = svg1, MIN = 5, MAX = 12,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+svr42	SVGNAME = svg2, MIN = 1, MAX = 11,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU03:CORCON1"
+svr43	SVGNAME = svg3, MIN = 5, MAX = 12,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr44	SVGNAME = svg4, MIN = 4, MAX = 16,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU01:CORCON1"
+svr45	SVGNAME = svg5, MIN = 5, MAX = 16,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -- -k DBU02:CORCON1"
+svr46	SVGNAME = svg6, MIN = 4, MAX = 13,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU03:CORCON1"
+svr47	SVGNAME = svg7, MIN = 5, MAX = 5,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node3",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU04:CORCON1"
+svr48	SVGNAME = svg8, MIN = 4, MAX = 9,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,
+		CLOPT = "-o $(SVR).out -- -k DBU01:CORCON1"
+svr49	SVGNAME = svg9, MIN = 5, MAX = 11,
+		RESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5, NODENAME = "node1",
+		CLOPT = "-o $(SVR).out -e $(SVR).err, -x a -- -k DBU02:CORCON1"
+
+*SERVICE
+SVC0000000	SVRNAME = svr0, SVCTIME = 37, AUTOTRAN = N, EXPORT = Y
+SVC0000001	SVRNAME = svr1, SVCTIME = 13, AUTOTRAN = N, EXPORT = Y
+SVC0000002	SVRNAME = svr2, SVCTIME = 40, AUTOTRAN = N, EXPORT = Y
+SVC0000003	SVRNAME = svr3, SVCTIME = 33, AUTOTRAN = N, EXPORT = Y
+SVC0000004	SVRNAME = svr4, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000005	SVRNAME = svr5, SVCTIME = 45, AUTOTRAN = N, EXPORT = Y
+SVC0000006	SVRNAME = svr6, SVCTIME = 22, AUTOTRAN = N, EXPORT = Y
+SVC0000007	SVRNAME = svr7, SVCTIME = 42, AUTOTRAN = N, EXPORT = Y
+SVC0000008	SVRNAME = svr8, SVCTIME = 36, AUTOTRAN = N, EXPORT = Y
+SVC0000009	SVRNAME = svr9, SVCTIME = 41, AUTOTRAN = N, EXPORT = Y
+SVC0000010	SVRNAME = svr10, SVCTIME = 32, AUTOTRAN = N, EXPORT = Y
+SVC0000011	SVRNAME = svr11, SVCTIME = 36, AUTOTRAN = N, EXPORT = Y
+SVC0000012	SVRNAME = svr12, SVCTIME = 32, AUTOTRAN = N, EXPORT = Y
+SVC0000013	SVRNAME = svr13, SVCTIME = 10, AUTOTRAN = N, EXPORT = Y
+SVC0000014	SVRNAME = svr14, SVCTIME = 44, AUTOTRAN = N, EXPORT = Y
+SVC0000015	SVRNAME = svr15, SVCTIME = 44, AUTOTRAN = N, EXPORT = Y
+SVC0000016	SVRNAME = svr16, SVCTIME = 49, AUTOTRAN = N, EXPORT = Y
+SVC0000017	SVRNAME = svr17, SVCTIME = 60, AUTOTRAN = N, EXPORT = Y
+SVC0000018	SVRNAME = svr18, SVCTIME = 49, AUTOTRAN = N, EXPORT = Y
+SVC0000019	SVRNAME = svr19, SVCTIME = 31, AUTOTRAN = N, EXPORT = Y
+SVC0000020	SVRNAME = svr20, SVCTIME = 39, AUTOTRAN = N, EXPORT = Y
+SVC0000021	SVRNAME = svr21, SVCTIME = 48, AUTOTRAN = N, EXPORT = Y
+SVC0000022	SVRNAME = svr22, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000023	SVRNAME = svr23, SVCTIME = 24, AUTOTRAN = N, EXPORT = Y
+SVC0000024	SVRNAME = svr24, SVCTIME = 50, AUTOTRAN = N, EXPORT = Y
+SVC0000025	SVRNAME = svr25, SVCTIME = 21, AUTOTRAN = N, EXPORT = Y
+SVC0000026	SVRNAME = svr26, SVCTIME = 45, AUTOTRAN = N, EXPORT = Y
+SVC0000027	SVRNAME = svr27, SVCTIME = 47, AUTOTRAN = N, EXPORT = Y
+SVC0000028	SVRNAME = svr28, SVCTIME = 21, AUTOTRAN = N, EXPORT = Y
+SVC0000029	SVRNAME = svr29, SVCTIME = 15, AUTOTRAN = N, EXPORT = Y
+SVC0000030	SVRNAME = svr30, SVCTIME = 45, AUTOTRAN = N, EXPORT = Y
+SVC0000031	SVRNAME = svr31, SVCTIME = 26, AUTOTRAN = N, EXPORT = Y
+SVC0000032	SVRNAME = svr32, SVCTIME = 12, AUTOTRAN = N, EXPORT = Y
+SVC0000033	SVRNAME = svr33, SVCTIME = 53, AUTOTRAN = N, EXPORT = Y
+SVC0000034	SVRNAME = svr34, SVCTIME = 14, AUTOTRAN = N, EXPORT = Y
+SVC0000035	SVRNAME = svr35, SVCTIME = 15, AUTOTRAN = N, EXPORT = Y
+SVC0000036	SVRNAME = svr36, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000037	SVRNAME = svr37, SVCTIME = 38, AUTOTRAN = N, EXPORT = Y
+SVC0000038	SVRNAME = svr38, SVCTIME = 10, AUTOTRAN = N, EXPORT = Y
+SVC0000039	SVRNAME = svr39, SVCTIME = 58, AUTOTRAN = N, EXPORT = Y
+SVC0000040	SVRNAME = svr40, SVCTIME = 58, AUTOTRAN = N, EXPORT = Y
+SVC0000041	SVRNAME = svr41, SVCTIME = 27, AUTOTRAN = N, EXPORT = Y
+SVC0000042	SVRNAME = svr42, SVCTIME = 25, AUTOTRAN = N, EXPORT = Y
+SVC0000043	SVRNAME = svr43, SVCTIME = 27, AUTOTRAN = N, EXPORT = Y
+SVC0000044	SVRNAME = svr44, SVCTIME = 17, AUTOTRAN = N, EXPORT = Y
+SVC0000045	SVRNAME = svr45, SVCTIME = 49, AUTOTRAN = N, EXPORT = Y
+SVC0000046	SVRNAME = svr46, SVCTIME = 21, AUTOTRAN = N, EXPORT = Y
+SVC0000047	SVRNAME = svr47, SVCTIME = 32, AUTOTRAN = N, EXPORT = Y
+SVC0000048	SVRNAME = svr48, SVCTIME = 28, AUTOTRAN = N, EXPORT = Y
+SVC0000049	SVRNAME = svr49, SVCTIME = 14, AUTOTRAN = N, EXPORT = Y
+SVC0000050	SVRNAME = svr0, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000051	SVRNAME = svr1, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000052	SVRNAME = svr2, SVCTIME = 26, AUTOTRAN = N, EXPORT = Y
+SVC0000053	SVRNAME = svr3, SVCTIME = 43, AUTOTRAN = N, EXPORT = Y
+SVC0000054	SVRNAME = svr4, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000055	SVRNAME = svr5, SVCTIME = 52, AUTOTRAN = N, EXPORT = Y
+SVC0000056	SVRNAME = svr6, SVCTIME = 27, AUTOTRAN = N, EXPORT = Y
+SVC0000057	SVRNAME = svr7, SVCTIME = 51, AUTOTRAN = N, EXPORT = Y
+SVC0000058	SVRNAME = svr8, SVCTIME = 55, AUTOTRAN = N, EXPORT = Y
+SVC0000059	SVRNAME = svr9, SVCTIME = 28, AUTOTRAN = N, EXPORT = Y
+SVC0000060	SVRNAME = svr10, SVCTIME = 39, AUTOTRAN = N, EXPORT = Y
+SVC0000061	SVRNAME = svr11, SVCTIME = 54, AUTOTRAN = N, EXPORT = Y
+SVC0000062	SVRNAME = svr12, SVCTIME = 30, AUTOTRAN = N, EXPORT = Y
+SVC0000063	SVRNAME = svr13, SVCTIME = 41, AUTOTRAN = N, EXPORT = Y
+SVC0000064	SVRNAME = svr14, SVCTIME = 40, AUTOTRAN = N, EXPORT = Y
+SVC0000065	SVRNAME = svr15, SVCTIME = 17, AUTOTRAN = N, EXPORT = Y
+SVC0000066	SVRNAME = svr16, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000067	SVRNAME = svr17, SVCTIME = 29, AUTOTRAN = N, EXPORT = Y
+SVC0000068	SVRNAME = svr18, SVCTIME = 34, AUTOTRAN = N, EXPORT = Y
+SVC0000069	SVRNAME = svr19, SVCTIME = 31, AUTOTRAN = N, EXPORT = Y
+SVC0000070	SVRNAME = svr20, SVCTIME = 36, AUTOTRAN = N, EXPORT = Y
+SVC0000071	SVRNAME = svr21, SVCTIME = 60, AUTOTRAN = N, EXPORT = Y
+SVC0000072	SVRNAME = svr22, SVCTIME = 22, AUTOTRAN = N, EXPORT = Y
+SVC0000073	SVRNAME = svr23, SVCTIME = 26, AUTOTRAN = N, EXPORT = Y
+SVC0000074	SVRNAME = svr24, SVCTIME = 16, AUTOTRAN = N, EXPORT = Y
+SVC0000075	SVRNAME = svr25, SVCTIME = 26, AUTOTRAN = N, EXPORT = Y
+SVC0000076	SVRNAME = svr26, SVCTIME = 56, AUTOTRAN = N, EXPORT = Y
+SVC0000077	SVRNAME = svr27, SVCTIME = 42, AUTOTRAN = N, EXPORT = Y
+SVC0000078	SVRNAME = svr28, SVCTIME = 23, AUTOTRAN = N, EXPORT = Y
+SVC0000079	SVRNAME = svr29, SVCTIME = 48, AUTOTRAN = N, EXPORT = Y
+SVC0000080	SVRNAME = svr30, SVCTIME = 37, AUTOTRAN = N, EXPORT = Y
+SVC0000081	SVRNAME = svr31, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000082	SVRNAME = svr32, SVCTIME = 24, AUTOTRAN = N, EXPORT = Y
+SVC0000083	SVRNAME = svr33, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000084	SVRNAME = svr34, SVCTIME = 35, AUTOTRAN = N, EXPORT = Y
+SVC0000085	SVRNAME = svr35, SVCTIME = 19, AUTOTRAN = N, EXPORT = Y
+SVC0000086	SVRNAME = svr36, SVCTIME = 12, AUTOTRAN = N, EXPORT = Y
+SVC0000087	SVRNAME = svr37, SVCTIME = 56, AUTOTRAN = N, EXPORT = Y
+SVC0000088	SVRNAME = svr38, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000089	SVRNAME = svr39, SVCTIME = 38, AUTOTRAN = N, EXPORT = Y
+SVC0000090	SVRNAME = svr40, SVCTIME = 55, AUTOTRAN = N, EXPORT = Y
+SVC0000091	SVRNAME = svr41, SVCTIME = 42, AUTOTRAN = N, EXPORT = Y
+SVC0000092	SVRNAME = svr42, SVCTIME = 53, AUTOTRAN = N, EXPORT = Y
+SVC0000093	SVRNAME = svr43, SVCTIME = 37, AUTOTRAN = N, EXPORT = Y
+SVC0000094	SVRNAME = svr44, SVCTIME = 44, AUTOTRAN = N, EXPORT = Y
+SVC0000095	SVRNAME = svr45, SVCTIME = 24, AUTOTRAN = N, EXPORT = Y
+SVC0000096	SVRNAME = svr46, SVCTIME = 50, AUTOTRAN = N, EXPORT = Y
+SVC0000097	SVRNAME = svr47, SVCTIME = 54, AUTOTRAN = N, EXPORT = Y
+SVC0000098	SVRNAME = svr48, SVCTIME = 43, AUTOTRAN = N, EXPORT = Y
+SVC0000099	SVRNAME = svr49, SVCTIME = 38, AUTOTRAN = N, EXPORT = Y
+SVC0000100	SVRNAME = svr0, SVCTIME = 24, AUTOTRAN = N, EXPORT = Y
+SVC0000101	SVRNAME = svr1, SVCTIME = 43, AUTOTRAN = N, EXPORT = Y
+SVC0000102	SVRNAME = svr2, SVCTIME = 51, AUTOTRAN = N, EXPORT = Y
+SVC0000103	SVRNAME = svr3, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000104	SVRNAME = svr4, SVCTIME = 35, AUTOTRAN = N, EXPORT = Y
+SVC0000105	SVRNAME = svr5, SVCTIME = 53, AUTOTRAN = N, EXPORT = Y
+SVC0000106	SVRNAME = svr6, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000107	SVRNAME = svr7, SVCTIME = 30, AUTOTRAN = N, EXPORT = Y
+SVC0000108	SVRNAME = svr8, SVCTIME = 52, AUTOTRAN = N, EXPORT = Y
+SVC0000109	SVRNAME = svr9, SVCTIME = 50, AUTOTRAN = N, EXPORT = Y
+SVC0000110	SVRNAME = svr10, SVCTIME = 37, AUTOTRAN = N, EXPORT = Y
+SVC0000111	SVRNAME = svr11, SVCTIME = 13, AUTOTRAN = N, EXPORT = Y
+SVC0000112	SVRNAME = svr12, SVCTIME = 57, AUTOTRAN = N, EXPORT = Y
+SVC0000113	SVRNAME = svr13, SVCTIME = 29, AUTOTRAN = N, EXPORT = Y
+SVC0000114	SVRNAME = svr14, SVCTIME = 18, AUTOTRAN = N, EXPORT = Y
+SVC0000115	SVRNAME = svr15, SVCTIME = 23, AUTOTRAN = N, EXPORT = Y
+SVC0000116	SVRNAME = svr16, SVCTIME = 13, AUTOTRAN = N, EXPORT = Y
+SVC0000117	SVRNAME = svr17, SVCTIME = 29, AUTOTRAN = N, EXPORT = Y
+SVC0000118	SVRNAME = svr18, SVCTIME = 14, AUTOTRAN = N, EXPORT = Y
+SVC0000119	SVRNAME = svr19, SVCTIME = 14, AUTOTRAN = N, EXPORT = Y
+SVC0000120	SVRNAME = svr20, SVCTIME = 29, AUTOTRAN = N, EXPORT = Y
+SVC0000121	SVRNAME = svr21, SVCTIME = 29, AUTOTRAN = N, EXPORT = Y
+SVC0000122	SVRNAME = svr22, SVCTIME = 57, AUTOTRAN = N, EXPORT = Y
+SVC0000123	SVRNAME = svr23, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000124	SVRNAME = svr24, SVCTIME = 36, AUTOTRAN = N, EXPORT = Y
+SVC0000125	SVRNAME = svr25, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000126	SVRNAME = svr26, SVCTIME = 26, AUTOTRAN = N, EXPORT = Y
+SVC0000127	SVRNAME = svr27, SVCTIME = 18, AUTOTRAN = N, EXPORT = Y
+SVC0000128	SVRNAME = svr28, SVCTIME = 10, AUTOTRAN = N, EXPORT = Y
+SVC0000129	SVRNAME = svr29, SVCTIME = 45, AUTOTRAN = N, EXPORT = Y
+SVC0000130	SVRNAME = svr30, SVCTIME = 12, AUTOTRAN = N, EXPORT = Y
+SVC0000131	SVRNAME = svr31, SVCTIME = 47, AUTOTRAN = N, EXPORT = Y
+SVC0000132	SVRNAME = svr32, SVCTIME = 23, AUTOTRAN = N, EXPORT = Y
+SVC0000133	SVRNAME = svr33, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000134	SVRNAME = svr34, SVCTIME = 39, AUTOTRAN = N, EXPORT = Y
+SVC0000135	SVRNAME = svr35, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000136	SVRNAME = svr36, SVCTIME = 59, AUTOTRAN = N, EXPORT = Y
+SVC0000137	SVRNAME = svr37, SVCTIME = 55, AUTOTRAN = N, EXPORT = Y
+SVC0000138	SVRNAME = svr38, SVCTIME = 49, AUTOTRAN = N, EXPORT = Y
+SVC0000139	SVRNAME = svr39, SVCTIME = 42, AUTOTRAN = N, EXPORT = Y
+SVC0000140	SVRNAME = svr40, SVCTIME = 12, AUTOTRAN = N, EXPORT = Y
+SVC0000141	SVRNAME = svr41, SVCTIME = 34, AUTOTRAN = N, EXPORT = Y
+SVC0000142	SVRNAME = svr42, SVCTIME = 22, AUTOTRAN = N, EXPORT = Y
+SVC0000143	SVRNAME = svr43, SVCTIME = 32, AUTOTRAN = N, EXPORT = Y
+SVC0000144	SVRNAME = svr44, SVCTIME = 16, AUTOTRAN = N, EXPORT = Y
+SVC0000145	SVRNAME = svr45, SVCTIME = 23, AUTOTRAN = N, EXPORT = Y
+SVC0000146	SVRNAME = svr46, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000147	SVRNAME = svr47, SVCTIME = 53, AUTOTRAN = N, EXPORT = Y
+SVC0000148	SVRNAME = svr48, SVCTIME = 37, AUTOTRAN = N, EXPORT = Y
+SVC0000149	SVRNAME = svr49, SVCTIME = 47, AUTOTRAN = N, EXPORT = Y
+SVC0000150	SVRNAME = svr0, SVCTIME = 22, AUTOTRAN = N, EXPORT = Y
+SVC0000151	SVRNAME = svr1, SVCTIME = 41, AUTOTRAN = N, EXPORT = Y
+SVC0000152	SVRNAME = svr2, SVCTIME = 16, AUTOTRAN = N, EXPORT = Y
+SVC0000153	SVRNAME = svr3, SVCTIME = 52, AUTOTRAN = N, EXPORT = Y
+SVC0000154	SVRNAME = svr4, SVCTIME = 34, AUTOTRAN = N, EXPORT = Y
+SVC0000155	SVRNAME = svr5, SVCTIME = 28, AUTOTRAN = N, EXPORT = Y
+SVC0000156	SVRNAME = svr6, SVCTIME = 42, AUTOTRAN = N, EXPORT = Y
+SVC0000157	SVRNAME = svr7, SVCTIME = 41, AUTOTRAN = N, EXPORT = Y
+SVC0000158	SVRNAME = svr8, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000159	SVRNAME = svr9, SVCTIME = 30, AUTOTRAN = N, EXPORT = Y
+SVC0000160	SVRNAME = svr10, SVCTIME = 49, AUTOTRAN = N, EXPORT = Y
+SVC0000161	SVRNAME = svr11, SVCTIME = 35, AUTOTRAN = N, EXPORT = Y
+SVC0000162	SVRNAME = svr12, SVCTIME = 28, AUTOTRAN = N, EXPORT = Y
+SVC0000163	SVRNAME = svr13, SVCTIME = 11, AUTOTRAN = N, EXPORT = Y
+SVC0000164	SVRNAME = svr14, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000165	SVRNAME = svr15, SVCTIME = 22, AUTOTRAN = N, EXPORT = Y
+SVC0000166	SVRNAME = svr16, SVCTIME = 30, AUTOTRAN = N, EXPORT = Y
+SVC0000167	SVRNAME = svr17, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000168	SVRNAME = svr18, SVCTIME = 60, AUTOTRAN = N, EXPORT = Y
+SVC0000169	SVRNAME = svr19, SVCTIME = 18, AUTOTRAN = N, EXPORT = Y
+SVC0000170	SVRNAME = svr20, SVCTIME = 31, AUTOTRAN = N, EXPORT = Y
+SVC0000171	SVRNAME = svr21, SVCTIME = 37, AUTOTRAN = N, EXPORT = Y
+SVC0000172	SVRNAME = svr22, SVCTIME = 23, AUTOTRAN = N, EXPORT = Y
+SVC0000173	SVRNAME = svr23, SVCTIME = 27, AUTOTRAN = N, EXPORT = Y
+SVC0000174	SVRNAME = svr24, SVCTIME = 53, AUTOTRAN = N, EXPORT = Y
+SVC0000175	SVRNAME = svr25, SVCTIME = 16, AUTOTRAN = N, EXPORT = Y
+SVC0000176	SVRNAME = svr26, SVCTIME = 34, AUTOTRAN = N, EXPORT = Y
+SVC0000177	SVRNAME = svr27, SVCTIME = 45, AUTOTRAN = N, EXPORT = Y
+SVC0000178	SVRNAME = svr28, SVCTIME = 32, AUTOTRAN = N, EXPORT = Y
+SVC0000179	SVRNAME = svr29, SVCTIME = 53, AUTOTRAN = N, EXPORT = Y
+SVC0000180	SVRNAME = svr30, SVCTIME = 44, AUTOTRAN = N, EXPORT = Y
+SVC0000181	SVRNAME = svr31, SVCTIME = 41, AUTOTRAN = N, EXPORT = Y
+SVC0000182	SVRNAME = svr32, SVCTIME = 59, AUTOTRAN = N, EXPORT = Y
+SVC0000183	SVRNAME = svr33, SVCTIME = 44, AUTOTRAN = N, EXPORT = Y
+SVC0000184	SVRNAME = svr34, SVCTIME = 25, AUTOTRAN = N, EXPORT = Y
+SVC0000185	SVRNAME = svr35, SVCTIME = 14, AUTOTRAN = N, EXPORT = Y
+SVC0000186	SVRNAME = svr36, SVCTIME = 56, AUTOTRAN = N, EXPORT = Y
+SVC0000187	SVRNAME = svr37, SVCTIME = 12, AUTOTRAN = N, EXPORT = Y
+SVC0000188	SVRNAME = svr38, SVCTIME = 15, AUTOTRAN = N, EXPORT = Y
+SVC0000189	SVRNAME = svr39, SVCTIME = 18, AUTOTRAN = N, EXPORT = Y
+SVC0000190	SVRNAME = svr40, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000191	SVRNAME = svr41, SVCTIME = 20, AUTOTRAN = N, EXPORT = Y
+SVC0000192	SVRNAME = svr42, SVCTIME = 44, AUTOTRAN = N, EXPORT = Y
+SVC0000193	SVRNAME = svr43, SVCTIME = 23, AUTOTRAN = N, EXPORT = Y
+SVC0000194	SVRNAME = svr44, SVCTIME = 27, AUTOTRAN = N, EXPORT = Y
+SVC0000195	SVRNAME = svr45, SVCTIME = 58, AUTOTRAN = N, EXPORT = Y
+SVC0000196	SVRNAME = svr46, SVCTIME = 31, AUTOTRAN = N, EXPORT = Y
+SVC0000197	SVRNAME = svr47, SVCTIME = 48, AUTOTRAN = N, EXPORT = Y
+SVC0000198	SVRNAME = svr48, SVCTIME = 42, AUTOTRAN = N, EXPORT = Y
+SVC0000199	SVRNAME = svr49, SVCTIME = 26, AUTOTRAN = N, EXPORT = Y
+SVC0000200	SVRNAME = svr0, SVCTIME = 33, AUTOTRAN = N, EXPORT = Y
+SVC0000201	SVRNAME = svr1, SVCTIME = 31, AUTOTRAN = N, EXPORT = Y
+SVC0000202	SVRNAME = svr2, SVCTIME = 31, AUTOTRAN = N, EXPORT = Y
+SVC0000203	SVRNAME = svr3, SVCTIME = 17, AUTOTRAN = N, EXPORT = Y
+SVC0000204	SVRNAME = svr4, SVCTIME = 28, AUTOTRAN = N, EXPORT = Y
+SVC0000205	SVRNAME = svr5, SVCTIME = 25, AUTOTRAN = N, EXPORT = Y
+SVC0000206	SVRNAME = svr6, SVCTIME = 48, AUTOTRAN = N, EXPORT = Y
+SVC0000207	SVRNAME = svr7, SVCTIME = 59, AUTOTRAN = N, EXPORT = Y
+SVC0000208	SVRNAME = svr8, SVCTIME = 55, AUTOTRAN = N, EXPORT = Y
+SVC0000209	SVRNAME = svr9, SVCTIME = 41, AUTOTRAN = N, EXPORT = Y
+SVC0000210	SVRNAME = svr10, SVCTIME = 18, AUTOTRAN = N, EXPORT = Y
+SVC0000211	SVRNAME = svr11, SVCTIME = 47, AUTOTRAN = N, EXPORT = Y
+SVC0000212	SVRNAME = svr12, SVCTIME = 45, AUTOTRAN = N, EXPORT = Y
+SVC0000213	SVRNAME = svr13, SVCTIME = 59, AUTOTRAN = N, EXPORT = Y
+SVC0000214	SVRNAME = svr14, SVCTIME = 16, AUTOTRAN = N, EXPORT = Y
+SVC0000215	SVRNAME = svr15, SVCTIME = 30, AUTOTRAN = N, EXPORT = Y
+SVC0000216	SVRNAME = svr16, SVCTIME = 12, AUTOTRAN = N, EXPORT = Y
+SVC0000217	SVRNAME = svr17, SVCTIME = 36, AUTOTRAN = N, EXPORT = Y
+SVC0000218	SVRNAME = svr18, SVCTIME = 14, AUTOTRAN = N, EXPORT = Y
+SVC0000219	SVRNAME = svr19, SVCTIME = 34, AUTOTRAN = N, EXPORT = Y
+SVC0000220	SVRNAME = svr20, SVCTIME = 60, AUTOTRAN = N, EXPORT = Y
+SVC0000221	SVRNAME = svr21, SVCTIME = 19, AUTOTRAN = N, EXPORT = Y
+SVC0000222	SVRNAME = svr22, SVCTIME = 18, AUTOTRAN = N, EXPORT = Y
+SVC0000223	SVRNAME = svr23, SVCTIME = 31, AUTOTRAN = N, EXPORT = Y
+SVC0000224	SVRNAME = svr24, SVCTIME = 17, AUTOTRAN = N, EXPORT = Y
+SVC0000225	SVRNAME = svr25, SVCTIME = 49, AUTOTRAN = N, EXPORT = Y
+SVC0000226	SVRNAME = svr26, SVCTIME = 47, AUTOTRAN = N, EXPORT = Y
+SVC0000227	SVRNAME = svr27, SVCTIME = 60, AUTOTRAN = N, EXPORT = Y
+SVC0000228	SVRNAME = svr28, SVCTIME = 34, AUTOTRAN = N, EXPORT = Y
+SVC0000229	SVRNAME = svr29, SVCTIME = 14, AUTOTRAN = N, EXPORT = Y
+SVC0000230	SVRNAME = svr30, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000231	SVRNAME = svr31, SVCTIME = 45, AUTOTRAN = N, EXPORT = Y
+SVC0000232	SVRNAME = svr32, SVCTIME = 24, AUTOTRAN = N, EXPORT = Y
+SVC0000233	SVRNAME = svr33, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000234	SVRNAME = svr34, SVCTIME = 15, AUTOTRAN = N, EXPORT = Y
+SVC0000235	SVRNAME = svr35, SVCTIME = 27, AUTOTRAN = N, EXPORT = Y
+SVC0000236	SVRNAME = svr36, SVCTIME = 33, AUTOTRAN = N, EXPORT = Y
+SVC0000237	SVRNAME = svr37, SVCTIME = 28, AUTOTRAN = N, EXPORT = Y
+SVC0000238	SVRNAME = svr38, SVCTIME = 46, AUTOTRAN = N, EXPORT = Y
+SVC0000239	SVRNAME = svr39, SVCTIME = 44, AUTOTRAN = N, EXPORT = Y
+SVC0000240	SVRNAME = svr40, SVCTIME = 17, AUTOTRAN = N, EXPORT = Y
+SVC0000241	SVRNAME = svr41, SVCTIME = 39, AUTOTRAN = N, EXPORT = Y
+SVC0000242	SVRNAME = svr42, SVCTIME = 27, AUTOTRAN = N, EXPORT = Y
+SVC0000243	SVRNAME = svr43, SVCTIME = 16, AUTOTRAN = N, EXPORT = Y
+SVC0000244	SVRNAME = svr44, SVCTIME = 60, AUTOTRAN = N, EXPORT = Y
+SVC0000245	SVRNAME = svr45, SVCTIME = 12, AUTOTRAN = N, EXPORT = Y
+SVC0000246	SVRNAME = svr46, SVCTIME = 28, AUTOTRAN = N, EXPORT = Y
+SVC0000247	SVRNAME = svr47, SVCTIME = 10, AUTOTRAN = N, EXPORT = Y
+SVC0000248	SVRNAME = svr48, SVCTIME = 49, AUTOTRAN = N, EXPORT = Y
+SVC0000249	SVRNAME = svr49, SVCTIME = 52, AUTOTRAN = N, EXPORT = Y
+
+*GATEWAY
+gw0	NODENAME = "node0", PORTNO = 9000, RGWADDR = "10.0.0.0",
+		RGWPORTNO = 9500, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw1	NODENAME = "node1", PORTNO = 9001, RGWADDR = "10.0.0.1",
+		RGWPORTNO = 9501, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw2	NODENAME = "node2", PORTNO = 9002, RGWADDR = "10.0.0.2",
+		RGWPORTNO = 9502, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw3	NODENAME = "node3", PORTNO = 9003, RGWADDR = "10.0.0.3",
+		RGWPORTNO = 9503, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw4	NODENAME = "node0", PORTNO = 9004, RGWADDR = "10.0.0.4",
+		RGWPORTNO = 9504, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw5	NODENAME = "node1", PORTNO = 9005, RGWADDR = "10.0.0.5",
+		RGWPORTNO = 9505, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw6	NODENAME = "node2", PORTNO = 9006, RGWADDR = "10.0.0.6",
+		RGWPORTNO = 9506, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw7	NODENAME = "node3", PORTNO = 9007, RGWADDR = "10.0.0.7",
+		RGWPORTNO = 9507, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw8	NODENAME = "node0", PORTNO = 9008, RGWADDR = "10.0.0.8",
+		RGWPORTNO = 9508, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw9	NODENAME = "node1", PORTNO = 9009, RGWADDR = "10.0.0.9",
+		RGWPORTNO = 9509, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw10	NODENAME = "node2", PORTNO = 9010, RGWADDR = "10.0.0.10",
+		RGWPORTNO = 9510, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw11	NODENAME = "node3", PORTNO = 9011, RGWADDR = "10.0.0.11",
+		RGWPORTNO = 9511, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw12	NODENAME = "node0", PORTNO = 9012, RGWADDR = "10.0.0.12",
+		RGWPORTNO = 9512, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw13	NODENAME = "node1", PORTNO = 9013, RGWADDR = "10.0.0.13",
+		RGWPORTNO = 9513, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw14	NODENAME = "node2", PORTNO = 9014, RGWADDR = "10.0.0.14",
+		RGWPORTNO = 9514, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw15	NODENAME = "node3", PORTNO = 9015, RGWADDR = "10.0.0.15",
+		RGWPORTNO = 9515, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw16	NODENAME = "node0", PORTNO = 9016, RGWADDR = "10.0.0.16",
+		RGWPORTNO = 9516, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw17	NODENAME = "node1", PORTNO = 9017, RGWADDR = "10.0.0.17",
+		RGWPORTNO = 9517, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw18	NODENAME = "node2", PORTNO = 9018, RGWADDR = "10.0.0.18",
+		RGWPORTNO = 9518, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
+gw19	NODENAME = "node3", PORTNO = 9019, RGWADDR = "10.0.0.19",
+		RGWPORTNO = 9519, DIRECTION = BIDIR, GWTYPE = TMAX, CPC = 2
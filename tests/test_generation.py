@@ -0,0 +1,36 @@
+"""설정 세대 갱신 테스트 (세대는 올라가기만 해야 함)"""
+
+import pytest
+
+from routers import system
+
+
+@pytest.fixture
+def generation_state(monkeypatch):
+    """세대 0, 콜백 기록기만 등록된 상태"""
+    changes = []
+    monkeypatch.setattr(system, "config_generation", 0)
+    monkeypatch.setattr(system, "generation_callbacks", [changes.append])
+    return changes
+
+
+def test_late_remote_notify_does_not_lower_generation(generation_state):
+    system.mark_config_loaded(5)
+    system.apply_remote_generation(3)
+    
+    assert system.config_generation == 5
+    assert generation_state == [5]
+
+
+def test_slower_local_reload_does_not_lower_generation(generation_state):
+    system.apply_remote_generation(7)
+    
+    assert system.mark_config_loaded(6) is False
+    assert system.config_generation == 7
+    assert generation_state == [7]
+
+
+def test_same_generation_reload_keeps_callbacks_quiet(generation_state):
+    assert system.mark_config_loaded(2) is True
+    assert system.mark_config_loaded(2) is False
+    assert generation_state == [2]
@@ -0,0 +1,54 @@
+"""증분 리로드 (incremental_load) 테스트"""
+
+import pytest
+
+from models import Node, SvrGroup, Server
+
+CONFIG_TEMPLATE = """*DOMAIN
+tmax1\tSHMKEY = 78351, TPORTNO = 8350, DOMAINID = 1
+
+*NODE
+{node}\tHOSTNAME = "host0", TmaxPort = 8350,
+\t\tMAXSVR = 100, MAXUSER = 1000, TMAXHOME = "/home/tmax"
+
+*SVRGROUP
+{svg}\tNODENAME = "{node}", RESTART = Y, AUTOBACKUP = N
+
+*SERVER
+svr0\tSVGNAME = {svg}, MIN = 1, MAX = 5
+
+*SERVICE
+SVC0\tSVRNAME = svr0
+"""
+
+
+def _load(db, config_dir, node, svg, mode="incremental"):
+    import main
+    
+    config_dir("scorap0.m", CONFIG_TEMPLATE.format(node=node, svg=svg))
+    return main.load_all_configs_to_db(db, mode)
+
+
+@pytest.mark.parametrize("svg", ["svg0", "svg9"])
+def test_rename_node(db, config_dir, svg):
+    """
+    노드 이름이 바뀌어도 FK 위반 없이 서버 그룹이 새 노드로 옮겨진 뒤 이전 노드가 삭제됨
+    서버 그룹 이름이 그대로면 서버 그룹 행은 UPDATE, 같이 바뀌면 DELETE + INSERT
+    """
+    _load(db, config_dir, "node0", "svg0", mode="full")
+    
+    stats = _load(db, config_dir, "node9", svg)
+    
+    assert stats["load"]["mode"] == "incremental"
+    assert [n.name for n in db.query(Node)] == ["node9"]
+    assert [(s.name, s.node_name) for s in db.query(SvrGroup)] == [(svg, "node9")]
+    assert [(s.name, s.svg_name) for s in db.query(Server)] == [("svr0", svg)]
+
+
+def test_unchanged_reload_has_no_changes(db, config_dir):
+    _load(db, config_dir, "node0", "svg0", mode="full")
+    
+    stats = _load(db, config_dir, "node0", "svg0")
+    
+    changes = stats["load"]["changes"]
+    assert (changes["inserted"], changes["updated"], changes["deleted"]) == (0, 0, 0)
@@ -0,0 +1,31 @@
+"""keyset 페이지네이션 테스트"""
+
+from models import Node
+from pagination import keyset_page
+
+
+def _add_nodes(db, count: int):
+    db.add_all([Node(name=f"node{i}", hostname=f"host{i}") for i in range(count)])
+    db.commit()
+
+
+def test_after_without_limit_returns_rest_in_id_order(db):
+    _add_nodes(db, 5)
+    ids = [node.id for node in db.query(Node).order_by(Node.id)]
+
+    rows, next_after = keyset_page(db.query(Node), Node, None, ids[1])
+
+    assert [row.id for row in rows] == ids[2:]
+    assert next_after is None
+
+
+def test_pages_follow_cursor(db):
+    _add_nodes(db, 5)
+    ids = [node.id for node in db.query(Node).order_by(Node.id)]
+
+    first, cursor = keyset_page(db.query(Node), Node, 2, None)
+    second, cursor = keyset_page(db.query(Node), Node, 2, cursor)
+    last, cursor = keyset_page(db.query(Node), Node, 2, cursor)
+
+    assert [row.id for row in first + second + last] == ids
+    assert cursor is None
@@ -0,0 +1,50 @@
+"""
+파싱 캐시 키 테스트
+크기와 수정 시각이 그대로인 파일은 다시 해시하지 않고, 바뀌면 내용 해시를 새로 계산하는지 확인한다.
+"""
+
+import hashlib
+import os
+
+import parse_cache
+
+
+def _count_hashing(monkeypatch):
+    """parse_cache가 sha256을 새로 만든 횟수를 세는 리스트 반환"""
+    calls = []
+    original = hashlib.sha256
+
+    def sha256(*args):
+        calls.append(1)
+        return original(*args)
+
+    monkeypatch.setattr(parse_cache.hashlib, "sha256", sha256)
+    return calls
+
+
+def test_unchanged_file_is_not_rehashed(tmp_path, monkeypatch):
+    calls = _count_hashing(monkeypatch)
+    path = tmp_path / "scorap0.m"
+    path.write_text("*DOMAIN\ntmax1 SHMKEY = 1\n")
+
+    first = parse_cache.file_cache_key(str(path))
+    second = parse_cache.file_cache_key(str(path))
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_changed_file_is_rehashed(tmp_path, monkeypatch):
+    calls = _count_hashing(monkeypatch)
+    path = tmp_path / "scorap0.m"
+    path.write_text("*DOMAIN\ntmax1 SHMKEY = 1\n")
+    first = parse_cache.file_cache_key(str(path))
+
+    # 같은 크기로 내용만 바꾸고 수정 시각을 옮김
+    path.write_text("*DOMAIN\ntmax1 SHMKEY = 2\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, first[2] + 1_000_000))
+    second = parse_cache.file_cache_key(str(path))
+
+    assert len(calls) == 2
+    assert second[3] != first[3]
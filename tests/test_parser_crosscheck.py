@@ -0,0 +1,120 @@
+"""
+파서 교차 검증
+tests/fixtures/*.m 각각에 대해 다음이 모두 같은 결과를 내는지 확인한다.
+- 공용 코어: 텍스트 경로 vs mmap 경로, dict vs __slots__ 레코드, 순차 vs 샤드 파싱
+- Flask 파서(tpconfig_parser.py) vs FastAPI 파서(backend/parser.py)
+  (섹션 키 대소문자와 빈 값 제외 규칙만 다르고 내용은 같아야 함)
+"""
+
+import glob
+import os
+from typing import Any, Dict
+
+import pytest
+
+import parser as backend_parser
+import tpconfig_parser
+from conftest import FIXTURES_DIR
+from tpconfig.core import SECTIONS, collect, iter_raw_entries, parse_config
+from tpconfig.shards import parse_shard, plan_shards
+
+# 샤드 경계를 많이 만들어 보도록 작은 샤드로 검증
+CROSSCHECK_SHARDS = 64
+
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.m")))
+
+fixture_files = pytest.mark.parametrize("config_file", FIXTURES, ids=os.path.basename)
+
+
+def _plain(value: Any) -> Any:
+    """레코드/defaultdict를 비교 가능한 plain dict/list로 변환"""
+    if hasattr(value, "items"):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _drop_empty(attrs: Dict[str, str]) -> Dict[str, str]:
+    return {key: value for key, value in attrs.items() if value}
+
+
+def _flask_as_backend(flask_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flask 파서 출력을 FastAPI 파서 규칙(소문자 키, 빈 값 제외)으로 변환"""
+    converted = {}
+    for section in SECTIONS:
+        entries = _plain(flask_data[section.upper()])
+        if section == "domain":
+            converted[section] = _drop_empty(entries) if entries else {}
+        elif section == "server":
+            converted[section] = {
+                name: [_drop_empty(attrs) for attrs in srv_list]
+                for name, srv_list in entries.items()
+            }
+        else:
+            converted[section] = {
+                name: _drop_empty(attrs) for name, attrs in entries.items()
+            }
+    return converted
+
+
+@fixture_files
+def test_core_text_and_mmap_entries_match(config_file):
+    assert list(iter_raw_entries(config_file, use_mmap=True)) == list(iter_raw_entries(config_file))
+
+
+@fixture_files
+def test_core_dict_and_compact_records_match(config_file):
+    dict_sections, dict_index = parse_config(config_file)
+    record_sections, record_index = parse_config(config_file, compact=True)
+    
+    assert _plain(record_sections) == _plain(dict_sections)
+    assert _plain(record_index.as_dict()) == _plain(dict_index.as_dict())
+
+
+@fixture_files
+def test_core_sharded_and_serial_match(config_file):
+    # 프로세스 없이 샤드를 차례로 파싱해서 이어 붙임
+    shard_entries = [
+        entry
+        for shard in plan_shards(config_file, CROSSCHECK_SHARDS, min_shard_bytes=1)
+        for entry in parse_shard(config_file, shard)
+    ]
+    shard_sections, shard_index = collect(shard_entries)
+    dict_sections, dict_index = parse_config(config_file)
+    
+    assert shard_sections == dict_sections
+    assert shard_index.as_dict() == dict_index.as_dict()
+
+
+@fixture_files
+def test_flask_and_backend_parsers_match(config_file):
+    flask = tpconfig_parser.TpConfigParser(config_file)
+    flask_data = flask.parse()
+    backend = backend_parser.TpConfigParser(config_file)
+    backend_data = backend.parse()
+    
+    expected = _flask_as_backend(flask_data)
+    for section in SECTIONS:
+        assert _plain(backend_data[section]) == expected[section], section
+    
+    for node_name in flask_data["NODE"]:
+        assert (
+            backend.get_node_info(backend_data, node_name)["server_groups"]
+            == flask.get_node_info(node_name)["server_groups"]
+        ), node_name
+    
+    for svg_name in flask_data["SVRGROUP"]:
+        flask_servers = [srv["name"] for srv in flask.get_server_group_info(svg_name)["servers"]]
+        backend_servers = [
+            srv["name"] for srv in backend.get_svrgroup_info(backend_data, svg_name)["servers"]
+        ]
+        assert backend_servers == flask_servers, svg_name
+
+
+def test_leading_nbsp_continues_previous_entry():
+    """들여쓰기 규칙: NBSP를 포함해 공백으로 시작하는 줄은 이전 엔트리의 연속 (두 파서 공통)"""
+    config_file = os.path.join(FIXTURES_DIR, "edge_whitespace.m")
+    
+    assert sorted(tpconfig_parser.TpConfigParser(config_file).parse()["NODE"]) == ["node2"]
+    assert sorted(backend_parser.TpConfigParser(config_file).parse()["node"]) == ["node2"]
@@ -0,0 +1,38 @@
+"""
+파서 golden-file 테스트
+tests/fixtures/<name>.m 파싱 결과를 mmap 리더 추가 전 tpconfig_parser.py로 만든
+<name>.expected.json과 비교한다. 텍스트 경로와 mmap 경로 모두 같은 결과여야 한다.
+"""
+
+import glob
+import json
+import os
+
+import pytest
+
+from conftest import FIXTURES_DIR
+from tpconfig_parser import TpConfigParser
+
+# 기대 결과가 있는 fixture만 (<name>.expected.json -> <name>.m)
+FIXTURES = sorted(
+    path[:-len(".expected.json")] + ".m"
+    for path in glob.glob(os.path.join(FIXTURES_DIR, "*.expected.json"))
+)
+
+
+def load_expected(path: str):
+    with open(path[:-len(".m")] + ".expected.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def as_json(data):
+    """튜플/레코드 등을 golden 파일과 같은 JSON 값으로 정규화"""
+    return json.loads(json.dumps(data, ensure_ascii=False))
+
+
+@pytest.mark.parametrize("use_mmap", [False, True], ids=["text", "mmap"])
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_parse_matches_golden(path, use_mmap):
+    parsed = TpConfigParser(path, use_mmap=use_mmap).parse()
+    
+    assert as_json(parsed) == load_expected(path)
@@ -0,0 +1,84 @@
+"""목록 API 쿼리 수 테스트 (행 수와 관계없이 일정해야 함, N+1 회귀 방지)"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import config_summary
+import database
+import main
+import models
+from auth import get_current_active_user
+
+LIST_ENDPOINTS = [
+    "/api/config",
+    "/api/nodes",
+    "/api/svrgroups",
+    "/api/servers",
+    "/api/services",
+    "/api/gateways",
+]
+
+
+def make_config(size: int) -> str:
+    """노드 size개, 노드마다 서버 그룹/게이트웨이 1개, 서버 그룹마다 서버 2개, 서버마다 서비스 2개"""
+    lines = ["*DOMAIN", "tmax1\tSHMKEY = 78351, TPORTNO = 8350, DOMAINID = 1", "", "*NODE"]
+    for i in range(size):
+        lines.append(f'node{i}\tHOSTNAME = "host{i}", TmaxPort = 8350, MAXSVR = 100, MAXUSER = 1000')
+    lines += ["", "*SVRGROUP"]
+    for i in range(size):
+        lines.append(f'svg{i}\tNODENAME = "node{i}", RESTART = Y, AUTOBACKUP = N')
+    lines += ["", "*SERVER"]
+    for i in range(size * 2):
+        lines.append(f"svr{i}\tSVGNAME = svg{i // 2}, MIN = 1, MAX = 5")
+    lines += ["", "*SERVICE"]
+    for i in range(size * 4):
+        lines.append(f"SVC{i}\tSVRNAME = svr{i // 2}")
+    lines += ["", "*GATEWAY"]
+    for i in range(size):
+        lines.append(f'gw{i}\tNODENAME = "node{i}", PORTNO = {9000 + i}, RGWADDR = "10.0.0.{i}", RGWPORTNO = 9000')
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def client():
+    # startup 이벤트를 실행하지 않으므로 세대가 0으로 남아 응답 캐시를 거치지 않음
+    main.app.dependency_overrides[get_current_active_user] = lambda: models.User(
+        username="admin", role=models.UserRole.ADMIN
+    )
+    try:
+        yield TestClient(main.app)
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+def count_queries(client: TestClient, path: str) -> int:
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(database.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(database.engine, "before_cursor_execute", before_cursor_execute)
+    assert response.status_code == 200, response.text
+    return len(statements)
+
+
+def query_counts(db, config_dir, client, size: int):
+    config_dir("scorap0.m", make_config(size))
+    main.load_all_configs_to_db(db, "full")
+    # 세대 0으로 계산해 둔 요약을 버려서 /api/config도 매번 DB에서 계산하게 함
+    config_summary._cached = None
+    return {path: count_queries(client, path) for path in LIST_ENDPOINTS}
+
+
+def test_list_query_counts_do_not_grow_with_rows(db, config_dir, client):
+    small = query_counts(db, config_dir, client, 2)
+    large = query_counts(db, config_dir, client, 30)
+    
+    assert large == small
+    # 본 쿼리 + selectinload, /api/config 요약은 개수/도메인/노드/서버 그룹 4개
+    assert all(count <= 4 for count in large.values()), large
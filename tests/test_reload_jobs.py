@@ -0,0 +1,54 @@
+"""리로드 작업 관리 (ReloadJobManager) 테스트"""
+
+import threading
+
+from reload_jobs import ReloadJobManager
+
+
+class BlockingRunner:
+    """release()할 때까지 끝나지 않는 runner, 실행한 작업의 mode를 기록"""
+    
+    def __init__(self):
+        self.modes = []
+        self._release = threading.Event()
+    
+    def __call__(self, job):
+        self.modes.append(job.mode)
+        self._release.wait(5)
+        return {"mode": job.mode}
+    
+    def release(self):
+        self._release.set()
+
+
+def test_incremental_request_merges_into_running_job():
+    runner = BlockingRunner()
+    manager = ReloadJobManager(runner)
+    
+    first, merged_first = manager.submit("incremental", "a")
+    second, merged_second = manager.submit("incremental", "b")
+    runner.release()
+    
+    assert (merged_first, merged_second) == (False, True)
+    assert second is first
+    assert first.wait(5)
+    assert runner.modes == ["incremental"]
+
+
+def test_full_request_during_incremental_job_runs_afterwards():
+    runner = BlockingRunner()
+    manager = ReloadJobManager(runner)
+    
+    running, _ = manager.submit("incremental", "watcher")
+    queued, merged = manager.submit("full", "admin")
+    again, merged_again = manager.submit("incremental", "watcher")
+    runner.release()
+    
+    assert merged is False
+    assert queued is not running
+    assert queued.queued_after == running.job_id
+    assert again is queued and merged_again is True
+    assert queued.wait(5)
+    assert queued.status == "succeeded"
+    assert runner.modes == ["incremental", "full"]
+
@@ -0,0 +1,47 @@
+"""
+KEY = VALUE 토크나이저 단위 테스트
+텍스트 경로(tokenize)와 mmap 경로(tokenize_bytes)가 같은 결과를 내는지도 함께 확인한다.
+"""
+
+import pytest
+
+from tpconfig.tokenizer import tokenize, tokenize_bytes
+
+
+def _both(lines):
+    """텍스트/bytes 두 경로의 결과가 같은지 확인하고 결과 반환"""
+    pairs = tokenize(lines)
+    assert tokenize_bytes([line.encode("utf-8") for line in lines]) == pairs
+    return pairs
+
+
+@pytest.mark.parametrize("lines, expected", [
+    (["svr1 ENV = A=B, MIN = 1"], [("ENV", "A=B"), ("MIN", "1")]),
+    (["svr1 CLOPT = -e KEY=VAL", "MIN = 1"], [("CLOPT", "-e KEY=VAL"), ("MIN", "1")]),
+    (['svr1 ENV = "A=B, C=D", MIN = 1'], [("ENV", "A=B, C=D"), ("MIN", "1")]),
+], ids=["unquoted", "unquoted-spaces", "quoted"])
+def test_equals_inside_value(lines, expected):
+    assert _both(lines) == expected
+
+
+def test_escaped_quotes_inside_value():
+    pairs = _both(['svr1 X = "a \\"b\\" c", Y = \'it\\\'s\', MIN = 1'])
+
+    assert pairs == [("X", 'a \\"b\\" c'), ("Y", "it\\'s"), ("MIN", "1")]
+
+
+def test_escaped_quote_does_not_open_continuation():
+    # 이스케이프된 따옴표 하나 때문에 다음 줄까지 한 값으로 이어 붙이지 않아야 함
+    pairs = _both(['svr1 X = "say \\"hi", MIN = 1', "MAX = 2"])
+
+    assert pairs == [("X", 'say \\"hi'), ("MIN", "1"), ("MAX", "2")]
+
+
+@pytest.mark.parametrize("lines, expected", [
+    (["node1 MAXSVR =", "200, MAXUSER = 10"], [("MAXSVR", "200"), ("MAXUSER", "10")]),
+    (['svr1 CLOPT = "-o a,', '-e b", MIN = 1'], [("CLOPT", "-o a, -e b"), ("MIN", "1")]),
+    (["node1 HOSTNAME = \"h\",", "TmaxPort = 8350, EMPTY = ,", "MAXSVR = 3"],
+     [("HOSTNAME", "h"), ("TmaxPort", "8350"), ("EMPTY", ""), ("MAXSVR", "3")]),
+], ids=["trailing-equals", "open-quote", "per-line"])
+def test_multiline_continuation(lines, expected):
+    assert _both(lines) == expected
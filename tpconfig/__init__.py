@@ -0,0 +1,15 @@
+"""
+tpconfig 공용 파싱 모듈
+Flask(tpconfig_parser.py)와 FastAPI(backend/parser.py) 파서가 함께 사용
+"""
+
+from .tokenizer import tokenize, tokenize_bytes
+from .mmap_reader import iter_mmap_entries
+from .records import Record, make_record
+from .indexes import RelationIndex
+from .core import iter_entries, parse_config
+from .shards import parse_config_sharded
+
+__all__ = ["tokenize", "tokenize_bytes", "iter_mmap_entries", "Record", "make_record",
+           "RelationIndex", "iter_entries", "parse_config",
+           "parse_config_sharded"]
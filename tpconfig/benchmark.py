@@ -0,0 +1,213 @@
+"""
+tpconfig 파싱 성능 벤치마크
+합성 tp_config 파일(기본 10만 엔트리)을 만들어 처리량/메모리를 측정한다.
+
+사용법: python -m tpconfig.benchmark [--entries 100000] [--memory | --shards [--max-workers N]]
+"""
+
+import argparse
+import gc
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+from .core import parse_config
+from .shards import parse_config_sharded, plan_shards
+
+from .mmap_reader import iter_mmap_entries
+from .records import make_record
+from .tokenizer import tokenize
+
+# 기존 파서가 엔트리마다 사용하던 패턴 (비교 기준)
+LEGACY_PATTERN = r'(\w+)\s*=\s*([^,]+?)(?:\s*,|\s*$)'
+
+
+def write_synthetic_config(path: str, entries: int) -> None:
+    """SERVER/SERVICE 위주의 합성 tp_config 파일 생성"""
+    servers = max(1, entries // 6)
+    services = max(1, entries - servers)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("*DOMAIN\n")
+        f.write("tmax1\tSHMKEY = 78350, TPORTNO = 8350, MAXUSER = 5000,\n")
+        f.write("\t\tDOMAINID = 1\n\n*NODE\n")
+        for i in range(4):
+            f.write(f'node{i}\tHOSTNAME = "host{i}", TmaxPort = 8350,\n')
+            f.write(f'\t\tMAXSVR = 500, MAXUSER = 1000, TMAXHOME = "/home/tmax"\n')
+        f.write("\n*SVRGROUP\n")
+        for i in range(40):
+            f.write(f'svg{i}\tNODENAME = "node{i % 4}", RESTART = Y, AUTOBACKUP = N\n')
+        f.write("\n*SERVER\n")
+        for i in range(servers):
+            f.write(f'svr{i}\tSVGNAME = svg{i % 40}, MIN = 1, MAX = 10,\n')
+            f.write(f'\t\tRESTART = Y, MAXQCOUNT = 100, ASQCOUNT = 5,\n')
+            f.write(f'\t\tCLOPT = "-o $(SVR).out -e $(SVR).err -- -k DBU0{i % 4 + 1}:CORCON1"\n')
+        f.write("\n*SERVICE\n")
+        for i in range(services):
+            f.write(f'SVC{i:07d}\tSVRNAME = svr{i % servers}, SVCTIME = 30, AUTOTRAN = N\n')
+
+
+def read_entry_lines(path: str) -> List[List[str]]:
+    """파일을 엔트리별 줄 목록으로 분리 (토크나이저 입력만 준비)"""
+    entries = []
+    current = None
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("*"):
+                current = None
+                continue
+            if not line[0].isspace():
+                current = [stripped]
+                entries.append(current)
+            elif current is not None:
+                current.append(stripped)
+    return entries
+
+
+def legacy_attrs(lines: List[str]) -> Dict[str, str]:
+    """기존 방식: 줄을 합친 뒤 re.findall 결과를 하나씩 정리"""
+    attrs = {}
+    full_text = " ".join(lines)
+    for key, value in re.findall(LEGACY_PATTERN, full_text):
+        key = key.strip()
+        value = value.strip().strip('"\'')
+        if value:
+            attrs[key] = value
+    return attrs
+
+
+def tokenizer_attrs(lines: List[str]) -> Dict[str, str]:
+    """tokenize 결과로 같은 속성 dict 생성"""
+    attrs = dict(tokenize(lines))
+    if "" in attrs.values():
+        attrs = {key: value for key, value in attrs.items() if value}
+    return attrs
+
+
+def measure(func: Callable, entries: List[List[str]], repeat: int) -> float:
+    """가장 빠른 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for lines in entries:
+            func(lines)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_tokenizer(entries: int = 100000, repeat: int = 5) -> None:
+    """기존 정규식 방식과 tokenize 토크나이저 처리량 비교"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "synthetic.m")
+        write_synthetic_config(path, entries)
+        entry_lines = read_entry_lines(path)
+
+    legacy = measure(legacy_attrs, entry_lines, repeat)
+    tokenizer = measure(tokenizer_attrs, entry_lines, repeat)
+
+    count = len(entry_lines)
+    print(f"entries: {count}")
+    print(f"legacy re.findall : {legacy:.3f}s ({count / legacy:,.0f} entries/s)")
+    print(f"tokenize          : {tokenizer:.3f}s ({count / tokenizer:,.0f} entries/s)")
+    print(f"speedup           : {legacy / tokenizer:.2f}x")
+
+
+def measure_memory(build: Callable[[], object]) -> int:
+    """build()가 만든 결과가 차지하는 메모리(바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def bench_memory(entries: int = 100000) -> None:
+    """엔트리별 dict 표현과 __slots__ 레코드(intern) 표현의 메모리 비교"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "synthetic.m")
+        write_synthetic_config(path, entries)
+
+        def build_dicts():
+            result = []
+            for section, name, pairs in iter_mmap_entries(path):
+                attrs = {"name": name}
+                attrs.update(pairs)
+                result.append(attrs)
+            return result
+
+        def build_records():
+            result = []
+            for section, name, pairs in iter_mmap_entries(path):
+                attrs = {"name": name}
+                attrs.update(pairs)
+                result.append(make_record(section.lower(), attrs.items()))
+            return result
+
+        dict_bytes = measure_memory(build_dicts)
+        record_bytes = measure_memory(build_records)
+
+    print(f"dict entries    : {dict_bytes / 1024 / 1024:.1f} MB")
+    print(f"slotted records : {record_bytes / 1024 / 1024:.1f} MB")
+    print(f"reduction       : {dict_bytes / record_bytes:.2f}x")
+
+
+def bench_shards(entries: int = 100000, repeat: int = 5, max_workers: int = 0) -> None:
+    """단일 파일 순차 파싱과 워커 수별 샤드 병렬 파싱 비교"""
+    max_workers = max_workers or (os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "synthetic.m")
+        write_synthetic_config(path, entries)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        def best_of(func: Callable[[], object]) -> float:
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        serial = best_of(lambda: parse_config(path, use_mmap=True))
+        print(f"file: {size_mb:.1f} MB, cpus: {os.cpu_count()}")
+        print(f"serial             : {serial:.3f}s")
+
+        workers = 1
+        while workers <= max_workers:
+            shards = len(plan_shards(path, workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # 워커 기동 비용은 제외
+                list(executor.map(abs, range(workers)))
+                sharded = best_of(lambda: parse_config_sharded(path, executor, workers))
+            print(f"{workers:2d} workers ({shards:2d} shards): {sharded:.3f}s "
+                  f"({serial / sharded:.2f}x)")
+            workers *= 2
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="tpconfig parsing benchmark")
+    arg_parser.add_argument("--entries", type=int, default=100000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--memory", action="store_true",
+                            help="dict vs __slots__ 레코드 메모리 비교")
+    arg_parser.add_argument("--shards", action="store_true",
+                            help="단일 파일 샤드 병렬 파싱 워커 수별 비교")
+    arg_parser.add_argument("--max-workers", type=int, default=0,
+                            help="--shards 최대 워커 수 (0이면 CPU 수)")
+    args = arg_parser.parse_args()
+
+    if args.memory:
+        bench_memory(args.entries)
+    elif args.shards:
+        bench_shards(args.entries, args.repeat, args.max_workers)
+    else:
+        bench_tokenizer(args.entries, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
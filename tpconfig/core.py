@@ -0,0 +1,154 @@
+"""
+tp_config 파싱 코어
+Flask(tpconfig_parser.py)와 FastAPI(backend/parser.py) 파서가 공유하는 단일 경로.
+엔트리 경계 판정, KEY/VALUE 토큰화, 레코드 생성, 섹션별 수집, 관계 인덱스를
+여기서 한 번만 구현하고, 각 파서는 출력 형태(섹션 키 대소문자 등)만 맞춘다.
+"""
+
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from .tokenizer import tokenize
+from .mmap_reader import iter_mmap_entries
+from .records import make_record
+from .indexes import RelationIndex
+
+# 파서가 수집하는 섹션 (소문자)
+SECTIONS = ("domain", "node", "svrgroup", "server", "service", "gateway")
+
+
+def use_mmap_for(config_file: str, threshold_mb: int) -> bool:
+    """파일 크기가 threshold_mb(MB) 이상이면 mmap 리더 사용 (0이면 사용 안 함)"""
+    return threshold_mb > 0 and os.path.getsize(config_file) >= threshold_mb * 1024 * 1024
+
+
+def iter_raw_entries(
+    config_file: str,
+    use_mmap: bool = False
+) -> Iterator[Tuple[str, str, List[Tuple[str, str]]]]:
+    """
+    (section, name, pairs) 를 파일 순서대로 yield
+    section은 '*' 뒤 문자열 그대로 (정규화는 iter_entries에서)
+    규칙: 빈 줄/주석(#, //) 무시, 공백으로 시작하는 줄은 이전 엔트리에 이어짐
+    """
+    if use_mmap:
+        yield from iter_mmap_entries(config_file)
+        return
+    
+    section = ""
+    entry_name = ""
+    entry_lines: List[str] = []
+    
+    with open(config_file, 'r', encoding='utf-8', errors='ignore') as file:
+        for line in file:
+            stripped = line.strip()
+            
+            # 섹션 헤더
+            if stripped.startswith("*"):
+                if entry_name and entry_lines:
+                    yield section, entry_name, tokenize(entry_lines)
+                section = stripped[1:]
+                entry_name = ""
+                entry_lines = []
+                continue
+            
+            # 빈 줄이나 주석 무시
+            if not stripped or stripped.startswith("#") or stripped.startswith("//"):
+                continue
+            
+            if not line[0].isspace():
+                # 새 엔트리 시작 (들여쓰기 없음)
+                if entry_name and entry_lines:
+                    yield section, entry_name, tokenize(entry_lines)
+                entry_name = stripped.split(None, 1)[0]
+                entry_lines = [stripped]
+            elif entry_name:
+                entry_lines.append(stripped)
+    
+    if entry_name and entry_lines:
+        yield section, entry_name, tokenize(entry_lines)
+
+
+def normalize_entries(
+    raw_entries: Iterable[Tuple[str, str, List[Tuple[str, str]]]],
+    drop_empty: bool = False
+) -> Iterator[Tuple[str, str, Dict[str, str]]]:
+    """
+    iter_raw_entries 결과를 (소문자 section, name, attrs dict) 로 변환
+    섹션/이름이 없는 엔트리는 건너뛰고, drop_empty면 빈 값 속성 제외
+    """
+    for section, name, pairs in raw_entries:
+        section = section.strip().lower()
+        if not section or not name:
+            continue
+        
+        attrs = {"name": name}
+        attrs.update(pairs)
+        
+        if drop_empty and "" in attrs.values():
+            attrs = {key: value for key, value in attrs.items() if value}
+        
+        yield section, name, attrs
+
+
+def iter_entries(
+    config_file: str,
+    use_mmap: bool = False,
+    compact: bool = False,
+    drop_empty: bool = False
+) -> Iterator[Tuple[str, str, Mapping[str, str]]]:
+    """
+    (section, name, attrs) 를 파일 순서대로 yield
+    - section: 소문자 섹션명 (예: "server")
+    - attrs: {"name": name, KEY: VALUE, ...}
+    - drop_empty: 빈 값 속성 제외
+    - compact: dict 대신 __slots__ 레코드 (get/[]/items 동일)
+    """
+    entries = normalize_entries(iter_raw_entries(config_file, use_mmap), drop_empty)
+    if not compact:
+        return entries
+    return compact_entries(entries)
+
+
+def compact_entries(
+    entries: Iterable[Tuple[str, str, Dict[str, str]]]
+) -> Iterator[Tuple[str, str, Mapping[str, str]]]:
+    """attrs dict를 __slots__ 레코드로 변환 (레코드 타입이 없는 섹션은 dict 유지)"""
+    for section, name, attrs in entries:
+        yield section, name, make_record(section, attrs.items()) or attrs
+
+
+def collect(
+    entries: Iterable[Tuple[str, str, Mapping[str, str]]]
+) -> Tuple[Dict[str, Any], RelationIndex]:
+    """
+    엔트리를 섹션별로 수집해서 (sections, index) 반환
+    sections: {"domain": attrs, "node": {name: attrs}, ..., "server": {name: [attrs, ...]}}
+    - domain은 처음 것만, server는 같은 이름을 목록으로, 나머지는 나중 것이 이김
+    """
+    sections: Dict[str, Any] = {section: {} for section in SECTIONS}
+    index = RelationIndex()
+    
+    for section, name, attrs in entries:
+        if section == "domain":
+            if not sections["domain"]:
+                sections["domain"] = attrs
+        elif section == "server":
+            sections["server"].setdefault(name, []).append(attrs)
+        elif section in sections:
+            sections[section][name] = attrs
+        else:
+            continue
+        index.add(section, name, attrs)
+    
+    return sections, index
+
+
+def parse_config(
+    config_file: str,
+    use_mmap: bool = False,
+    compact: bool = False,
+    drop_empty: bool = False
+) -> Tuple[Dict[str, Any], RelationIndex]:
+    """설정 파일 하나를 파싱해서 collect() 결과 반환"""
+    return collect(iter_entries(config_file, use_mmap, compact, drop_empty))
@@ -0,0 +1,57 @@
+"""
+설정 관계 인덱스
+파싱하면서 엔트리 단위로 node→svrgroups, svrgroup→servers, server→services,
+node→gateways 관계를 채워서, 조회 헬퍼가 전체 섹션을 다시 훑지 않게 한다.
+"""
+
+from typing import Any, Dict, List, Mapping, Tuple
+
+# 이름당 하나만 남는 섹션 (같은 이름이 다시 나오면 이전 관계를 교체)
+# section -> (인덱스 속성명, 부모 이름이 들어 있는 KEY)
+_KEYED_LINKS = {
+    "svrgroup": ("svrgroups_by_node", "NODENAME"),
+    "service": ("services_by_server", "SVRNAME"),
+    "gateway": ("gateways_by_node", "NODENAME"),
+}
+
+
+class RelationIndex:
+    """엔트리 간 관계 인덱스 (section은 소문자 섹션명)"""
+    
+    def __init__(self):
+        self.svrgroups_by_node: Dict[str, List[str]] = {}
+        self.servers_by_svrgroup: Dict[str, List[Mapping[str, str]]] = {}
+        self.services_by_server: Dict[str, List[str]] = {}
+        self.gateways_by_node: Dict[str, List[str]] = {}
+        # (section, name) -> 현재 연결된 부모 이름 (중복 엔트리 교체용)
+        self._parents: Dict[Tuple[str, str], str] = {}
+    
+    def add(self, section: str, name: str, attrs: Mapping[str, str]):
+        """파싱된 엔트리 하나를 인덱스에 반영"""
+        if section == "server":
+            svg_name = attrs.get("SVGNAME", "").strip('"')
+            self.servers_by_svrgroup.setdefault(svg_name, []).append(attrs)
+            return
+        
+        link = _KEYED_LINKS.get(section)
+        if link is None:
+            return
+        index_name, parent_key = link
+        index = getattr(self, index_name)
+        parent = attrs.get(parent_key, "").strip('"')
+        
+        # 같은 이름의 이전 엔트리는 나중 것이 이기므로 이전 관계 제거
+        previous = self._parents.get((section, name))
+        if previous is not None:
+            index[previous].remove(name)
+        self._parents[(section, name)] = parent
+        index.setdefault(parent, []).append(name)
+    
+    def as_dict(self) -> Dict[str, Dict[str, List[Any]]]:
+        """pickle/캐시용 plain dict (중복 처리용 내부 상태 제외)"""
+        return {
+            "svrgroups_by_node": self.svrgroups_by_node,
+            "servers_by_svrgroup": self.servers_by_svrgroup,
+            "services_by_server": self.services_by_server,
+            "gateways_by_node": self.gateways_by_node,
+        }
@@ -0,0 +1,91 @@
+"""
+mmap 기반 tp_config 리더
+대용량 파일을 텍스트 모드로 줄마다 디코딩하지 않고, 원본 바이트에서
+섹션 헤더(*SECTION)와 엔트리 경계를 찾은 뒤 남길 KEY/VALUE 조각만 디코딩한다.
+"""
+
+import mmap
+import os
+from typing import Iterator, List, Optional, Tuple
+
+from .tokenizer import tokenize_bytes
+
+_COMMENT_PREFIXES = (b"#", b"//")
+
+
+def iter_mmap_entries(config_file: str) -> Iterator[Tuple[str, str, List[Tuple[str, str]]]]:
+    """
+    (section, name, pairs) 를 파일 순서대로 yield
+    - section: '*' 뒤의 섹션 문자열 (대소문자 그대로)
+    - name: 엔트리 이름 (들여쓰기 없는 줄의 첫 단어)
+    - pairs: tokenize()와 같은 (KEY, VALUE) 목록
+    텍스트 파서와 같은 규칙: 빈 줄/주석(#, //) 무시, 들여쓴 줄은 이전 엔트리에 이어짐
+    """
+    with open(config_file, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 앞에서부터 한 번만 읽으므로 커널에 순차 접근 힌트
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield from _scan(mm)
+
+
+def _scan(
+    mm: mmap.mmap,
+    start: int = 0,
+    stop: Optional[int] = None,
+    section: str = ""
+) -> Iterator[Tuple[str, str, List[Tuple[str, str]]]]:
+    """
+    mm[start:stop] 범위를 스캔 (start는 줄의 시작이어야 함)
+    section은 범위 시작 시점의 섹션 (샤드 파싱에서 앞 범위의 섹션을 이어받음)
+    """
+    size = len(mm) if stop is None else stop
+    find = mm.find
+    
+    entry_name = ""
+    entry_lines: List[bytes] = []
+    
+    pos = start
+    while pos < size:
+        end = find(b"\n", pos, size)
+        if end < 0:
+            end = size
+        line = mm[pos:end]
+        pos = end + 1
+        
+        stripped = line.strip()
+        indented = line[:1].isspace()
+        
+        # 비 ASCII 문자로 시작/끝나는 줄은 텍스트 경로와 같게 str 기준으로 공백 처리
+        # (예: NBSP는 bytes.strip()으로 제거되지 않음)
+        if stripped and (stripped[0] > 0x7f or stripped[-1] > 0x7f):
+            text = line.decode('utf-8', 'ignore')
+            stripped = text.strip().encode('utf-8')
+            indented = text[:1].isspace()
+        
+        # 섹션 헤더
+        if stripped[:1] == b"*":
+            if entry_name and entry_lines:
+                yield section, entry_name, tokenize_bytes(entry_lines)
+            section = stripped[1:].decode('utf-8', 'ignore')
+            entry_name = ""
+            entry_lines = []
+            continue
+        
+        # 빈 줄이나 주석 무시
+        if not stripped or stripped.startswith(_COMMENT_PREFIXES):
+            continue
+        
+        if not indented:
+            # 새 엔트리 시작 (들여쓰기 없음)
+            if entry_name and entry_lines:
+                yield section, entry_name, tokenize_bytes(entry_lines)
+            entry_name = stripped.split(None, 1)[0].decode('utf-8', 'ignore')
+            entry_lines = [stripped]
+        elif entry_name:
+            entry_lines.append(stripped)
+    
+    if entry_name and entry_lines:
+        yield section, entry_name, tokenize_bytes(entry_lines)
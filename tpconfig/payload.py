@@ -0,0 +1,102 @@
+"""
+미리 직렬화/압축한 JSON 응답 본문
+전체 설정처럼 큰 응답은 리로드 때 한 번만 JSON으로 직렬화하고 gzip/brotli 변형도 함께 만들어 두면,
+요청 시에는 Accept-Encoding에 맞는 바이트를 골라 그대로 보내기만 하면 된다.
+Flask(app.py)와 FastAPI(backend) 전체 설정 API가 함께 사용한다.
+orjson이 없으면 표준 json으로 직렬화하고, brotli가 없으면 br 변형은 만들지 않는다.
+"""
+
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson 없으면 표준 json 사용
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli 없으면 gzip/무압축만 제공
+    brotli = None
+
+# 압축 수준 (리로드마다 한 번 압축, 최고 수준은 대용량에서 리로드를 크게 늦추므로 중간 값)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Accept-Encoding 우선순위가 같으면 이 순서로 선택
+ENCODING_PREFERENCE = ("br", "gzip")
+
+
+def _default(obj: Any) -> Any:
+    """직렬화할 수 없는 값 처리 (compact 레코드는 dict로)"""
+    if hasattr(obj, "items"):
+        return dict(obj.items())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any, sort_keys: bool = False) -> bytes:
+    """공백 없는 UTF-8 JSON 바이트로 직렬화 (orjson 우선)"""
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(data, default=_default, option=option)
+    return json.dumps(
+        data, default=_default, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class PrebuiltPayload:
+    """직렬화된 본문과 인코딩별 압축 변형 ("identity", "gzip", "br")"""
+    
+    def __init__(self, body: bytes):
+        self.variants: Dict[str, bytes] = {"identity": body}
+        self.variants["gzip"] = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+        self.digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    
+    def select(self, accept_encoding: Optional[str]) -> Tuple[str, bytes]:
+        """Accept-Encoding에 맞는 (인코딩, 본문) 반환"""
+        encoding = choose_encoding(accept_encoding, self.variants)
+        return encoding, self.variants[encoding]
+    
+    def sizes(self) -> Dict[str, int]:
+        return {encoding: len(body) for encoding, body in self.variants.items()}
+
+
+def build_payload(data: Any, sort_keys: bool = False) -> PrebuiltPayload:
+    """응답 데이터를 직렬화하고 압축 변형까지 만들어 둠"""
+    return PrebuiltPayload(dumps(data, sort_keys=sort_keys))
+
+
+def choose_encoding(accept_encoding: Optional[str], available) -> str:
+    """
+    Accept-Encoding 헤더(q 값 포함)에서 제공 가능한 인코딩 선택
+    q=0은 거부로 처리하고, 맞는 것이 없으면 "identity"
+    """
+    if not accept_encoding:
+        return "identity"
+    
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if name:
+            weights[name] = weight
+    
+    best, best_weight = "identity", 0.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding not in available:
+            continue
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
@@ -0,0 +1,148 @@
+"""
+섹션별 compact 엔트리 레코드
+엔트리마다 dict를 두는 대신 __slots__ 레코드에 값을 담고,
+반복되는 문자열(NODENAME, SVGNAME, RESTART 등)은 sys.intern으로 공유한다.
+dict와 같은 get / [] / in / items() 를 제공하므로 기존 소비 코드가 그대로 동작한다.
+"""
+
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+_intern = sys.intern
+
+
+class Record:
+    """slot에 없는 속성은 _extra dict에 보관하는 레코드 기본 클래스"""
+    
+    __slots__ = ("_extra",)
+    _fields: FrozenSet[str] = frozenset()
+    
+    def __init__(self, items: Iterable[Tuple[str, str]]):
+        extra = None
+        fields = self._fields
+        for key, value in items:
+            if key in fields:
+                setattr(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._fields:
+            return getattr(self, key, default)
+        if self._extra:
+            return self._extra.get(key, default)
+        return default
+    
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def items(self) -> Iterator[Tuple[str, str]]:
+        for key in self.__slots__:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                yield key, value
+        if self._extra:
+            yield from self._extra.items()
+    
+    def keys(self) -> Iterator[str]:
+        return (key for key, _value in self.items())
+    
+    def to_dict(self) -> Dict[str, str]:
+        return dict(self.items())
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Record, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        # dict와 같은 형태로 표시 (DB attributes 컬럼에 str()로 저장됨)
+        return repr(self.to_dict())
+    
+    def __getstate__(self):
+        return tuple(self.items())
+    
+    def __setstate__(self, state):
+        self.__init__(state)
+
+
+_MISSING = object()
+
+
+class DomainRecord(Record):
+    __slots__ = (
+        "name", "DOMAINID", "SHMKEY", "TPORTNO", "RACPORT", "MAXUSER", "MAXNODE",
+        "MAXSVG", "MAXSVR", "MAXSVC", "MAXGW", "MAXSESSION", "SECURITY", "LOGLVL",
+    )
+    _fields = frozenset(__slots__)
+
+
+class NodeRecord(Record):
+    __slots__ = (
+        "name", "HOSTNAME", "TmaxPort", "MAXSVR", "MAXUSER", "TMAXHOME", "TMAXDIR",
+        "APPDIR",
+    )
+    _fields = frozenset(__slots__)
+
+
+class SvrGroupRecord(Record):
+    __slots__ = ("name", "NODENAME", "BACKUP", "COUSIN", "RESTART", "AUTOBACKUP")
+    _fields = frozenset(__slots__)
+
+
+class ServerRecord(Record):
+    __slots__ = (
+        "name", "SVGNAME", "NODENAME", "MIN", "MAX", "RESTART", "MAXQCOUNT",
+        "ASQCOUNT", "CLOPT",
+    )
+    _fields = frozenset(__slots__)
+
+
+class ServiceRecord(Record):
+    __slots__ = ("name", "SVRNAME", "SVCTIME", "AUTOTRAN", "EXPORT")
+    _fields = frozenset(__slots__)
+
+
+class GatewayRecord(Record):
+    __slots__ = (
+        "name", "NODENAME", "PORTNO", "RGWADDR", "RGWPORTNO", "DIRECTION", "GWTYPE",
+        "BACKUPIP", "BACKUPPORT", "BACKUP_RGWADDR", "BACKUP_RGWPORTNO", "CPC",
+        "RESTART", "CLOPT",
+    )
+    _fields = frozenset(__slots__)
+
+
+# 소문자 섹션명 -> 레코드 클래스
+RECORD_TYPES = {
+    "domain": DomainRecord,
+    "node": NodeRecord,
+    "svrgroup": SvrGroupRecord,
+    "server": ServerRecord,
+    "service": ServiceRecord,
+    "gateway": GatewayRecord,
+}
+
+
+def intern_pairs(pairs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
+    """KEY/VALUE 문자열을 sys.intern으로 공유"""
+    return ((_intern(key), _intern(value)) for key, value in pairs)
+
+
+def make_record(section: str, items: Iterable[Tuple[str, str]]) -> Optional[Record]:
+    """
+    섹션에 맞는 compact 레코드 생성 (문자열은 intern)
+    - section: 소문자 섹션명, 알 수 없는 섹션이면 None
+    """
+    record_type = RECORD_TYPES.get(section)
+    if record_type is None:
+        return None
+    return record_type(intern_pairs(items))
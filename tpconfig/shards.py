@@ -0,0 +1,115 @@
+"""
+단일 대용량 tp_config 샤드 병렬 파싱
+SERVICE 섹션 하나가 파일 대부분을 차지하는 경우 파일 단위 병렬화가 소용없으므로,
+*SECTION 헤더 오프셋을 미리 스캔하고 파일을 엔트리 경계에서 바이트 범위(샤드)로
+나눠 워커 프로세스에서 동시에 파싱한 뒤, 원래 순서대로 이어 붙인다.
+"""
+
+import bisect
+import itertools
+import mmap
+import os
+import re
+from concurrent.futures import Executor
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from .core import collect, compact_entries, normalize_entries, parse_config
+from .indexes import RelationIndex
+from .mmap_reader import _scan
+
+# *SECTION 헤더 줄 (앞 공백 허용, mmap 리더와 같은 규칙)
+_SECTION_RE = re.compile(rb'(?m)^[ \t\r\f\v]*\*([^\n]*)')
+
+# 엔트리 시작 줄 (들여쓰기/빈 줄/주석/섹션 헤더가 아닌 줄) - 샤드 경계 후보
+_ENTRY_START_RE = re.compile(rb'\n(?=[A-Za-z0-9_])')
+
+# 이보다 작은 샤드로는 나누지 않음 (작으면 프로세스 간 전달 비용이 더 큼)
+MIN_SHARD_BYTES = 1024 * 1024
+
+
+class Shard(NamedTuple):
+    """파일의 [start, stop) 바이트 범위, section은 start 시점의 섹션 (원문)"""
+    section: str
+    start: int
+    stop: int
+
+
+def scan_sections(mm: mmap.mmap) -> List[Tuple[int, str]]:
+    """*SECTION 헤더 줄의 (바이트 오프셋, 섹션 문자열) 목록"""
+    return [
+        (match.start(), match.group(1).decode('utf-8', 'ignore'))
+        for match in _SECTION_RE.finditer(mm)
+    ]
+
+
+def plan_shards(config_file: str, shards: int, min_shard_bytes: int = MIN_SHARD_BYTES) -> List[Shard]:
+    """
+    파일을 최대 shards개의 샤드로 분할
+    경계는 목표 크기 지점 이후 첫 엔트리 시작 줄이므로 엔트리가 둘로 나뉘지 않고,
+    큰 섹션은 여러 샤드로, 작은 섹션들은 한 샤드로 묶인다.
+    """
+    size = os.path.getsize(config_file)
+    if size == 0:
+        return []
+    
+    target = max(min_shard_bytes, -(-size // max(shards, 1)))
+    
+    with open(config_file, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            headers = scan_sections(mm)
+            
+            boundaries = [0]
+            pos = target
+            while pos < size:
+                match = _ENTRY_START_RE.search(mm, pos - 1)
+                if match is None:
+                    break
+                boundaries.append(match.start() + 1)
+                pos = boundaries[-1] + target
+    
+    boundaries.append(size)
+    header_offsets = [offset for offset, _ in headers]
+    
+    plan = []
+    for start, stop in zip(boundaries, boundaries[1:]):
+        # 샤드 시작 이전의 마지막 섹션 헤더가 이 샤드의 시작 섹션
+        i = bisect.bisect_right(header_offsets, start) - 1
+        section = headers[i][1] if i >= 0 else ""
+        plan.append(Shard(section, start, stop))
+    return plan
+
+
+def parse_shard(config_file: str, shard: Shard, drop_empty: bool = False) -> List[Tuple[str, str, Dict[str, str]]]:
+    """샤드 하나 파싱 (프로세스 풀 작업 단위, normalize_entries 결과 목록 반환)"""
+    with open(config_file, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            raw_entries = _scan(mm, shard.start, shard.stop, shard.section)
+            return list(normalize_entries(raw_entries, drop_empty))
+
+
+def parse_config_sharded(
+    config_file: str,
+    executor: Executor,
+    shards: int,
+    compact: bool = False,
+    drop_empty: bool = False
+) -> Tuple[Dict[str, Any], RelationIndex]:
+    """
+    파일 하나를 샤드로 나눠 executor에서 병렬 파싱 (결과는 parse_config와 동일)
+    compact 레코드는 문자열 intern이 프로세스마다 따로라서 부모에서 만든다.
+    """
+    plan = plan_shards(config_file, shards)
+    if len(plan) <= 1:
+        return parse_config(config_file, use_mmap=True, compact=compact, drop_empty=drop_empty)
+    
+    # executor.map은 입력 순서대로 결과를 돌려주므로 그대로 이어 붙이면 파일 순서
+    results = executor.map(
+        parse_shard,
+        itertools.repeat(config_file),
+        plan,
+        itertools.repeat(drop_empty)
+    )
+    entries = itertools.chain.from_iterable(results)
+    if compact:
+        entries = compact_entries(entries)
+    return collect(entries)
@@ -0,0 +1,69 @@
+"""
+tp_config KEY = VALUE 토크나이저
+엔트리 줄들을 미리 컴파일된 패턴 하나로 훑어서 (KEY, VALUE) 쌍을 뽑아낸다.
+따옴표 안의 쉼표는 값의 일부로 취급한다.
+"""
+
+import re
+from typing import List, Sequence, Tuple
+
+# KEY = VALUE 한 쌍
+# - 값이 따옴표로 시작하면 같은 따옴표 전까지가 값 (쉼표 포함, 따옴표 제외, \" 같은 이스케이프는 값의 일부)
+# - 아니면 쉼표 전까지가 값 (앞뒤 공백 제외, 값 안의 = 는 값의 일부 - ENV = A=B)
+# 그룹이 (KEY, VALUE) 두 개뿐이라 findall 결과를 그대로 dict에 넣을 수 있다
+_PAIR_RE = re.compile(r'''
+    (?<!\w)(\w+) [ \t]* = [ \t]*
+    ["']?
+    (
+        (?<=") (?:[^"\\]|\\.)*
+      | (?<=') (?:[^'\\]|\\.)*
+      | (?<!["']) (?:[^\s,](?:[^,]*[^\s,])?)?
+    )
+''', re.VERBOSE)
+
+# mmap 경로용 bytes 패턴 (같은 규칙, 매치된 조각만 디코딩)
+_PAIR_BYTES_RE = re.compile(_PAIR_RE.pattern.encode('ascii'), re.VERBOSE)
+
+
+def _open_quote(line, quote, escaped) -> bool:
+    """줄 안에 닫히지 않은 따옴표가 있는지 (이스케이프된 따옴표는 세지 않음)"""
+    return (line.count(quote) - line.count(escaped)) & 1 == 1
+
+
+def tokenize(lines: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    엔트리 줄들에서 (KEY, VALUE) 쌍 목록 반환
+    - lines: 앞뒤 공백이 제거된 엔트리 줄들 (첫 줄은 엔트리 이름 포함)
+    - VALUE는 따옴표가 제거된 값이며 빈 문자열일 수 있음
+    줄 단위로 스캔하고, 값이 다음 줄로 이어지는 경우(닫히지 않은 따옴표,
+    줄 끝의 "KEY =")에만 남은 줄들을 이어 붙여 스캔한다.
+    """
+    findall = _PAIR_RE.findall
+    pairs = []
+    for i, line in enumerate(lines):
+        if line[-1:] == "=" or _open_quote(line, '"', '\\"') or _open_quote(line, "'", "\\'"):
+            pairs += findall(" ".join(lines[i:]))
+            break
+        if len(lines) == 1:
+            # 한 줄짜리 엔트리 (대부분의 SERVICE)
+            return findall(line)
+        pairs += findall(line)
+    return pairs
+
+
+def tokenize_bytes(lines: Sequence[bytes]) -> List[Tuple[str, str]]:
+    """
+    tokenize()의 bytes 버전
+    원본 바이트 줄을 그대로 스캔하고, 매치된 KEY/VALUE 조각만 디코딩한다.
+    """
+    findall = _PAIR_BYTES_RE.findall
+    raw_pairs = []
+    for i, line in enumerate(lines):
+        if line[-1:] == b"=" or _open_quote(line, b'"', b'\\"') or _open_quote(line, b"'", b"\\'"):
+            raw_pairs += findall(b" ".join(lines[i:]))
+            break
+        raw_pairs += findall(line)
+    return [
+        (key.decode('ascii'), value.decode('utf-8', 'ignore'))
+        for key, value in raw_pairs
+    ]
@@ -4,17 +4,22 @@ Tmax Configuration Parser
 tp_config 파일을 파싱하여 JSON 형식으로 변환하는 모듈
 """
 
-import re
 import json
-from typing import Dict, List, Any
+from typing import Dict, Any
 from collections import defaultdict
 
+from tpconfig.core import parse_config
+from tpconfig.indexes import RelationIndex
+
 
 class TpConfigParser:
     """Tmax tp_config 파일 파서"""
     
-    def __init__(self, config_file: str):
+    def __init__(self, config_file: str, use_mmap: bool = False, compact: bool = False):
         self.config_file = config_file
+        self.use_mmap = use_mmap
+        # compact: 엔트리를 dict 대신 __slots__ 레코드(문자열 intern)로 저장
+        self.compact = compact
         self.config_data = {
             'DOMAIN': {},
             'NODE': {},
@@ -23,101 +28,25 @@ class TpConfigParser:
             'SERVICE': {},
             'GATEWAY': {}
         }
+        # 파싱하면서 채우는 관계 인덱스 (노드/서버그룹 조회용)
+        self.indexes = RelationIndex()
         
     def parse(self) -> Dict[str, Any]:
-        """설정 파일 전체를 파싱"""
-        current_section = None
-        current_entry_name = None
-        current_entry_lines = []
+        """설정 파일 전체를 파싱 (공용 코어 결과를 대문자 섹션 키로 변환)"""
+        sections, self.indexes = parse_config(
+            self.config_file,
+            use_mmap=self.use_mmap,
+            compact=self.compact
+        )
         
-        with open(self.config_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                stripped = line.strip()
-                
-                # 섹션 헤더 감지 (*로 시작)
-                if stripped.startswith('*'):
-                    # 이전 엔트리 저장
-                    if current_entry_name and current_entry_lines:
-                        self._save_entry(current_section, current_entry_name, current_entry_lines)
-                    
-                    current_section = stripped[1:].strip()
-                    current_entry_name = None
-                    current_entry_lines = []
-                    continue
-                
-                # 빈 줄이나 주석 무시
-                if not stripped or stripped.startswith('#') or stripped.startswith('//'):
-                    continue
-                
-                # 새로운 엔트리인지 확인 (탭으로 시작하지 않음)
-                if not line.startswith('\t') and not line.startswith(' ' * 4) and line[0] not in ' \t':
-                    # 이전 엔트리 저장
-                    if current_entry_name and current_entry_lines:
-                        self._save_entry(current_section, current_entry_name, current_entry_lines)
-                    
-                    # 새 엔트리 시작 - 첫 단어가 엔트리 이름
-                    parts = stripped.split(maxsplit=1)
-                    if parts:
-                        current_entry_name = parts[0]
-                        current_entry_lines = [stripped]
-                else:
-                    # 현재 엔트리에 줄 추가 (들여쓰기된 줄)
-                    if current_entry_name:
-                        current_entry_lines.append(stripped)
-            
-            # 마지막 엔트리 저장
-            if current_entry_name and current_entry_lines:
-                self._save_entry(current_section, current_entry_name, current_entry_lines)
+        for section, entries in sections.items():
+            if section == 'server':
+                # SERVER는 같은 이름이 여러 노드에 있을 수 있음
+                entries = defaultdict(list, entries)
+            self.config_data[section.upper()] = entries
         
         return self.config_data
     
-    def _save_entry(self, section: str, name: str, lines: List[str]):
-        """엔트리를 파싱하고 저장"""
-        if not section or not name:
-            return
-        
-        # 모든 줄을 하나로 합치기
-        full_text = ' '.join(line.strip() for line in lines)
-        
-        # 키-값 쌍 파싱
-        attrs = {}
-        
-        # 이름 추출 (첫 번째 단어)
-        name_match = re.match(r'^(\S+)', full_text)
-        if name_match:
-            entry_name = name_match.group(1)
-            attrs['name'] = entry_name
-        else:
-            return
-        
-        # 속성 파싱 (KEY = VALUE 패턴)
-        # 쉼표로 구분되고, = 로 키-값이 나뉨
-        pattern = r'(\w+)\s*=\s*([^,]+?)(?=\s*,\s*\w+\s*=|\s*$)'
-        matches = re.findall(pattern, full_text)
-        
-        for key, value in matches:
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            attrs[key] = value
-        
-        # 데이터 저장 - 섹션 타입에 따라
-        if section == 'DOMAIN':
-            # DOMAIN은 하나만 있음
-            if not self.config_data['DOMAIN']:
-                self.config_data['DOMAIN'] = attrs
-        elif section == 'NODE':
-            # NODE는 이름으로 구분
-            self.config_data['NODE'][entry_name] = attrs
-        elif section == 'SVRGROUP':
-            self.config_data['SVRGROUP'][entry_name] = attrs
-        elif section == 'SERVER':
-            # SERVER는 같은 이름이 여러 노드에 있을 수 있음
-            self.config_data['SERVER'][entry_name].append(attrs)
-        elif section == 'SERVICE':
-            self.config_data['SERVICE'][entry_name] = attrs
-        elif section == 'GATEWAY':
-            self.config_data['GATEWAY'][entry_name] = attrs
-    
     def get_summary(self) -> Dict[str, Any]:
         """설정 요약 정보 반환"""
         domain_name = self.config_data['DOMAIN'].get('name', 'N/A')
@@ -137,11 +66,8 @@ class TpConfigParser:
         """특정 노드 정보 반환"""
         node_data = self.config_data['NODE'].get(node_name, {})
         
-        # 이 노드에 속한 서버 그룹 찾기
-        node_svgroups = []
-        for svg_name, svg_data in self.config_data['SVRGROUP'].items():
-            if svg_data.get('NODENAME', '').strip('"') == node_name:
-                node_svgroups.append(svg_name)
+        # 이 노드에 속한 서버 그룹 (파싱 시 만든 인덱스 사용)
+        node_svgroups = list(self.indexes.svrgroups_by_node.get(node_name, []))
         
         return {
             'node_name': node_name,
@@ -157,17 +83,15 @@ class TpConfigParser:
         """특정 서버 그룹 정보 반환"""
         svg_data = self.config_data['SVRGROUP'].get(svg_name, {})
         
-        # 이 서버 그룹에 속한 서버들 찾기
+        # 이 서버 그룹에 속한 서버들 (파싱 시 만든 인덱스 사용, 파일 순서)
         servers = []
-        for srv_name, srv_list in self.config_data['SERVER'].items():
-            for srv_data in srv_list:
-                if srv_data.get('SVGNAME', '').strip('"') == svg_name:
-                    servers.append({
-                        'name': srv_name,
-                        'min': srv_data.get('MIN', 'N/A'),
-                        'max': srv_data.get('MAX', 'N/A'),
-                        'restart': srv_data.get('RESTART', 'N/A')
-                    })
+        for srv_data in self.indexes.servers_by_svrgroup.get(svg_name, []):
+            servers.append({
+                'name': srv_data['name'],
+                'min': srv_data.get('MIN', 'N/A'),
+                'max': srv_data.get('MAX', 'N/A'),
+                'restart': srv_data.get('RESTART', 'N/A')
+            })
         
         return {
             'svg_name': svg_name,
@@ -181,14 +105,34 @@ class TpConfigParser:
 
 
 def main():
-    """테스트용 메인 함수"""
+    """
+    테스트용 메인 함수
+    --mmap: mmap 리더로 파싱
+    --verify: 텍스트 경로와 mmap 경로의 파싱 결과가 같은지 비교
+    """
     import sys
     
-    if len(sys.argv) < 2:
-        print("Usage: python tpconfig_parser.py <tp_config_file>")
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = {arg for arg in sys.argv[1:] if arg.startswith('--')}
+    
+    if len(args) < 1:
+        print("Usage: python tpconfig_parser.py [--mmap | --verify] <tp_config_file>")
         sys.exit(1)
     
-    parser = TpConfigParser(sys.argv[1])
+    if '--verify' in options:
+        text_data = TpConfigParser(args[0]).parse()
+        mmap_data = TpConfigParser(args[0], use_mmap=True).parse()
+        mismatched = [
+            section for section in text_data
+            if text_data[section] != mmap_data[section]
+        ]
+        if mismatched:
+            print(f"MISMATCH: {', '.join(mismatched)}")
+            sys.exit(1)
+        print("OK: text and mmap parsers produce identical output")
+        return
+    
+    parser = TpConfigParser(args[0], use_mmap='--mmap' in options)
     config_data = parser.parse()
     
     print("=== Tmax Configuration Summary ===")